@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Page-load benchmark for the Handshake employer search
+Loads the same employer-search pages with the default browser profile and
+with the fast profile (headless + resource blocking) and reports the
+page-load time and bytes transferred that blocking saves
+
+Usage:
+    # Log in once with a persistent profile, then benchmark
+    python scrape_handshake_final.py --profile-dir chrome_profile --pages 1
+    python benchmark_page_load.py --profile-dir chrome_profile --pages 10
+"""
+
+import argparse
+import json
+
+from scrape_handshake_final import HandshakeScraperFinal
+from scrape_metrics import ScrapeMetrics, percentile
+from scraper_utils import navigate, EMPLOYER_CARD_SELECTOR
+
+PROFILES = {
+    "default": dict(headless=False, block_resources=False),
+    "fast": dict(headless=True, block_resources=True),
+}
+
+# Navigation timing and total transferred bytes of the current page
+PERFORMANCE_JS = """
+var nav = performance.getEntriesByType('navigation')[0] || {};
+var bytes = nav.transferSize || 0;
+var resources = performance.getEntriesByType('resource');
+for (var i = 0; i < resources.length; i++) {
+    bytes += resources[i].transferSize || 0;
+}
+return {dom_content_loaded: nav.domContentLoadedEventEnd || 0,
+        load_event: nav.loadEventEnd || 0,
+        resources: resources.length,
+        bytes: bytes};
+"""
+
+
+def benchmark_profile(name, pages, profile_dir, pages_per_minute):
+    """Load `pages` employer-search pages with one profile; returns a summary dict"""
+    metrics = ScrapeMetrics()
+    scraper = HandshakeScraperFinal(pages_per_minute=pages_per_minute, metrics=metrics,
+                                    user_data_dir=profile_dir, **PROFILES[name])
+    timings = []
+    try:
+        if not scraper.is_logged_in():
+            raise RuntimeError(f"Profile {profile_dir} is not logged in")
+
+        for page_num in range(1, pages + 1):
+            url = f"{scraper.base_url}/employer-search?page={page_num}&per_page=25"
+            navigate(scraper.driver, url, EMPLOYER_CARD_SELECTOR, bucket=scraper.bucket, metrics=metrics)
+            timings.append(scraper.driver.execute_script(PERFORMANCE_JS))
+    finally:
+        scraper.close()
+
+    stages = metrics.summary()["stages"]
+    load_ms = [t["load_event"] for t in timings]
+    return {
+        "profile": name,
+        "pages": len(timings),
+        "navigate_p50_s": stages.get("navigate", {}).get("p50_s", 0.0),
+        "navigate_p95_s": stages.get("navigate", {}).get("p95_s", 0.0),
+        "cards_ready_p50_s": stages.get("wait_for_cards", {}).get("p50_s", 0.0),
+        "load_event_p50_ms": round(percentile(load_ms, 50), 1),
+        "load_event_p95_ms": round(percentile(load_ms, 95), 1),
+        "resources_per_page": round(sum(t["resources"] for t in timings) / max(len(timings), 1), 1),
+        "kb_per_page": round(sum(t["bytes"] for t in timings) / max(len(timings), 1) / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark employer-search page loads per browser profile")
+    parser.add_argument('--profile-dir', required=True, help="Logged-in persistent Chrome user-data-dir")
+    parser.add_argument('--pages', type=int, default=10, help="Pages to load per profile")
+    parser.add_argument('--pages-per-minute', type=int, default=30, help="Request rate cap")
+    parser.add_argument('--output', default="page_load_benchmark.json", help="Benchmark results JSON")
+    args = parser.parse_args()
+
+    # Profiles run one after the other: Chrome can't open the same user-data-dir twice
+    results = [benchmark_profile(name, args.pages, args.profile_dir, args.pages_per_minute)
+               for name in PROFILES]
+
+    print(f"\n{'Profile':<10}{'navigate p50':>14}{'p95':>8}{'cards p50':>11}{'load p50':>11}"
+          f"{'requests':>10}{'KB/page':>10}")
+    for r in results:
+        print(f"{r['profile']:<10}{r['navigate_p50_s']:>13.2f}s{r['navigate_p95_s']:>7.2f}s"
+              f"{r['cards_ready_p50_s']:>10.2f}s{r['load_event_p50_ms']:>9.0f}ms"
+              f"{r['resources_per_page']:>10.0f}{r['kb_per_page']:>10.0f}")
+
+    default, fast = results
+    if default["navigate_p50_s"] > 0:
+        saved = default["navigate_p50_s"] - fast["navigate_p50_s"]
+        print(f"\n✓ Fast profile saves {saved:.2f}s per page load "
+              f"({saved / default['navigate_p50_s']:.0%}), "
+              f"{default['kb_per_page'] - fast['kb_per_page']:.0f} KB per page")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"✓ Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
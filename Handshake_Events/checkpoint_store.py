@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Append-only checkpoint store for the Handshake scrapers
+Each finished page is appended to a JSONL file and recorded in a small
+manifest, so a crashed or interrupted scrape can resume from the first
+incomplete page without holding every employer in memory
+"""
+
+import json
+import os
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_PATH = "handshake_employers_checkpoint.jsonl"
+
+
+class CheckpointStore:
+    """JSONL page checkpoints plus a manifest of completed pages.
+
+    The manifest also records the byte offset of the JSONL file after the
+    last committed page. On resume the JSONL is truncated back to that offset,
+    so records from a page that was written but never committed (crash between
+    the append and the manifest update) are dropped and the page is re-scraped.
+    """
+
+    def __init__(self, path=DEFAULT_CHECKPOINT_PATH, manifest_path=None):
+        self.path = path
+        self.manifest_path = manifest_path or os.path.splitext(path)[0] + "_manifest.json"
+        self.completed_pages = set()
+        self.offset = 0
+        self.total_records = 0
+        self.lock = threading.Lock()
+        self._load_manifest()
+
+    def _load_manifest(self):
+        if not os.path.exists(self.manifest_path):
+            return
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        self.completed_pages = set(manifest.get("completed_pages", []))
+        self.offset = manifest.get("offset", 0)
+        self.total_records = manifest.get("total_records", 0)
+
+        # Drop anything appended after the last committed page
+        if os.path.exists(self.path) and os.path.getsize(self.path) > self.offset:
+            with open(self.path, 'r+b') as f:
+                f.truncate(self.offset)
+            logger.warning(f"Discarded uncommitted records after byte {self.offset} in {self.path}")
+
+    def _write_manifest(self):
+        manifest = {
+            "completed_pages": sorted(self.completed_pages),
+            "offset": self.offset,
+            "total_records": self.total_records,
+            "updated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, self.manifest_path)
+
+    def reset(self):
+        """Start a fresh scrape: remove the checkpoint file and manifest"""
+        with self.lock:
+            for path in (self.path, self.manifest_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            self.completed_pages = set()
+            self.offset = 0
+            self.total_records = 0
+
+    def is_complete(self, page_num):
+        return page_num in self.completed_pages
+
+    def pending_pages(self, start_page, end_page):
+        """Pages in [start_page, end_page] that have not been committed yet"""
+        return [p for p in range(start_page, end_page + 1) if p not in self.completed_pages]
+
+    def first_incomplete_page(self, start_page, end_page):
+        """First page in [start_page, end_page] still to scrape, or None if all are done"""
+        pending = self.pending_pages(start_page, end_page)
+        return pending[0] if pending else None
+
+    def append_page(self, page_num, employers):
+        """Append one page's employers and mark the page complete (thread-safe)"""
+        scraped_at = time.strftime("%Y-%m-%d %H:%M:%S")
+        lines = "".join(
+            json.dumps(dict(emp, page=page_num, scraped_at=scraped_at), ensure_ascii=False) + "\n"
+            for emp in employers
+        )
+        with self.lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+                self.offset = f.tell()
+            self.completed_pages.add(page_num)
+            self.total_records += len(employers)
+            self._write_manifest()
+
+    def iter_records(self):
+        """Stream committed records from the checkpoint file"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+    def export(self, filename="handshake_employers_data.json"):
+        """Write the final employers JSON {total_employers, scraped_at, employers} by streaming the checkpoint.
+
+        Parallel workers commit pages out of order, so only (page, byte offset)
+        pairs are collected and sorted; records are then read back one at a time.
+        """
+        positions = []
+        if os.path.exists(self.path):
+            with open(self.path, 'rb') as f:
+                offset = 0
+                for line in f:
+                    if line.strip():
+                        positions.append((json.loads(line).get("page", 0), offset))
+                    offset += len(line)
+            positions.sort()
+
+        tmp_path = filename + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as out, \
+                open(self.path if positions else os.devnull, 'rb') as f:
+            out.write('{\n')
+            out.write(f'  "total_employers": {len(positions)},\n')
+            out.write(f'  "scraped_at": {json.dumps(time.strftime("%Y-%m-%d %H:%M:%S"))},\n')
+            out.write('  "employers": [')
+            for i, (_, offset) in enumerate(positions):
+                f.seek(offset)
+                record = json.loads(f.readline())
+                record.pop("page", None)
+                out.write(",\n    " if i else "\n    ")
+                out.write(json.dumps(record, ensure_ascii=False))
+            out.write('\n  ]\n' if positions else ']\n')
+            out.write('}\n')
+        os.replace(tmp_path, filename)
+
+        logger.info(f"✓ Data saved to {filename}")
+        logger.info(f"  - Total employers: {len(positions)}")
+        return len(positions)
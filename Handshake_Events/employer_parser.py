@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Employer card parser shared by the live scraper and the offline parse stage
+Extracts name, link, industry, followers, location, size and type from saved
+employer-search HTML using selectolax or lxml when installed, with
+BeautifulSoup as the fallback
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+BASE_URL = "https://colorado.joinhandshake.com"
+
+CARD_SELECTOR = "div[data-test='employer-search-employer-card']"
+LINK_SELECTORS = ("a.sc-VJPgA", "a[href*='/e/']")
+NAME_SELECTORS = ("h3.sc-btuMWg", "h3")
+INFO_SELECTORS = ("p.sc-fQkmEp", "p")
+
+COMPANY_TYPES = ['private', 'public', 'non-profit', 'nonprofit', 'government', 'educational',
+                 'public company', 'private company']
+LOCATION_WORDS = ['remote', 'united states', 'usa', 'street', 'avenue', 'road', 'city', 'county']
+
+
+def split_industry_followers(info_text):
+    """Split the card info line ("Industry · X followers") into industry and followers"""
+    if '·' in info_text:
+        parts = info_text.split('·')
+        industry = parts[0].strip()
+        followers = parts[1].strip() if len(parts) > 1 else ""
+        return industry, followers
+    return info_text, ""
+
+
+def classify_metadata(metadata_texts):
+    """Classify the icon-labelled card texts into location, size and company type"""
+    location = ""
+    size = ""
+    company_type = ""
+
+    # Now classify each metadata text
+    for i, text in enumerate(metadata_texts):
+        logger.debug("Processing metadata %d: '%s'", i + 1, text)
+
+        # Location: Contains comma (e.g., "San Francisco, CA") OR common location words
+        if (',' in text or any(loc_word in text.lower() for loc_word in LOCATION_WORDS)) and not location:
+            location = text
+            logger.debug("  -> Identified as location: %s", location)
+        # Size: Contains dash or + with numbers (e.g., "250 - 1,000" or "25,000+")
+        elif (('-' in text or '+' in text) and any(char.isdigit() for char in text)) and not size:
+            size = text
+            logger.debug("  -> Identified as size: %s", size)
+        # Type: Text like "Private", "Public", "Non-Profit", etc.
+        elif not company_type and text.lower() in COMPANY_TYPES:
+            company_type = text
+            logger.debug("  -> Identified as type: %s", company_type)
+        # Fallback: if we haven't found location yet and this doesn't match other patterns
+        elif not location and not any(char.isdigit() for char in text) and '-' not in text and '+' not in text:
+            location = text
+            logger.debug("  -> Identified as location (fallback): %s", location)
+        # Fallback for type - any text without numbers that we haven't classified
+        elif not company_type and not any(char.isdigit() for char in text) and text not in [location, size]:
+            company_type = text
+            logger.debug("  -> Identified as type (fallback): %s", company_type)
+
+    return location, size, company_type
+
+
+def build_employer(link, name, info_text, metadata_texts, base_url=BASE_URL):
+    """Assemble an employer record from the raw card fields"""
+    if link and not link.startswith('http'):
+        link = base_url + link
+    industry, followers = split_industry_followers(info_text)
+    location, size, company_type = classify_metadata(metadata_texts)
+    return {
+        "name": name,
+        "link": link,
+        "industry": industry,
+        "followers": followers,
+        "location": location,
+        "size": size,
+        "type": company_type
+    }
+
+
+def _keep_metadata(text):
+    """Same filter as the in-browser extractor: non-empty, no industry separator, short"""
+    return text and '·' not in text and len(text) < 100
+
+
+# ---------------------------------------------------------------------------
+# Parser backends: each returns a list of (link, name, info_text, metadata_texts)
+# ---------------------------------------------------------------------------
+
+def _cards_selectolax(html):
+    from selectolax.lexbor import LexborHTMLParser
+
+    def first(card, selectors):
+        for selector in selectors:
+            node = card.css_first(selector)
+            if node is not None:
+                return node
+        return None
+
+    raw_cards = []
+    for card in LexborHTMLParser(html).css(CARD_SELECTOR):
+        link_node = first(card, LINK_SELECTORS)
+        name_node = first(card, NAME_SELECTORS)
+        info_node = first(card, INFO_SELECTORS)
+
+        metadata = []
+        for div in card.css('div'):
+            if not any(child.tag == 'svg' for child in div.iter()):
+                continue
+            # deep=False joins only the div's direct text nodes
+            text = div.text(deep=False).strip()
+            if _keep_metadata(text):
+                metadata.append(text)
+
+        raw_cards.append((
+            (link_node.attributes.get('href') or '') if link_node is not None else '',
+            name_node.text().strip() if name_node is not None else '',
+            info_node.text().strip() if info_node is not None else '',
+            metadata,
+        ))
+    return raw_cards
+
+
+def _cards_lxml(html):
+    import lxml.html
+
+    def has_class(cls):
+        return f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+
+    link_xpaths = (f".//a[{has_class('sc-VJPgA')}]", ".//a[contains(@href, '/e/')]")
+    name_xpaths = (f".//h3[{has_class('sc-btuMWg')}]", ".//h3")
+    info_xpaths = (f".//p[{has_class('sc-fQkmEp')}]", ".//p")
+
+    def first(card, xpaths):
+        for xpath in xpaths:
+            found = card.xpath(xpath)
+            if found:
+                return found[0]
+        return None
+
+    raw_cards = []
+    doc = lxml.html.fromstring(html)
+    for card in doc.xpath("//div[@data-test='employer-search-employer-card']"):
+        link_node = first(card, link_xpaths)
+        name_node = first(card, name_xpaths)
+        info_node = first(card, info_xpaths)
+
+        metadata = []
+        for div in card.iter('div'):
+            if not any(child.tag == 'svg' for child in div):
+                continue
+            # Direct text nodes: the div's own text plus the tail of each child
+            text = ((div.text or '') + ''.join(child.tail or '' for child in div)).strip()
+            if _keep_metadata(text):
+                metadata.append(text)
+
+        raw_cards.append((
+            link_node.get('href', '') if link_node is not None else '',
+            name_node.text_content().strip() if name_node is not None else '',
+            info_node.text_content().strip() if info_node is not None else '',
+            metadata,
+        ))
+    return raw_cards
+
+
+def _cards_bs4(html):
+    from bs4 import BeautifulSoup, Comment, NavigableString
+
+    def first(card, selectors):
+        for selector in selectors:
+            node = card.select_one(selector)
+            if node is not None:
+                return node
+        return None
+
+    raw_cards = []
+    soup = BeautifulSoup(html, 'html.parser')
+    for card in soup.select(CARD_SELECTOR):
+        link_node = first(card, LINK_SELECTORS)
+        name_node = first(card, NAME_SELECTORS)
+        info_node = first(card, INFO_SELECTORS)
+
+        metadata = []
+        for div in card.find_all('div'):
+            if div.find('svg', recursive=False) is None:
+                continue
+            text = ''.join(str(child) for child in div.children
+                           if isinstance(child, NavigableString) and not isinstance(child, Comment)).strip()
+            if _keep_metadata(text):
+                metadata.append(text)
+
+        raw_cards.append((
+            link_node.get('href', '') if link_node is not None else '',
+            name_node.get_text().strip() if name_node is not None else '',
+            info_node.get_text().strip() if info_node is not None else '',
+            metadata,
+        ))
+    return raw_cards
+
+
+PARSERS = {
+    'selectolax': ('selectolax.lexbor', _cards_selectolax),
+    'lxml': ('lxml.html', _cards_lxml),
+    'bs4': ('bs4', _cards_bs4),
+}
+
+
+def available_parsers():
+    """Names of the parser backends that can be imported, fastest first"""
+    available = []
+    for name, (module, _) in PARSERS.items():
+        try:
+            __import__(module)
+            available.append(name)
+        except ImportError:
+            pass
+    return available
+
+
+def resolve_parser(parser='auto'):
+    """Pick a parser backend: the requested one, or the fastest installed one for 'auto'"""
+    available = available_parsers()
+    if parser == 'auto':
+        if not available:
+            raise ImportError("No HTML parser installed - pip install selectolax, lxml or beautifulsoup4")
+        return available[0]
+    if parser not in available:
+        raise ImportError(f"HTML parser '{parser}' is not installed")
+    return parser
+
+
+def parse_employers_html(html, base_url=BASE_URL, parser='auto'):
+    """Extract employer records from one saved employer-search page"""
+    _, card_fn = PARSERS[resolve_parser(parser)]
+    return [build_employer(link, name, info, metadata, base_url)
+            for link, name, info, metadata in card_fn(html)]
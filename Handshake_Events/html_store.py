@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Content-addressed store for captured Handshake pages
+Raw page HTML is gzip-compressed and saved under its SHA-256 digest; an
+append-only index maps each page number to the digest, URL and capture time
+so the parse stage can re-extract employers offline
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+
+DEFAULT_STORE_DIR = "html_pages"
+
+
+class HtmlStore:
+    """gzip'd HTML objects under objects/<sha[:2]>/<sha[2:]>.html.gz plus index.jsonl.
+
+    Identical pages share one object, so re-capturing unchanged pages costs
+    no extra disk space. Each capture appends one index line (replayed on
+    load, last entry per page wins), so indexing a page doesn't rewrite the
+    whole index. Safe to share between scraper worker threads.
+    """
+
+    def __init__(self, root=DEFAULT_STORE_DIR):
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        self.index_path = os.path.join(root, "index.jsonl")
+        self.lock = threading.Lock()
+        self.index = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        entry = json.loads(line)
+                        self.index[str(entry.pop("page"))] = entry
+
+    def object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest[2:] + ".html.gz")
+
+    def put(self, page_num, url, html):
+        """Save a page's HTML (if not already stored) and point the page index at it"""
+        data = html.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.object_path(digest)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with gzip.open(tmp_path, 'wb', compresslevel=6) as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+        entry = {
+            "sha256": digest,
+            "url": url,
+            "captured_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "bytes": len(data),
+        }
+        with self.lock:
+            os.makedirs(self.root, exist_ok=True)
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({"page": page_num, **entry}) + "\n")
+            self.index[str(page_num)] = entry
+        return digest
+
+    def read(self, digest):
+        """Return the decompressed HTML for a digest"""
+        with gzip.open(self.object_path(digest), 'rb') as f:
+            return f.read().decode('utf-8')
+
+    def pages(self):
+        """(page_num, index entry) pairs in page order"""
+        return sorted(((int(page), entry) for page, entry in self.index.items()), key=lambda item: item[0])
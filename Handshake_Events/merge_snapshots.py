@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Merge and dedupe Handshake scraper snapshots
+Streams employers from any number of progress/final JSON snapshots and JSONL
+checkpoints, keeps the most recently scraped record per employer (keyed by the
+/e/<id> link) and writes one canonical output sorted by employer id
+
+Usage:
+    python merge_snapshots.py handshake_employers_data_progress_page*.json \\
+        handshake_employers_data.json handshake_employers_checkpoint.jsonl -o merged.json
+"""
+
+import argparse
+import heapq
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+
+EMPLOYER_ID_PATTERN = re.compile(r'/e/(\d+)')
+SCRAPED_AT_PATTERN = re.compile(r'"scraped_at"\s*:\s*"([^"]*)"')
+WHITESPACE_OR_COMMA = re.compile(r'[\s,]*')
+
+
+def employer_key(record):
+    """Sort/dedupe key: (0, numeric id) for /e/<id> links, (1, link or name) otherwise"""
+    link = record.get('link') or ''
+    match = EMPLOYER_ID_PATTERN.search(link)
+    if match:
+        return 0, int(match.group(1))
+    return 1, link or record.get('name', '')
+
+
+def _file_timestamp(path):
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(os.path.getmtime(path)))
+
+
+def iter_jsonl(path):
+    """Yield records from a JSONL checkpoint (each record carries its own scraped_at)"""
+    fallback = _file_timestamp(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                record = json.loads(line)
+                record.setdefault('scraped_at', fallback)
+                yield record
+
+
+def iter_json_snapshot(path, chunk_size=1 << 20):
+    """Yield employers from a {"scraped_at": ..., "employers": [...]} snapshot without loading it whole.
+
+    The file is read in chunks and each array element is decoded with raw_decode;
+    records inherit the snapshot's scraped_at (or the file mtime) unless they have their own.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buf = ''
+        # Read the header up to the opening bracket of the employers array
+        while True:
+            idx = buf.find('"employers"')
+            bracket = buf.find('[', idx) if idx != -1 else -1
+            if bracket != -1:
+                break
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            buf += chunk
+
+        match = SCRAPED_AT_PATTERN.search(buf, 0, idx)
+        snapshot_time = match.group(1) if match else _file_timestamp(path)
+
+        pos = bracket + 1
+        eof = False
+        while True:
+            pos = WHITESPACE_OR_COMMA.match(buf, pos).end()
+            if pos < len(buf) and buf[pos] == ']':
+                return
+            try:
+                if pos >= len(buf):
+                    raise ValueError("need more data")
+                record, pos = decoder.raw_decode(buf, pos)
+            except ValueError:
+                # Element is cut off at the chunk boundary - read more
+                if eof:
+                    raise ValueError(f"Truncated employers array in {path}")
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buf = buf[pos:] + chunk
+                pos = 0
+                continue
+            record.setdefault('scraped_at', snapshot_time)
+            yield record
+
+
+def iter_records(path):
+    if path.endswith('.jsonl'):
+        return iter_jsonl(path)
+    return iter_json_snapshot(path)
+
+
+def _write_run(entries, tmp_dir, run_paths):
+    entries.sort(key=lambda e: e[:4])
+    fd, run_path = tempfile.mkstemp(suffix='.jsonl', dir=tmp_dir)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        for entry in entries:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+    run_paths.append(run_path)
+
+
+def _read_run(run_path):
+    with open(run_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            kind, key, scraped_at, seq, record = json.loads(line)
+            yield kind, key, scraped_at, seq, record
+
+
+def merge_snapshots(input_paths, output_path, run_size=50000):
+    """External merge: sorted runs of (key, scraped_at, input order) then a heapq k-way merge.
+
+    Memory is bounded by run_size records regardless of how many or how large
+    the inputs are. For each employer the record with the latest scraped_at
+    wins; ties go to the input listed last. Returns (records read, records written).
+    """
+    tmp_dir = tempfile.mkdtemp(prefix='merge_snapshots_')
+    run_paths = []
+    read = 0
+    try:
+        entries = []
+        for path in input_paths:
+            for record in iter_records(path):
+                kind, key = employer_key(record)
+                entries.append((kind, key, record.get('scraped_at', ''), read, record))
+                read += 1
+                if len(entries) >= run_size:
+                    _write_run(entries, tmp_dir, run_paths)
+                    entries = []
+        if entries:
+            _write_run(entries, tmp_dir, run_paths)
+
+        merged = heapq.merge(*(_read_run(p) for p in run_paths), key=lambda e: e[:4])
+
+        # Entries for one employer are adjacent and in ascending (scraped_at, order),
+        # so the last entry of each group is the one to keep
+        written = 0
+        body_path = os.path.join(tmp_dir, 'employers.body')
+        with open(body_path, 'w', encoding='utf-8') as body:
+            current_key, current_record = None, None
+            for kind, key, _, _, record in merged:
+                if (kind, key) != current_key and current_record is not None:
+                    body.write((",\n    " if written else "\n    ") + json.dumps(current_record, ensure_ascii=False))
+                    written += 1
+                current_key, current_record = (kind, key), record
+            if current_record is not None:
+                body.write((",\n    " if written else "\n    ") + json.dumps(current_record, ensure_ascii=False))
+                written += 1
+
+        with open(output_path, 'w', encoding='utf-8') as out, open(body_path, 'r', encoding='utf-8') as body:
+            out.write('{\n')
+            out.write(f'  "total_employers": {written},\n')
+            out.write(f'  "scraped_at": {json.dumps(time.strftime("%Y-%m-%d %H:%M:%S"))},\n')
+            out.write('  "employers": [')
+            shutil.copyfileobj(body, out)
+            out.write('\n  ]\n' if written else ']\n')
+            out.write('}\n')
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return read, written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge and dedupe Handshake scraper snapshots")
+    parser.add_argument('inputs', nargs='+', help="Snapshot .json files and/or checkpoint .jsonl files")
+    parser.add_argument('-o', '--output', default="handshake_employers_merged.json", help="Merged output file")
+    parser.add_argument('--run-size', type=int, default=50000,
+                        help="Records held in memory per sorted run")
+    args = parser.parse_args()
+
+    read, written = merge_snapshots(args.inputs, args.output, run_size=args.run_size)
+    print(f"✓ Read {read} records from {len(args.inputs)} files")
+    print(f"✓ Wrote {written} unique employers to {args.output} ({read - written} duplicates dropped)")
+
+
+if __name__ == "__main__":
+    main()
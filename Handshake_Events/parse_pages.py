@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Offline parse stage for captured Handshake pages
+Re-extracts employers from the HTML store with a process pool - no browser,
+no network - and writes the same JSON layout as the live scraper
+
+Usage:
+    python parse_pages.py --store html_pages --output handshake_employers_data.json
+"""
+
+import argparse
+import gzip
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from employer_parser import BASE_URL, parse_employers_html, resolve_parser
+from html_store import HtmlStore, DEFAULT_STORE_DIR
+
+
+def parse_object(task):
+    """Worker: decompress one stored page and parse its employer cards"""
+    path, base_url, parser = task
+    with gzip.open(path, 'rb') as f:
+        html = f.read().decode('utf-8')
+    return [emp for emp in parse_employers_html(html, base_url, parser) if emp['name']]
+
+
+def parse_store(store, parser='auto', workers=None, base_url=BASE_URL):
+    """Parse every captured page; returns employers in page order"""
+    parser = resolve_parser(parser)
+    pages = store.pages()
+
+    # Identical pages share one object, so each digest is parsed only once
+    digests = sorted({entry["sha256"] for _, entry in pages})
+    tasks = [(store.object_path(digest), base_url, parser) for digest in digests]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parsed = dict(zip(digests, pool.map(parse_object, tasks, chunksize=8)))
+
+    employers = []
+    for _, entry in pages:
+        employers.extend(parsed[entry["sha256"]])
+    return employers, parser
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parse captured Handshake pages into employers JSON")
+    parser.add_argument('--store', default=DEFAULT_STORE_DIR, help="HTML store directory")
+    parser.add_argument('--output', default="handshake_employers_data.json", help="Output JSON file")
+    parser.add_argument('--parser', default='auto', choices=['auto', 'selectolax', 'lxml', 'bs4'],
+                        help="HTML parser backend (auto picks the fastest installed)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Parser processes")
+    parser.add_argument('--base-url', default=BASE_URL, help="Prefix for relative employer links")
+    args = parser.parse_args()
+
+    store = HtmlStore(args.store)
+    if not store.index:
+        print(f"❌ No captured pages in {args.store} - run the scraper with --capture-dir first")
+        return
+
+    start = time.perf_counter()
+    employers, backend = parse_store(store, parser=args.parser, workers=args.workers, base_url=args.base_url)
+    elapsed = time.perf_counter() - start
+
+    output_data = {
+        "total_employers": len(employers),
+        "scraped_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "employers": employers
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(output_data, f, indent=2, ensure_ascii=False)
+
+    print(f"✓ Parsed {len(store.index)} pages ({backend}, {args.workers} workers) in {elapsed:.2f}s")
+    print(f"✓ Saved {len(employers)} employers to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,8 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.chrome.options import Options
 import logging
 
+from scraper_utils import TokenBucket, navigate, wait_for_stable_count, EMPLOYER_CARD_SELECTOR
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -23,7 +25,7 @@ logger = logging.getLogger(__name__)
 
 
 class HandshakeScraper:
-    def __init__(self, headless=False):
+    def __init__(self, headless=False, pages_per_minute=30):
         """Initialize the scraper with Chrome driver"""
         chrome_options = Options()
         if headless:
@@ -37,6 +39,7 @@ class HandshakeScraper:
         self.wait = WebDriverWait(self.driver, 10)
         self.base_url = "https://colorado.joinhandshake.com"
         self.employers_data = []
+        self.bucket = TokenBucket(rate_per_minute=pages_per_minute)
 
     def extract_employer_info(self, employer_card):
         """Extract employer information from employer card element"""
@@ -159,8 +162,7 @@ class HandshakeScraper:
         """Navigate to employer page and scrape job postings"""
         try:
             logger.info(f"Scraping jobs from: {employer_link}")
-            self.driver.get(employer_link)
-            time.sleep(2)  # Wait for page load
+            navigate(self.driver, employer_link, bucket=self.bucket)
 
             # Look for the Jobs tab and click it
             try:
@@ -168,17 +170,12 @@ class HandshakeScraper:
                     EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Jobs')]"))
                 )
                 jobs_tab.click()
-                time.sleep(2)
             except TimeoutException:
                 logger.warning(f"Jobs tab not found for {employer_link}")
                 return []
 
-            # Wait for job cards to load
-            try:
-                self.wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.sc-jVQoqC"))
-                )
-            except TimeoutException:
+            # Wait for job cards to load and stop changing
+            if not wait_for_stable_count(self.driver, "div.sc-jVQoqC"):
                 logger.warning(f"No job cards found for {employer_link}")
                 return []
 
@@ -204,16 +201,12 @@ class HandshakeScraper:
         logger.info(f"Scraping page {page_num}: {url}")
 
         try:
-            self.driver.get(url)
-            time.sleep(3)  # Wait for dynamic content to load
-
-            # Wait for employer cards to load
-            self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div[data-test='employer-search-employer-card']"))
-            )
+            # Load the page and wait until the employer card count stops changing
+            if not navigate(self.driver, url, EMPLOYER_CARD_SELECTOR, bucket=self.bucket):
+                raise TimeoutException(f"No employer cards on page {page_num}")
 
             # Get all employer cards
-            employer_cards = self.driver.find_elements(By.CSS_SELECTOR, "div[data-test='employer-search-employer-card']")
+            employer_cards = self.driver.find_elements(By.CSS_SELECTOR, EMPLOYER_CARD_SELECTOR)
             logger.info(f"Found {len(employer_cards)} employers on page {page_num}")
 
             page_employers = []
@@ -228,8 +221,7 @@ class HandshakeScraper:
                     page_employers.append(employer_info)
 
                     # Go back to the employer search page
-                    self.driver.get(url)
-                    time.sleep(2)
+                    navigate(self.driver, url, EMPLOYER_CARD_SELECTOR, bucket=self.bucket)
 
             return page_employers
 
@@ -255,8 +247,8 @@ class HandshakeScraper:
         """Scrape all pages or a range of pages"""
         try:
             # Navigate to first page to get total pages
-            self.driver.get(f"{self.base_url}/employer-search?page=1&per_page=25")
-            time.sleep(3)
+            navigate(self.driver, f"{self.base_url}/employer-search?page=1&per_page=25",
+                     EMPLOYER_CARD_SELECTOR, bucket=self.bucket)
 
             total_pages = self.get_total_pages()
             logger.info(f"Total pages available: {total_pages}")
@@ -277,9 +269,6 @@ class HandshakeScraper:
                 page_employers = self.scrape_page(page_num)
                 self.employers_data.extend(page_employers)
 
-                # Add delay between pages to avoid rate limiting
-                time.sleep(2)
-
             logger.info(f"Scraping complete! Total employers: {len(self.employers_data)}")
 
         except Exception as e:
@@ -6,39 +6,121 @@ Efficiently scrapes all 400 pages (~10,000 employers) from Colorado Handshake
 Extracts: name, industry, followers, location, size, type, and link
 """
 
-import json
+import argparse
+import os
+import queue
+import threading
 import time
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import NoSuchElementException
 import logging
 
-# Set up logging
-logging.basicConfig(
-    level=logging.DEBUG,  # Changed to DEBUG to see debug messages
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+from scraper_utils import (TokenBucket, navigate, apply_session_cookies, build_chrome_options,
+                           enable_resource_blocking, EMPLOYER_CARD_SELECTOR)
+from checkpoint_store import CheckpointStore, DEFAULT_CHECKPOINT_PATH
+from employer_parser import split_industry_followers, classify_metadata, build_employer
+from html_store import HtmlStore
+from scrape_metrics import ScrapeMetrics, setup_logging, CARD_LOGGER_SUFFIX
+from selector_resolver import SelectorResolver
+
 logger = logging.getLogger(__name__)
+# Per-card messages are sampled by the queue log handler (see setup_logging)
+card_logger = logging.getLogger(__name__ + CARD_LOGGER_SUFFIX)
+
+
+# Extracts every employer card on the page in a single round trip, using the
+# link/name/info selectors chosen by the SelectorResolver (arguments[1]).
+# Returns plain objects for Python to classify plus how many cards each
+# selector missed, so a stale cached selector triggers a re-probe.
+PAGE_EXTRACT_JS = """
+var cards = document.querySelectorAll(arguments[0]);
+var selectors = arguments[1];
+var results = [];
+var missing = {link: 0, name: 0, info: 0};
+
+function textOf(el) {
+    if (!el) return '';
+    return (el.innerText || el.textContent || '').trim();
+}
+
+for (var c = 0; c < cards.length; c++) {
+    var card = cards[c];
+
+    var linkElem = card.querySelector(selectors.link);
+    var nameElem = card.querySelector(selectors.name);
+    var infoElem = card.querySelector(selectors.info);
+    if (!linkElem) missing.link++;
+    if (!nameElem) missing.name++;
+    if (!infoElem) missing.info++;
+
+    // Text nodes of divs that have an SVG icon as a direct child (location, size, type)
+    var metadata = [];
+    var allDivs = card.querySelectorAll('div');
+    for (var i = 0; i < allDivs.length; i++) {
+        var div = allDivs[i];
+        var hasSvg = false;
+        for (var j = 0; j < div.children.length; j++) {
+            if (div.children[j].tagName.toLowerCase() === 'svg') {
+                hasSvg = true;
+                break;
+            }
+        }
+        if (!hasSvg) continue;
+
+        var text = '';
+        for (var k = 0; k < div.childNodes.length; k++) {
+            if (div.childNodes[k].nodeType === 3) {
+                text += div.childNodes[k].textContent;
+            }
+        }
+        text = text.trim();
+        if (text && text.indexOf('·') === -1 && text.length < 100) {
+            metadata.push(text);
+        }
+    }
+
+    results.push({
+        link: linkElem ? (linkElem.getAttribute('href') || '') : '',
+        name: textOf(nameElem),
+        info: textOf(infoElem),
+        metadata: metadata
+    });
+}
+
+return {cards: results, missing: missing};
+"""
 
 
 class HandshakeScraperFinal:
-    def __init__(self, headless=False):
-        """Initialize the scraper with Chrome driver"""
-        chrome_options = Options()
-        if headless:
-            chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    def __init__(self, headless=False, bucket=None, pages_per_minute=30, html_store=None, metrics=None,
+                 block_resources=False, user_data_dir=None, selector_resolver=None):
+        """Initialize the scraper with Chrome driver.
+
+        block_resources skips images, media, fonts and third-party trackers
+        (only the card DOM is needed); user_data_dir reuses a persistent Chrome
+        profile so the login survives restarts.
+        """
+        chrome_options = build_chrome_options(headless=headless, block_resources=block_resources,
+                                              user_data_dir=user_data_dir)
 
         self.driver = webdriver.Chrome(options=chrome_options)
+        if block_resources:
+            enable_resource_blocking(self.driver)
         self.wait = WebDriverWait(self.driver, 15)
         self.base_url = "https://colorado.joinhandshake.com"
-        self.employers_data = []
+        self.headless = headless
+        self.block_resources = block_resources
+        self.user_data_dir = user_data_dir
+        # Request pacing (shared between workers when scraping in parallel)
+        self.bucket = bucket or TokenBucket(rate_per_minute=pages_per_minute)
+        # Optional capture stage: raw page HTML for offline re-parsing (parse_pages.py)
+        self.html_store = html_store
+        # Stage timings and page outcomes (shared between workers when scraping in parallel)
+        self.metrics = metrics or ScrapeMetrics()
+        # Which card selector fallback works (probed once, shared between workers)
+        self.selector_resolver = selector_resolver or SelectorResolver()
 
     def manual_login(self):
         """Open login page and wait for manual login"""
@@ -54,70 +136,46 @@ class HandshakeScraperFinal:
         logger.info("Continuing with scraping...")
         time.sleep(2)
 
+    def is_logged_in(self, timeout=10):
+        """True if the employer search loads cards (e.g. a persistent profile is still logged in)"""
+        url = f"{self.base_url}/employer-search?page=1&per_page=25"
+        return navigate(self.driver, url, EMPLOYER_CARD_SELECTOR, timeout=timeout, retries=0) > 0
+
+    def load_session_cookies(self, cookies):
+        """Reuse the session cookies from another (logged-in) browser"""
+        apply_session_cookies(self.driver, self.base_url, cookies)
+
+    def _find_in_card(self, employer_card, field):
+        """First element matching the field's candidates, cached winner first"""
+        for selector in self.selector_resolver.ordered(field):
+            try:
+                return employer_card.find_element(By.CSS_SELECTOR, selector)
+            except NoSuchElementException:
+                continue
+        return None
+
     def extract_employer_info_from_card(self, employer_card):
         """Extract employer info directly from the employer card element"""
         try:
-            # Extract employer link and all data
-            link = ""
-            try:
-                link_elem = employer_card.find_element(By.CSS_SELECTOR, "a.sc-VJPgA")
-                link = link_elem.get_attribute('href')
-                if link and not link.startswith('http'):
-                    link = self.base_url + link
-            except NoSuchElementException:
-                try:
-                    # Fallback: try any <a> tag with href
-                    link_elem = employer_card.find_element(By.CSS_SELECTOR, "a[href*='/e/']")
-                    link = link_elem.get_attribute('href')
-                    if link and not link.startswith('http'):
-                        link = self.base_url + link
-                except NoSuchElementException:
-                    pass
-
-            # Extract employer name - h3.sc-btuMWg
+            # Try the selector that last worked first, then the other candidates
+            link_elem = self._find_in_card(employer_card, "link")
+            link = link_elem.get_attribute('href') if link_elem else ""
+            if link and not link.startswith('http'):
+                link = self.base_url + link
+
             name = ""
-            try:
-                name_elem = employer_card.find_element(By.CSS_SELECTOR, "h3.sc-btuMWg")
-                name = name_elem.text.strip()
+            name_elem = self._find_in_card(employer_card, "name")
+            if name_elem:
                 # If text is empty, try getting textContent attribute
-                if not name:
-                    name = name_elem.get_attribute('textContent').strip()
-            except NoSuchElementException:
-                # Fallback: try any h3
-                try:
-                    name_elem = employer_card.find_element(By.TAG_NAME, "h3")
-                    name = name_elem.text.strip() or name_elem.get_attribute('textContent').strip()
-                except NoSuchElementException:
-                    pass
+                name = name_elem.text.strip() or name_elem.get_attribute('textContent').strip()
 
-            # Extract industry and followers - p.sc-fQkmEp (format: "Industry · X followers")
+            # Industry and followers (format: "Industry · X followers")
             industry = ""
             followers = ""
-            try:
-                info_elem = employer_card.find_element(By.CSS_SELECTOR, "p.sc-fQkmEp")
-                info_text = info_elem.text.strip()
-                if not info_text:
-                    info_text = info_elem.get_attribute('textContent').strip()
-                # Format: "Industry · XXX followers"
-                if '·' in info_text:
-                    parts = info_text.split('·')
-                    industry = parts[0].strip()
-                    followers = parts[1].strip() if len(parts) > 1 else ""
-                else:
-                    industry = info_text
-            except NoSuchElementException:
-                # Fallback: try any p tag
-                try:
-                    info_elem = employer_card.find_element(By.TAG_NAME, "p")
-                    info_text = info_elem.text.strip() or info_elem.get_attribute('textContent').strip()
-                    if '·' in info_text:
-                        parts = info_text.split('·')
-                        industry = parts[0].strip()
-                        followers = parts[1].strip() if len(parts) > 1 else ""
-                    else:
-                        industry = info_text
-                except NoSuchElementException:
-                    pass
+            info_elem = self._find_in_card(employer_card, "info")
+            if info_elem:
+                info_text = info_elem.text.strip() or info_elem.get_attribute('textContent').strip()
+                industry, followers = split_industry_followers(info_text)
 
             # Extract location, size, and type using JavaScript
             # This is more reliable than Selenium's element finding methods
@@ -166,35 +224,12 @@ class HandshakeScraperFinal:
                 """
 
                 metadata_texts = self.driver.execute_script(js_script, employer_card)
-                logger.debug(f"Found {len(metadata_texts)} metadata fields via JavaScript")
+                card_logger.debug(f"Found {len(metadata_texts)} metadata fields via JavaScript")
 
                 for text in metadata_texts:
-                    logger.debug(f"Metadata text: '{text}'")
-
-                # Now classify each metadata text
-                for i, text in enumerate(metadata_texts):
-                    logger.debug(f"Processing metadata {i+1}: '{text}'")
-
-                    # Location: Contains comma (e.g., "San Francisco, CA") OR common location words
-                    if (',' in text or any(loc_word in text.lower() for loc_word in ['remote', 'united states', 'usa', 'street', 'avenue', 'road', 'city', 'county'])) and not location:
-                        location = text
-                        logger.debug(f"  -> Identified as location: {location}")
-                    # Size: Contains dash or + with numbers (e.g., "250 - 1,000" or "25,000+")
-                    elif (('-' in text or '+' in text) and any(char.isdigit() for char in text)) and not size:
-                        size = text
-                        logger.debug(f"  -> Identified as size: {size}")
-                    # Type: Text like "Private", "Public", "Non-Profit", etc.
-                    elif not company_type and text.lower() in ['private', 'public', 'non-profit', 'nonprofit', 'government', 'educational', 'public company', 'private company']:
-                        company_type = text
-                        logger.debug(f"  -> Identified as type: {company_type}")
-                    # Fallback: if we haven't found location yet and this doesn't match other patterns
-                    elif not location and not any(char.isdigit() for char in text) and '-' not in text and '+' not in text:
-                        location = text
-                        logger.debug(f"  -> Identified as location (fallback): {location}")
-                    # Fallback for type - any text without numbers that we haven't classified
-                    elif not company_type and not any(char.isdigit() for char in text) and text not in [location, size]:
-                        company_type = text
-                        logger.debug(f"  -> Identified as type (fallback): {company_type}")
+                    card_logger.debug(f"Metadata text: '{text}'")
+
+                location, size, company_type = classify_metadata(metadata_texts)
 
             except Exception as e:
                 logger.error(f"Error extracting location/size/type: {e}")
@@ -212,12 +247,12 @@ class HandshakeScraperFinal:
             }
 
             if name:
-                logger.info(f"  ✓ Extracted: {name}")
+                card_logger.info(f"  ✓ Extracted: {name}")
             else:
                 logger.warning(f"  ✗ No name found! Link: {link}")
                 # Debug: print card HTML snippet
                 card_html = employer_card.get_attribute('outerHTML')
-                logger.debug(f"Card HTML (first 500 chars): {card_html[:500]}")
+                card_logger.debug(f"Card HTML (first 500 chars): {card_html[:500]}")
 
             return employer_info
 
@@ -225,85 +260,131 @@ class HandshakeScraperFinal:
             logger.error(f"Error extracting employer info from card: {e}")
             return None
 
+    def extract_page_employers(self):
+        """Extract all employer cards on the current page with one execute_script call"""
+        selectors = self.selector_resolver.resolve(self.driver)
+        result = self.driver.execute_script(PAGE_EXTRACT_JS, EMPLOYER_CARD_SELECTOR, selectors) or {}
+
+        if any(result.get('missing', {}).values()):
+            # A cached selector missed some cards - re-probe and retry once if the winners changed
+            reprobed = self.selector_resolver.resolve(self.driver, force=True)
+            if reprobed != selectors:
+                result = self.driver.execute_script(PAGE_EXTRACT_JS, EMPLOYER_CARD_SELECTOR, reprobed) or {}
+        raw_cards = result.get('cards', [])
+
+        page_employers = []
+        for i, raw in enumerate(raw_cards, 1):
+            employer_info = build_employer(raw.get('link', ''), raw.get('name', ''), raw.get('info', ''),
+                                           raw.get('metadata', []), self.base_url)
+
+            if employer_info['name']:
+                card_logger.info(f"  [{i}/{len(raw_cards)}] ✓ Extracted: {employer_info['name']}")
+                page_employers.append(employer_info)
+            else:
+                logger.warning(f"  [{i}/{len(raw_cards)}] ✗ No name found! Link: {employer_info['link']}")
+
+        return page_employers
 
     def scrape_page(self, page_num):
         """Scrape a single page of employers"""
         url = f"{self.base_url}/employer-search?page={page_num}&per_page=25"
-        logger.info(f"\n{'='*60}")
         logger.info(f"Scraping page {page_num}")
-        logger.info(f"{'='*60}")
+        page_start = time.perf_counter()
 
         try:
-            self.driver.get(url)
-            time.sleep(3)
-
-            # Wait for employer cards - div[data-test="employer-search-employer-card"]
-            try:
-                self.wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div[data-test='employer-search-employer-card']"))
-                )
-            except TimeoutException:
+            # Load the page and wait until the employer card count stops changing
+            if not navigate(self.driver, url, EMPLOYER_CARD_SELECTOR, bucket=self.bucket, metrics=self.metrics):
                 logger.error(f"Could not find any employer cards on page {page_num}")
+                self.metrics.page_empty(page_num)
                 return []
 
-            # Get all employer cards
-            employer_cards = self.driver.find_elements(By.CSS_SELECTOR, "div[data-test='employer-search-employer-card']")
-            logger.info(f"Found {len(employer_cards)} employer cards on page {page_num}")
-
-            if not employer_cards:
-                logger.error("No employer cards found!")
-                return []
-
-            page_employers = []
+            if self.html_store:
+                with self.metrics.span("save"):
+                    self.html_store.put(page_num, url, self.driver.page_source)
 
-            for i, card in enumerate(employer_cards, 1):
-                logger.info(f"[{i}/{len(employer_cards)}] Processing employer card...")
-
-                # Extract employer info from card
-                employer_info = self.extract_employer_info_from_card(card)
-
-                if employer_info and employer_info['name']:
-                    page_employers.append(employer_info)
+            # Extract every card in a single browser round trip
+            with self.metrics.span("extract"):
+                try:
+                    page_employers = self.extract_page_employers()
+                except Exception as e:
+                    logger.warning(f"Page-level extraction failed ({e}) - falling back to per-card extraction")
+                    page_employers = self.scrape_page_per_card()
 
-            logger.info(f"\n✓ Page {page_num} complete: {len(page_employers)} employers scraped")
+            if not page_employers:
+                self.metrics.page_empty(page_num)
+            self.metrics.page_done(page_num, len(page_employers), time.perf_counter() - page_start)
+            logger.info(f"✓ Page {page_num} complete: {len(page_employers)} employers scraped")
             return page_employers
 
         except Exception as e:
             logger.error(f"Error scraping page {page_num}: {e}")
+            self.metrics.page_error(page_num)
             return []
 
-    def scrape_all(self, start_page=1, end_page=None, max_pages=None):
-        """Scrape all pages or a range of pages"""
-        try:
-            # Navigate to first page
-            self.driver.get(f"{self.base_url}/employer-search?page=1&per_page=25")
-            time.sleep(5)
+    def scrape_page_per_card(self):
+        """Slower fallback: extract each card with individual element lookups"""
+        employer_cards = self.driver.find_elements(By.CSS_SELECTOR, EMPLOYER_CARD_SELECTOR)
+        logger.info(f"Found {len(employer_cards)} employer cards")
+
+        page_employers = []
+        for i, card in enumerate(employer_cards, 1):
+            card_logger.info(f"[{i}/{len(employer_cards)}] Processing employer card...")
+
+            # Extract employer info from card
+            employer_info = self.extract_employer_info_from_card(card)
+
+            if employer_info and employer_info['name']:
+                page_employers.append(employer_info)
 
+        return page_employers
+
+    def _open_checkpoint(self, checkpoint, resume):
+        """Open the checkpoint store; a non-resumed run starts from an empty checkpoint"""
+        store = checkpoint or CheckpointStore(DEFAULT_CHECKPOINT_PATH)
+        if resume:
+            logger.info(f"Resuming from {store.path}: {len(store.completed_pages)} pages, "
+                        f"{store.total_records} employers already saved")
+        else:
+            store.reset()
+        return store
+
+    def scrape_all(self, start_page=1, end_page=None, max_pages=None, checkpoint=None, resume=False,
+                   output_file="handshake_employers_data.json", metrics_file="handshake_scrape_metrics.json"):
+        """Scrape all pages or a range of pages.
+
+        Each finished page is appended to the checkpoint store right away; with
+        resume=True, pages already committed there are skipped. The final JSON
+        is exported from the checkpoint at the end (or on interruption), along
+        with the per-stage timing report in metrics_file.
+        """
+        store = self._open_checkpoint(checkpoint, resume)
+        page_num = start_page
+        try:
             # Determine pages to scrape
             if max_pages:
                 end_page = start_page + max_pages - 1
             elif end_page is None:
                 end_page = 400  # Default to all 400 pages
 
+            first_page = store.first_incomplete_page(start_page, end_page)
             logger.info(f"\n{'='*60}")
             logger.info(f"Starting scrape: Pages {start_page} to {end_page}")
+            if first_page is None:
+                logger.info("All pages already checkpointed - nothing to scrape")
+            elif first_page > start_page:
+                logger.info(f"Resuming at page {first_page}")
             logger.info(f"Expected total employers: ~{(end_page - start_page + 1) * 25}")
             logger.info(f"{'='*60}\n")
 
-            # Scrape each page
-            for page_num in range(start_page, end_page + 1):
+            # Scrape each page that isn't already in the checkpoint
+            for page_num in store.pending_pages(start_page, end_page):
                 try:
                     page_employers = self.scrape_page(page_num)
-                    self.employers_data.extend(page_employers)
-
-                    # Save progress every 10 pages
-                    if page_num % 10 == 0:
-                        self.save_data(f"handshake_employers_data_progress_page{page_num}.json")
-                        logger.info(f"\n💾 Progress saved at page {page_num}")
-
-                    # Add delay between pages to avoid rate limiting
-                    if page_num < end_page:
-                        time.sleep(2)  # Reduced delay since we're not visiting individual pages
+                    if page_employers:
+                        with self.metrics.span("save"):
+                            store.append_page(page_num, page_employers)
+                    else:
+                        logger.warning(f"Page {page_num} returned no employers - left for --resume")
 
                 except Exception as e:
                     logger.error(f"Error on page {page_num}: {e}")
@@ -311,35 +392,110 @@ class HandshakeScraperFinal:
                     continue
 
             logger.info(f"\n{'='*60}")
-            logger.info(f"SCRAPING COMPLETE!")
-            logger.info(f"Total employers scraped: {len(self.employers_data)}")
+            logger.info("SCRAPING COMPLETE!")
+            logger.info(f"Total employers scraped: {store.total_records}")
             logger.info(f"{'='*60}\n")
 
         except KeyboardInterrupt:
             logger.info(f"\n\n⚠️  Scraping interrupted by user at page {page_num}")
-            logger.info(f"Scraped {len(self.employers_data)} employers so far")
+            logger.info(f"Scraped {store.total_records} employers so far (run with --resume to continue)")
         except Exception as e:
             logger.error(f"Error during scraping: {e}")
         finally:
-            self.save_data()
-
-    def save_data(self, filename="handshake_employers_data.json"):
-        """Save scraped data to JSON file"""
-        try:
-            output_data = {
-                "total_employers": len(self.employers_data),
-                "scraped_at": time.strftime("%Y-%m-%d %H:%M:%S"),
-                "employers": self.employers_data
-            }
+            store.export(output_file)
+            self.write_metrics(metrics_file)
+
+    def write_metrics(self, metrics_file="handshake_scrape_metrics.json"):
+        """Write the throughput/timing summary to JSON and log the headline numbers"""
+        self.metrics.extra["selectors"] = self.selector_resolver.log_report(logger)
+        summary = self.metrics.write(metrics_file)
+        self.metrics.log_summary(logger, summary)
+        logger.info(f"📊 Metrics saved to {metrics_file}")
+
+    def scrape_all_parallel(self, start_page=1, end_page=None, max_pages=None,
+                            num_workers=4, max_pages_per_minute=30, checkpoint=None, resume=False,
+                            output_file="handshake_employers_data.json",
+                            metrics_file="handshake_scrape_metrics.json"):
+        """Scrape pages with a pool of browser workers sharing this session's login.
+
+        Each worker runs its own Chrome instance, loads the cookies from the
+        manual login and pulls page numbers from a shared queue. A global rate
+        token bucket caps the total request rate. Workers append finished pages
+        to the shared checkpoint store; the export merges them in page order.
+        """
+        if max_pages:
+            end_page = start_page + max_pages - 1
+        elif end_page is None:
+            end_page = 400
+
+        store = self._open_checkpoint(checkpoint, resume)
+        cookies = self.driver.get_cookies()
+        page_queue = queue.Queue()
+        for page_num in store.pending_pages(start_page, end_page):
+            page_queue.put(page_num)
+
+        bucket = TokenBucket(rate_per_minute=max_pages_per_minute, burst=num_workers)
+        stop_event = threading.Event()
+
+        def worker(worker_id):
+            scraper = None
+            try:
+                # Workers share the login through cookies - a Chrome profile dir can't be opened
+                # twice, so each worker keeps its own profile under the main one
+                user_data_dir = (os.path.join(self.user_data_dir, f"worker-{worker_id}")
+                                 if self.user_data_dir else None)
+                scraper = HandshakeScraperFinal(headless=self.headless, bucket=bucket,
+                                                html_store=self.html_store, metrics=self.metrics,
+                                                block_resources=self.block_resources,
+                                                user_data_dir=user_data_dir,
+                                                selector_resolver=self.selector_resolver)
+                scraper.load_session_cookies(cookies)
+                logger.info(f"Worker {worker_id} ready")
+
+                while not stop_event.is_set():
+                    try:
+                        page_num = page_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    page_employers = scraper.scrape_page(page_num)
+                    if page_employers:
+                        with self.metrics.span("save"):
+                            store.append_page(page_num, page_employers)
+            except Exception as e:
+                logger.error(f"Worker {worker_id} failed: {e}")
+            finally:
+                if scraper:
+                    scraper.close()
 
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, indent=2, ensure_ascii=False)
+        logger.info(f"\n{'='*60}")
+        logger.info(f"Starting parallel scrape: Pages {start_page} to {end_page}")
+        logger.info(f"Workers: {num_workers}, rate limit: {max_pages_per_minute} pages/min")
+        logger.info(f"{'='*60}\n")
 
-            logger.info(f"✓ Data saved to {filename}")
-            logger.info(f"  - Total employers: {output_data['total_employers']}")
+        threads = [threading.Thread(target=worker, args=(i + 1,), daemon=True) for i in range(num_workers)]
+        try:
+            for thread in threads:
+                thread.start()
+            # Join with a timeout so Ctrl+C is still delivered to the main thread
+            while any(thread.is_alive() for thread in threads):
+                for thread in threads:
+                    thread.join(timeout=1)
+        except KeyboardInterrupt:
+            logger.info("\n\n⚠️  Scraping interrupted by user - waiting for workers to stop")
+            stop_event.set()
+            for thread in threads:
+                thread.join()
+        finally:
+            missing = store.pending_pages(start_page, end_page)
+            if missing:
+                logger.warning(f"{len(missing)} pages not scraped (first: {missing[0]}) - run with --resume")
 
-        except Exception as e:
-            logger.error(f"Error saving data: {e}")
+            logger.info(f"\n{'='*60}")
+            logger.info("PARALLEL SCRAPING COMPLETE!")
+            logger.info(f"Total employers scraped: {store.total_records}")
+            logger.info(f"{'='*60}\n")
+            store.export(output_file)
+            self.write_metrics(metrics_file)
 
     def close(self):
         """Close the browser"""
@@ -348,40 +504,99 @@ class HandshakeScraperFinal:
 
 def main():
     """Main function to run the scraper"""
-    scraper = HandshakeScraperFinal(headless=False)
+    parser = argparse.ArgumentParser(description="Scrape the Handshake employer search")
+    parser.add_argument('--pages', type=int, default=None,
+                        help="Number of pages to scrape (prompted if omitted)")
+    parser.add_argument('--start-page', type=int, default=1, help="First page to scrape")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Number of browser workers (prompted if omitted)")
+    parser.add_argument('--resume', action='store_true',
+                        help="Continue from the checkpoint, skipping pages already saved")
+    parser.add_argument('--checkpoint', default=DEFAULT_CHECKPOINT_PATH,
+                        help="Append-only JSONL checkpoint file")
+    parser.add_argument('--output', default="handshake_employers_data.json",
+                        help="Final employers JSON file")
+    parser.add_argument('--capture-dir', default=None,
+                        help="Also save each page's raw HTML here for parse_pages.py")
+    parser.add_argument('--fast', action='store_true',
+                        help="Headless Chrome that skips images, media, fonts and trackers")
+    parser.add_argument('--profile-dir', default=None,
+                        help="Persistent Chrome profile, so the login survives restarts")
+    parser.add_argument('--metrics', default="handshake_scrape_metrics.json",
+                        help="Per-stage timing report written at the end of the run")
+    parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING'], default='INFO',
+                        help="Console log level")
+    parser.add_argument('--card-log-every', type=int, default=25,
+                        help="Log 1 in N per-card messages")
+    args = parser.parse_args()
+
+    setup_logging(level=getattr(logging, args.log_level), card_sample_every=args.card_log_every)
+
+    checkpoint = CheckpointStore(args.checkpoint)
+
+    html_store = HtmlStore(args.capture_dir) if args.capture_dir else None
+    scraper = HandshakeScraperFinal(headless=args.fast, html_store=html_store, block_resources=args.fast,
+                                    user_data_dir=args.profile_dir)
 
     try:
-        # Prompt for manual login
-        scraper.manual_login()
-
-        # Ask user how many pages to scrape
-        logger.info("\n" + "="*60)
-        logger.info("SCRAPING OPTIONS")
-        logger.info("="*60)
-        logger.info("Total pages available: 400")
-        logger.info("Each page has ~25 employers (~10,000 total)")
-        logger.info("To scrape ALL 400 pages, just press Enter")
-        logger.info("Or enter a specific number of pages to scrape")
-        logger.info("For testing, enter '1' to scrape just the first page")
-        logger.info("="*60 + "\n")
-
-        user_input = input("How many pages to scrape? (default: 400 - all pages): ").strip()
-
-        if user_input:
+        if args.profile_dir and scraper.is_logged_in():
+            logger.info("✓ Chrome profile is still logged in - skipping manual login")
+        elif args.fast:
+            logger.error("Not logged in, and --fast runs headless - log in once with --profile-dir "
+                         "and without --fast first")
+            return
+        else:
+            # Prompt for manual login
+            scraper.manual_login()
+
+        max_pages = args.pages
+        if max_pages is None:
+            # Ask user how many pages to scrape
+            logger.info("\n" + "="*60)
+            logger.info("SCRAPING OPTIONS")
+            logger.info("="*60)
+            logger.info("Total pages available: 400")
+            logger.info("Each page has ~25 employers (~10,000 total)")
+            logger.info("To scrape ALL 400 pages, just press Enter")
+            logger.info("Or enter a specific number of pages to scrape")
+            logger.info("For testing, enter '1' to scrape just the first page")
+            logger.info("="*60 + "\n")
+
+            user_input = input("How many pages to scrape? (default: 400 - all pages): ").strip()
+
+            if user_input:
+                try:
+                    max_pages = int(user_input)
+                except ValueError:
+                    logger.error("Invalid input. Defaulting to all 400 pages.")
+                    max_pages = 400
+            else:
+                # Default: scrape all 400 pages
+                logger.info("No input provided. Scraping all 400 pages...")
+                max_pages = 400
+
+        num_workers = args.workers
+        if num_workers is None:
+            workers_input = input("How many browser workers? (default: 1 - sequential): ").strip()
             try:
-                max_pages = int(user_input)
-                scraper.scrape_all(start_page=1, max_pages=max_pages)
+                num_workers = int(workers_input) if workers_input else 1
             except ValueError:
-                logger.error("Invalid input. Defaulting to all 400 pages.")
-                scraper.scrape_all(start_page=1, max_pages=400)
+                logger.error("Invalid input. Defaulting to 1 worker.")
+                num_workers = 1
+
+        if num_workers > 1:
+            scraper.scrape_all_parallel(start_page=args.start_page, max_pages=max_pages,
+                                        num_workers=num_workers, checkpoint=checkpoint,
+                                        resume=args.resume, output_file=args.output,
+                                        metrics_file=args.metrics)
         else:
-            # Default: scrape all 400 pages
-            logger.info("No input provided. Scraping all 400 pages...")
-            scraper.scrape_all(start_page=1, max_pages=400)
+            scraper.scrape_all(start_page=args.start_page, max_pages=max_pages, checkpoint=checkpoint,
+                               resume=args.resume, output_file=args.output, metrics_file=args.metrics)
 
     except KeyboardInterrupt:
+        # Finished pages are already in the checkpoint; export what we have
         logger.info("\n\nScraping interrupted by user")
-        scraper.save_data()
+        checkpoint.export(args.output)
     except Exception as e:
         logger.error(f"Error in main: {e}")
     finally:
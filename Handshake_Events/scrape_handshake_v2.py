@@ -14,6 +14,8 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.chrome.options import Options
 import logging
 
+from scraper_utils import TokenBucket, navigate, wait_for_stable_count, EMPLOYER_CARD_SELECTOR
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -23,7 +25,7 @@ logger = logging.getLogger(__name__)
 
 
 class HandshakeScraperV2:
-    def __init__(self, headless=False):
+    def __init__(self, headless=False, pages_per_minute=30, bucket=None):
         """Initialize the scraper with Chrome driver"""
         chrome_options = Options()
         if headless:
@@ -37,6 +39,9 @@ class HandshakeScraperV2:
         self.wait = WebDriverWait(self.driver, 15)
         self.base_url = "https://colorado.joinhandshake.com"
         self.employers_data = []
+        self.bucket = bucket or TokenBucket(rate_per_minute=pages_per_minute)
+        # Jobs already fetched this run, so employers repeated on later pages aren't re-visited
+        self.jobs_by_link = {}
 
     def manual_login(self):
         """Open login page and wait for manual login"""
@@ -197,14 +202,17 @@ class HandshakeScraperV2:
             return None
 
     def scrape_employer_jobs(self, employer_link):
-        """Navigate to employer page and scrape job postings"""
+        """Navigate to employer page and scrape job postings.
+
+        Returns None if the page could not be scraped (timeout, missing Jobs tab,
+        driver error), so callers can tell a failed fetch from an employer with no jobs.
+        """
         if not employer_link:
             return []
 
         try:
             logger.info(f"Scraping jobs from: {employer_link}")
-            self.driver.get(employer_link)
-            time.sleep(3)  # Wait for page load
+            navigate(self.driver, employer_link, bucket=self.bucket)
 
             # Look for the Jobs tab - try multiple selectors
             try:
@@ -222,13 +230,12 @@ class HandshakeScraperV2:
 
                 if jobs_tab:
                     jobs_tab.click()
-                    time.sleep(3)
                 else:
                     logger.warning(f"Jobs tab not found for {employer_link}")
-                    return []
+                    return None
             except TimeoutException:
                 logger.warning(f"Jobs tab not clickable for {employer_link}")
-                return []
+                return None
 
             # Wait for job cards to load - try multiple selectors
             job_cards = []
@@ -238,7 +245,8 @@ class HandshakeScraperV2:
                 "[class*='job'][class*='card']"
             ]:
                 try:
-                    self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+                    if not wait_for_stable_count(self.driver, selector, timeout=5):
+                        continue
                     job_cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
                     if job_cards:
                         break
@@ -260,28 +268,33 @@ class HandshakeScraperV2:
 
         except Exception as e:
             logger.error(f"Error scraping employer jobs: {e}")
-            return []
+            return None
+
+    def scrape_page(self, page_num, scrape_jobs=True):
+        """Scrape a single page of employers.
 
-    def scrape_page(self, page_num):
-        """Scrape a single page of employers"""
+        With scrape_jobs=False only the employer cards are collected; run
+        scrape_jobs.py afterwards to fetch job postings in parallel.
+        """
         url = f"{self.base_url}/employer-search?page={page_num}&per_page=25"
         logger.info(f"Scraping page {page_num}: {url}")
 
         try:
-            self.driver.get(url)
-            time.sleep(5)  # Wait for dynamic content to load
+            # Load the page and wait until the employer card count stops changing
+            navigate(self.driver, url, EMPLOYER_CARD_SELECTOR, bucket=self.bucket, retries=0)
 
             # Try multiple selectors for employer cards
             employer_cards = []
             selectors = [
-                "div[data-test='employer-search-employer-card']",
+                EMPLOYER_CARD_SELECTOR,
                 "div[role='listitem']",
                 "a[href*='/e/']"
             ]
 
             for selector in selectors:
                 try:
-                    self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+                    if not wait_for_stable_count(self.driver, selector, timeout=5):
+                        continue
                     employer_cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
                     if employer_cards:
                         logger.info(f"Found {len(employer_cards)} employers using selector: {selector}")
@@ -304,29 +317,31 @@ class HandshakeScraperV2:
                 employer_info = self.extract_employer_info(card)
 
                 if employer_info:
-                    # Scrape jobs for this employer
-                    jobs = self.scrape_employer_jobs(employer_info['link'])
-                    employer_info['jobs'] = jobs
-                    employer_info['total_jobs'] = len(jobs)
+                    if scrape_jobs:
+                        link = employer_info['link']
+                        jobs = self.jobs_by_link.get(link)
+                        if jobs is None:
+                            # Scrape jobs for this employer (failed fetches are not cached)
+                            jobs = self.scrape_employer_jobs(link)
+                            if jobs is not None:
+                                self.jobs_by_link[link] = jobs
+                            jobs = jobs or []
+
+                            # Go back to the employer search page
+                            navigate(self.driver, url, EMPLOYER_CARD_SELECTOR, bucket=self.bucket)
+                        employer_info['jobs'] = jobs
+                        employer_info['total_jobs'] = len(jobs)
                     page_employers.append(employer_info)
 
-                    # Go back to the employer search page
-                    self.driver.get(url)
-                    time.sleep(3)
-
             return page_employers
 
         except Exception as e:
             logger.error(f"Error scraping page {page_num}: {e}")
             return []
 
-    def scrape_all(self, start_page=1, end_page=None, max_pages=None):
+    def scrape_all(self, start_page=1, end_page=None, max_pages=None, scrape_jobs=True):
         """Scrape all pages or a range of pages"""
         try:
-            # Navigate to first page
-            self.driver.get(f"{self.base_url}/employer-search?page=1&per_page=25")
-            time.sleep(5)
-
             # Default to scraping limited pages
             if max_pages:
                 end_page = start_page + max_pages - 1
@@ -338,12 +353,9 @@ class HandshakeScraperV2:
             # Scrape each page
             for page_num in range(start_page, end_page + 1):
                 logger.info(f"Processing page {page_num}/{end_page}")
-                page_employers = self.scrape_page(page_num)
+                page_employers = self.scrape_page(page_num, scrape_jobs=scrape_jobs)
                 self.employers_data.extend(page_employers)
 
-                # Add delay between pages to avoid rate limiting
-                time.sleep(3)
-
             logger.info(f"Scraping complete! Total employers: {len(self.employers_data)}")
 
         except Exception as e:
@@ -14,6 +14,8 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.chrome.options import Options
 import logging
 
+from scraper_utils import TokenBucket, navigate, wait_for_stable_count, EMPLOYER_CARD_SELECTOR
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -23,7 +25,7 @@ logger = logging.getLogger(__name__)
 
 
 class HandshakeScraper:
-    def __init__(self, headless=False):
+    def __init__(self, headless=False, pages_per_minute=30, bucket=None):
         """Initialize the scraper with Chrome driver"""
         chrome_options = Options()
         if headless:
@@ -37,6 +39,9 @@ class HandshakeScraper:
         self.wait = WebDriverWait(self.driver, 10)
         self.base_url = "https://colorado.joinhandshake.com"
         self.employers_data = []
+        self.bucket = bucket or TokenBucket(rate_per_minute=pages_per_minute)
+        # Jobs already fetched this run, so employers repeated on later pages aren't re-visited
+        self.jobs_by_link = {}
 
     def manual_login(self):
         """Open login page and wait for manual login"""
@@ -170,11 +175,14 @@ class HandshakeScraper:
             return None
 
     def scrape_employer_jobs(self, employer_link):
-        """Navigate to employer page and scrape job postings"""
+        """Navigate to employer page and scrape job postings.
+
+        Returns None if the page could not be scraped (timeout, missing Jobs tab,
+        driver error), so callers can tell a failed fetch from an employer with no jobs.
+        """
         try:
             logger.info(f"Scraping jobs from: {employer_link}")
-            self.driver.get(employer_link)
-            time.sleep(2)  # Wait for page load
+            navigate(self.driver, employer_link, bucket=self.bucket)
 
             # Look for the Jobs tab and click it
             try:
@@ -182,17 +190,12 @@ class HandshakeScraper:
                     EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Jobs')]"))
                 )
                 jobs_tab.click()
-                time.sleep(2)
             except TimeoutException:
                 logger.warning(f"Jobs tab not found for {employer_link}")
-                return []
+                return None
 
-            # Wait for job cards to load
-            try:
-                self.wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.sc-jVQoqC"))
-                )
-            except TimeoutException:
+            # Wait for job cards to load and stop changing
+            if not wait_for_stable_count(self.driver, "div.sc-jVQoqC"):
                 logger.warning(f"No job cards found for {employer_link}")
                 return []
 
@@ -210,24 +213,24 @@ class HandshakeScraper:
 
         except Exception as e:
             logger.error(f"Error scraping employer jobs: {e}")
-            return []
+            return None
+
+    def scrape_page(self, page_num, scrape_jobs=True):
+        """Scrape a single page of employers.
 
-    def scrape_page(self, page_num):
-        """Scrape a single page of employers"""
+        With scrape_jobs=False only the employer cards are collected; run
+        scrape_jobs.py afterwards to fetch job postings in parallel.
+        """
         url = f"{self.base_url}/employer-search?page={page_num}&per_page=25"
         logger.info(f"Scraping page {page_num}: {url}")
 
         try:
-            self.driver.get(url)
-            time.sleep(3)  # Wait for dynamic content to load
-
-            # Wait for employer cards to load
-            self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div[data-test='employer-search-employer-card']"))
-            )
+            # Load the page and wait until the employer card count stops changing
+            if not navigate(self.driver, url, EMPLOYER_CARD_SELECTOR, bucket=self.bucket):
+                raise TimeoutException(f"No employer cards on page {page_num}")
 
             # Get all employer cards
-            employer_cards = self.driver.find_elements(By.CSS_SELECTOR, "div[data-test='employer-search-employer-card']")
+            employer_cards = self.driver.find_elements(By.CSS_SELECTOR, EMPLOYER_CARD_SELECTOR)
             logger.info(f"Found {len(employer_cards)} employers on page {page_num}")
 
             page_employers = []
@@ -235,16 +238,22 @@ class HandshakeScraper:
             for card in employer_cards:
                 employer_info = self.extract_employer_info(card)
                 if employer_info:
-                    # Scrape jobs for this employer
-                    jobs = self.scrape_employer_jobs(employer_info['link'])
-                    employer_info['jobs'] = jobs
-                    employer_info['total_jobs'] = len(jobs)
+                    if scrape_jobs:
+                        link = employer_info['link']
+                        jobs = self.jobs_by_link.get(link)
+                        if jobs is None:
+                            # Scrape jobs for this employer (failed fetches are not cached)
+                            jobs = self.scrape_employer_jobs(link)
+                            if jobs is not None:
+                                self.jobs_by_link[link] = jobs
+                            jobs = jobs or []
+
+                            # Go back to the employer search page
+                            navigate(self.driver, url, EMPLOYER_CARD_SELECTOR, bucket=self.bucket)
+                        employer_info['jobs'] = jobs
+                        employer_info['total_jobs'] = len(jobs)
                     page_employers.append(employer_info)
 
-                    # Go back to the employer search page
-                    self.driver.get(url)
-                    time.sleep(2)
-
             return page_employers
 
         except TimeoutException:
@@ -265,12 +274,12 @@ class HandshakeScraper:
             logger.warning(f"Could not determine total pages: {e}")
             return 400  # Default from the HTML you provided
 
-    def scrape_all(self, start_page=1, end_page=None, max_pages=None):
+    def scrape_all(self, start_page=1, end_page=None, max_pages=None, scrape_jobs=True):
         """Scrape all pages or a range of pages"""
         try:
             # Navigate to first page to get total pages
-            self.driver.get(f"{self.base_url}/employer-search?page=1&per_page=25")
-            time.sleep(3)
+            navigate(self.driver, f"{self.base_url}/employer-search?page=1&per_page=25",
+                     EMPLOYER_CARD_SELECTOR, bucket=self.bucket)
 
             total_pages = self.get_total_pages()
             logger.info(f"Total pages available: {total_pages}")
@@ -288,12 +297,9 @@ class HandshakeScraper:
             # Scrape each page
             for page_num in range(start_page, end_page + 1):
                 logger.info(f"Processing page {page_num}/{end_page}")
-                page_employers = self.scrape_page(page_num)
+                page_employers = self.scrape_page(page_num, scrape_jobs=scrape_jobs)
                 self.employers_data.extend(page_employers)
 
-                # Add delay between pages to avoid rate limiting
-                time.sleep(2)
-
             logger.info(f"Scraping complete! Total employers: {len(self.employers_data)}")
 
         except Exception as e:
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Handshake Job Postings Scraper - separate stage after the employer scrape
+Reads the employer link list, fans the employer pages out across a pool of
+logged-in browser workers and appends each employer's jobs to a JSONL file
+keyed by employer id. A persistent visited-link cache with timestamps means
+only employers never visited (or visited longer ago than --max-age-hours)
+are fetched again
+
+Usage:
+    python scrape_jobs.py --employers handshake_employers_data.json --workers 4
+"""
+
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+import logging
+
+from scraper_utils import TokenBucket, apply_session_cookies
+from merge_snapshots import iter_records, employer_key
+from scrape_handshake_v2 import HandshakeScraperV2
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOBS_PATH = "handshake_jobs.jsonl"
+DEFAULT_VISITED_PATH = "handshake_jobs_visited.jsonl"
+
+
+class VisitedCache:
+    """Append-only log of visited employer pages: {employer_id, link, visited_at, total_jobs}.
+
+    The log is replayed on load (last entry per employer wins), so marking an
+    employer visited is a single appended line rather than a full rewrite.
+    """
+
+    def __init__(self, path=DEFAULT_VISITED_PATH):
+        self.path = path
+        self.entries = {}
+        self.lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        entry = json.loads(line)
+                        self.entries[entry["employer_id"]] = entry
+
+    def is_fresh(self, employer_id, max_age_hours):
+        """True if the employer was visited within max_age_hours"""
+        entry = self.entries.get(employer_id)
+        if entry is None:
+            return False
+        return time.time() - entry["visited_at"] < max_age_hours * 3600
+
+    def mark(self, employer_id, link, total_jobs):
+        entry = {"employer_id": employer_id, "link": link,
+                 "visited_at": time.time(), "total_jobs": total_jobs}
+        with self.lock:
+            self.entries[employer_id] = entry
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + "\n")
+
+
+def load_jobs(path=DEFAULT_JOBS_PATH):
+    """Latest jobs record per employer id from the jobs JSONL"""
+    jobs = {}
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    record = json.loads(line)
+                    jobs[record["employer_id"]] = record
+    return jobs
+
+
+def load_employer_links(employers_path):
+    """Unique (employer_id, link) pairs from an employers JSON snapshot or JSONL checkpoint"""
+    seen = set()
+    links = []
+    for record in iter_records(employers_path):
+        kind, key = employer_key(record)
+        if kind != 0 or key in seen:
+            continue
+        seen.add(key)
+        links.append((str(key), record["link"]))
+    return links
+
+
+def scrape_jobs(cookies, employer_links, jobs_path=DEFAULT_JOBS_PATH, visited=None,
+                max_age_hours=168, num_workers=4, max_pages_per_minute=30, headless=False):
+    """Fetch jobs for every stale employer with a pool of browser workers.
+
+    Each worker runs its own Chrome instance with the logged-in session cookies;
+    a shared token bucket caps the total request rate. Only successful fetches
+    are written and marked visited. Returns the number of employers fetched.
+    """
+    visited = visited or VisitedCache()
+    stale = [(eid, link) for eid, link in employer_links if not visited.is_fresh(eid, max_age_hours)]
+    logger.info(f"{len(employer_links)} employers, {len(employer_links) - len(stale)} fresh in cache, "
+                f"{len(stale)} to fetch")
+    if not stale:
+        return 0
+
+    work = queue.Queue()
+    for item in stale:
+        work.put(item)
+
+    bucket = TokenBucket(rate_per_minute=max_pages_per_minute, burst=num_workers)
+    jobs_lock = threading.Lock()
+    stop_event = threading.Event()
+    fetched = [0]
+
+    def worker(worker_id):
+        scraper = None
+        try:
+            scraper = HandshakeScraperV2(headless=headless, bucket=bucket)
+            apply_session_cookies(scraper.driver, scraper.base_url, cookies)
+            logger.info(f"Worker {worker_id} ready")
+
+            while not stop_event.is_set():
+                try:
+                    employer_id, link = work.get_nowait()
+                except queue.Empty:
+                    break
+                jobs = scraper.scrape_employer_jobs(link)
+                if jobs is None:
+                    # Failed fetch: not recorded or marked visited, so the next run retries it
+                    logger.warning(f"Worker {worker_id}: could not fetch jobs for {link} - will retry next run")
+                    continue
+                record = {"employer_id": employer_id, "employer_link": link,
+                          "scraped_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+                          "total_jobs": len(jobs), "jobs": jobs}
+                with jobs_lock:
+                    with open(jobs_path, 'a', encoding='utf-8') as f:
+                        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    fetched[0] += 1
+                visited.mark(employer_id, link, len(jobs))
+        except Exception as e:
+            logger.error(f"Worker {worker_id} failed: {e}")
+        finally:
+            if scraper:
+                scraper.close()
+
+    threads = [threading.Thread(target=worker, args=(i + 1,), daemon=True) for i in range(num_workers)]
+    try:
+        for thread in threads:
+            thread.start()
+        # Join with a timeout so Ctrl+C is still delivered to the main thread
+        while any(thread.is_alive() for thread in threads):
+            for thread in threads:
+                thread.join(timeout=1)
+    except KeyboardInterrupt:
+        logger.info("\n\n⚠️  Job scraping interrupted by user - waiting for workers to stop")
+        stop_event.set()
+        for thread in threads:
+            thread.join()
+
+    logger.info(f"✓ Fetched jobs for {fetched[0]} employers into {jobs_path}")
+    return fetched[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape Handshake job postings for scraped employers")
+    parser.add_argument('--employers', default="handshake_employers_data.json",
+                        help="Employers JSON snapshot or JSONL checkpoint with employer links")
+    parser.add_argument('--jobs-output', default=DEFAULT_JOBS_PATH, help="Jobs JSONL (one line per employer)")
+    parser.add_argument('--visited', default=DEFAULT_VISITED_PATH, help="Visited-link cache")
+    parser.add_argument('--max-age-hours', type=float, default=168,
+                        help="Re-fetch employers last visited longer ago than this")
+    parser.add_argument('--workers', type=int, default=4, help="Number of browser workers")
+    parser.add_argument('--pages-per-minute', type=int, default=30, help="Global request rate cap")
+    parser.add_argument('--limit', type=int, default=None, help="Only consider the first N employers")
+    args = parser.parse_args()
+
+    employer_links = load_employer_links(args.employers)
+    if args.limit:
+        employer_links = employer_links[:args.limit]
+    logger.info(f"Loaded {len(employer_links)} employer links from {args.employers}")
+
+    # Log in once; workers reuse this session's cookies
+    login = HandshakeScraperV2(headless=False)
+    try:
+        login.manual_login()
+        cookies = login.driver.get_cookies()
+    finally:
+        login.close()
+
+    scrape_jobs(cookies, employer_links, jobs_path=args.jobs_output, visited=VisitedCache(args.visited),
+                max_age_hours=args.max_age_hours, num_workers=args.workers,
+                max_pages_per_minute=args.pages_per_minute)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Scraper throughput instrumentation
+Per-stage timing spans (navigate, wait-for-cards, extract, save) aggregated
+into a pages/min + p50/p95 summary, and non-blocking queue-based logging with
+sampling for the per-card messages
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+STAGES = ("navigate", "wait_for_cards", "extract", "save")
+
+# Per-card messages go to "<module>.cards" loggers so they can be sampled
+CARD_LOGGER_SUFFIX = ".cards"
+
+
+def percentile(values, q):
+    """Linear-interpolated percentile (q in 0-100) of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    pos = (len(ordered) - 1) * q / 100.0
+    lower = int(pos)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (pos - lower)
+
+
+class ScrapeMetrics:
+    """Thread-safe collector of stage timings and page outcomes for one scrape run"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.monotonic()
+        self.durations = {stage: [] for stage in STAGES}
+        self.page_seconds = []
+        self.pages = 0
+        self.employers = 0
+        self.empty_pages = []
+        self.error_pages = []
+        # Additional report sections (e.g. selector resolution) merged into the summary
+        self.extra = {}
+
+    @contextmanager
+    def span(self, stage):
+        """Time a block of work and record it under `stage`"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self.lock:
+                self.durations.setdefault(stage, []).append(elapsed)
+
+    def page_done(self, page_num, employer_count, seconds):
+        with self.lock:
+            self.pages += 1
+            self.employers += employer_count
+            self.page_seconds.append(seconds)
+
+    def page_empty(self, page_num):
+        with self.lock:
+            self.empty_pages.append(page_num)
+
+    def page_error(self, page_num):
+        with self.lock:
+            self.error_pages.append(page_num)
+
+    def summary(self):
+        """Aggregate the spans into a JSON-serializable report"""
+        with self.lock:
+            elapsed = time.monotonic() - self.started
+            stages = {}
+            for stage, values in self.durations.items():
+                if not values:
+                    continue
+                stages[stage] = {
+                    "count": len(values),
+                    "total_s": round(sum(values), 3),
+                    "mean_s": round(sum(values) / len(values), 4),
+                    "p50_s": round(percentile(values, 50), 4),
+                    "p95_s": round(percentile(values, 95), 4),
+                }
+            return {
+                "elapsed_s": round(elapsed, 2),
+                "pages": self.pages,
+                "employers": self.employers,
+                "pages_per_min": round(self.pages / elapsed * 60, 2) if elapsed > 0 else 0.0,
+                "page_p50_s": round(percentile(self.page_seconds, 50), 3),
+                "page_p95_s": round(percentile(self.page_seconds, 95), 3),
+                "empty_pages": len(self.empty_pages),
+                "error_pages": len(self.error_pages),
+                "empty_page_numbers": sorted(self.empty_pages),
+                "error_page_numbers": sorted(self.error_pages),
+                "stages": stages,
+                **self.extra,
+            }
+
+    def write(self, path="handshake_scrape_metrics.json"):
+        summary = self.summary()
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+        return summary
+
+    def log_summary(self, logger, summary=None):
+        summary = summary or self.summary()
+        logger.info(f"Throughput: {summary['pages']} pages, {summary['pages_per_min']} pages/min "
+                    f"(page p50 {summary['page_p50_s']}s, p95 {summary['page_p95_s']}s)")
+        logger.info(f"Empty pages: {summary['empty_pages']}, error pages: {summary['error_pages']}")
+        for stage, stats in summary["stages"].items():
+            logger.info(f"  {stage:<15} n={stats['count']:<5} p50={stats['p50_s']:.3f}s "
+                        f"p95={stats['p95_s']:.3f}s total={stats['total_s']:.1f}s")
+
+
+class CardSamplingFilter(logging.Filter):
+    """Let through 1 in `every` per-card INFO/DEBUG records; warnings and other loggers always pass"""
+
+    def __init__(self, every=25):
+        super().__init__()
+        self.every = max(1, every)
+        self.seen = 0
+        self.lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING or not record.name.endswith(CARD_LOGGER_SUFFIX):
+            return True
+        with self.lock:
+            self.seen += 1
+            return self.seen % self.every == 1 or self.every == 1
+
+
+def setup_logging(level=logging.INFO, card_sample_every=25,
+                  fmt='%(asctime)s - %(levelname)s - %(message)s'):
+    """Route all logging through a QueueHandler so the scrape loop never blocks on log I/O.
+
+    A background QueueListener formats and writes records; per-card messages
+    are sampled (1 in `card_sample_every`). Returns the listener (stopped at exit).
+    """
+    log_queue = queue.SimpleQueue()
+
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter(fmt))
+
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # Sample before enqueueing so dropped card messages cost nothing downstream
+    queue_handler.addFilter(CardSamplingFilter(card_sample_every))
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(level)
+
+    listener = logging.handlers.QueueListener(log_queue, console, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
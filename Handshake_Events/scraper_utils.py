@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the Handshake scrapers
+Token-bucket request pacing with backoff and DOM-readiness based navigation
+(replaces the fixed time.sleep() calls after every driver.get)
+"""
+
+import os
+import threading
+import time
+import logging
+from contextlib import nullcontext
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.options import Options
+
+logger = logging.getLogger(__name__)
+
+EMPLOYER_CARD_SELECTOR = "div[data-test='employer-search-employer-card']"
+
+USER_AGENT = ('Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 '
+              '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+
+# Requests the employer-search scrape never needs: images (incl. the imgix logo CDN),
+# media, web fonts, and third-party analytics/ad hosts seen on the page
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.ico',
+    '*.mp4', '*.webm', '*.mp3', '*.m4a',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*imgix.net*',
+    '*googletagmanager.com*', '*google-analytics.com*', '*doubleclick.net*',
+    '*facebook.com*', '*facebook.net*', '*ads.linkedin.com*', '*licdn.com*',
+    '*hotjar.com*', '*segment.io*', '*segment.com*', '*fullstory.com*',
+]
+
+
+class TokenBucket:
+    """Thread-safe token bucket that paces page requests.
+
+    Tokens refill at `rate_per_minute`; up to `burst` requests can go out back
+    to back. When a page comes back empty, `backoff()` doubles the delay added
+    before every request (up to `max_backoff` seconds) and `success()` resets it.
+    """
+
+    def __init__(self, rate_per_minute=30, burst=3, base_backoff=2.0, max_backoff=60.0):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.backoff_delay = 0.0
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """Block until a request token is available (plus any backoff delay)"""
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    delay = self.backoff_delay
+                    break
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+        if delay > 0:
+            time.sleep(delay)
+
+    def backoff(self):
+        """Increase the delay exponentially after an empty or failed page"""
+        with self.lock:
+            self.backoff_delay = min(self.max_backoff, max(self.base_backoff, self.backoff_delay * 2))
+            logger.warning(f"Backing off: {self.backoff_delay:.1f}s before each request")
+
+    def success(self):
+        """Reset the backoff delay after a page loads normally"""
+        with self.lock:
+            self.backoff_delay = 0.0
+
+
+def wait_for_document_ready(driver, timeout=15, poll=0.1):
+    """Wait until document.readyState is 'complete'"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if driver.execute_script("return document.readyState") == "complete":
+                return True
+        except Exception:
+            pass
+        time.sleep(poll)
+    return False
+
+
+def wait_for_stable_count(driver, selector, timeout=15, settle_time=0.5, poll=0.2):
+    """Wait until the number of elements matching `selector` is non-zero and stops changing.
+
+    Returns the settled element count, or 0 if nothing matched before the timeout.
+    """
+    deadline = time.monotonic() + timeout
+    last_count = -1
+    stable_since = None
+
+    while time.monotonic() < deadline:
+        count = len(driver.find_elements(By.CSS_SELECTOR, selector))
+        now = time.monotonic()
+        if count != last_count:
+            last_count = count
+            stable_since = now
+        elif count > 0 and now - stable_since >= settle_time:
+            return count
+        time.sleep(poll)
+
+    return max(last_count, 0)
+
+
+def build_chrome_options(headless=False, block_resources=False, user_data_dir=None):
+    """Chrome options shared by the scrapers.
+
+    block_resources turns off image loading through Chrome preferences (the
+    remaining blocking is done per driver by enable_resource_blocking).
+    user_data_dir keeps a persistent profile so the Handshake login survives restarts.
+    """
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument('--headless=new')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+    chrome_options.add_argument(f'user-agent={USER_AGENT}')
+
+    if user_data_dir:
+        chrome_options.add_argument(f'--user-data-dir={os.path.abspath(user_data_dir)}')
+
+    if block_resources:
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_argument('--mute-audio')
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.default_content_setting_values.notifications': 2,
+        })
+    return chrome_options
+
+
+def enable_resource_blocking(driver, patterns=BLOCKED_URL_PATTERNS):
+    """Block fonts, media, images and third-party trackers via CDP request interception"""
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(patterns)})
+        return True
+    except Exception as e:
+        logger.warning(f"Could not enable CDP request blocking: {e}")
+        return False
+
+
+def apply_session_cookies(driver, base_url, cookies):
+    """Reuse the session cookies from another (logged-in) browser"""
+    # Cookies can only be set for the domain that is currently loaded
+    driver.get(base_url)
+    for cookie in cookies:
+        cookie = {k: v for k, v in cookie.items()
+                  if k in ('name', 'value', 'path', 'domain', 'secure', 'httpOnly', 'expiry')}
+        try:
+            driver.add_cookie(cookie)
+        except Exception as e:
+            logger.debug(f"Could not add cookie {cookie.get('name')}: {e}")
+    driver.refresh()
+
+
+def navigate(driver, url, selector=None, bucket=None, timeout=15, retries=2, metrics=None):
+    """Load a page and wait for concrete DOM readiness instead of sleeping.
+
+    With a `selector`, waits for the matching element count to stabilize and
+    retries with exponential backoff when the page comes back empty.
+    With `metrics` (a ScrapeMetrics), the load and the card wait are timed as
+    the "navigate" and "wait_for_cards" stages.
+    Returns the settled element count (or 1 when no selector is given).
+    """
+    def span(stage):
+        return metrics.span(stage) if metrics else nullcontext()
+
+    for attempt in range(retries + 1):
+        if bucket:
+            bucket.acquire()
+        with span("navigate"):
+            driver.get(url)
+            wait_for_document_ready(driver, timeout=timeout)
+
+        if selector is None:
+            return 1
+
+        with span("wait_for_cards"):
+            count = wait_for_stable_count(driver, selector, timeout=timeout)
+        if count > 0:
+            if bucket:
+                bucket.success()
+            return count
+
+        if bucket:
+            bucket.backoff()
+        elif attempt < retries:
+            time.sleep(2 ** attempt)
+        if attempt < retries:
+            logger.warning(f"No elements matching {selector} at {url} - retrying ({attempt + 1}/{retries})")
+
+    return 0
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Selector resolution cache for the employer card fields
+Probes every candidate selector against all cards on a page in one script
+call, caches the winner per field for the rest of the run, and reports when
+the primary (styled-component class) selectors stop matching
+"""
+
+import threading
+import logging
+
+from employer_parser import CARD_SELECTOR, LINK_SELECTORS, NAME_SELECTORS, INFO_SELECTORS
+
+logger = logging.getLogger(__name__)
+
+# Candidates per field, primary first
+SELECTOR_CANDIDATES = {
+    "link": LINK_SELECTORS,
+    "name": NAME_SELECTORS,
+    "info": INFO_SELECTORS,
+}
+
+# For each candidate selector, how many cards contain a match
+PROBE_JS = """
+var cards = document.querySelectorAll(arguments[0]);
+var candidates = arguments[1];
+var counts = {};
+for (var field in candidates) {
+    counts[field] = [];
+    for (var i = 0; i < candidates[field].length; i++) {
+        var hits = 0;
+        for (var c = 0; c < cards.length; c++) {
+            if (cards[c].querySelector(candidates[field][i])) hits++;
+        }
+        counts[field].push(hits);
+    }
+}
+return {cards: cards.length, counts: counts};
+"""
+
+
+class SelectorResolver:
+    """Remembers which selector fallback works for each card field.
+
+    The first page is probed once; later pages reuse the cached winners
+    directly (no failed primary lookup per card). If a cached selector misses
+    some cards on a page, the caller re-probes with `resolve(..., force=True)`.
+    Safe to share between scraper worker threads.
+    """
+
+    def __init__(self, candidates=None, card_selector=CARD_SELECTOR):
+        self.candidates = {field: list(sels) for field, sels in (candidates or SELECTOR_CANDIDATES).items()}
+        self.card_selector = card_selector
+        self.selectors = {}
+        self.lock = threading.Lock()
+        self.probes = 0
+        self.primary_misses = {field: 0 for field in self.candidates}
+        self.warned = set()
+
+    def resolve(self, driver, force=False):
+        """Return {field: selector}, probing the current page if nothing is cached (or force)"""
+        with self.lock:
+            if self.selectors and not force:
+                return dict(self.selectors)
+
+        result = driver.execute_script(PROBE_JS, self.card_selector, self.candidates) or {}
+        return self.update(result.get("cards", 0), result.get("counts", {}))
+
+    def update(self, card_count, counts):
+        """Pick the winner per field from probe hit counts: first candidate matching every card,
+        else the one matching the most cards"""
+        with self.lock:
+            self.probes += 1
+            for field, sels in self.candidates.items():
+                hits = counts.get(field) or [0] * len(sels)
+                full = [i for i, h in enumerate(hits) if card_count and h == card_count]
+                best = full[0] if full else max(range(len(sels)), key=lambda i: (hits[i], -i))
+                self.selectors[field] = sels[best]
+
+                if best != 0:
+                    self.primary_misses[field] += 1
+                    if field not in self.warned:
+                        self.warned.add(field)
+                        logger.warning(f"Primary selector '{sels[0]}' for {field} matched "
+                                       f"{hits[0]}/{card_count} cards - using '{sels[best]}'")
+            return dict(self.selectors)
+
+    def ordered(self, field):
+        """Candidates for a field with the cached winner first (for per-element fallbacks)"""
+        with self.lock:
+            winner = self.selectors.get(field)
+        sels = self.candidates[field]
+        return [winner] + [s for s in sels if s != winner] if winner else list(sels)
+
+    def report(self):
+        """Which selector is in use per field and whether the primary still matches"""
+        with self.lock:
+            return {
+                "probes": self.probes,
+                "fields": {
+                    field: {
+                        "primary": sels[0],
+                        "selected": self.selectors.get(field, sels[0]),
+                        "primary_matching": self.selectors.get(field, sels[0]) == sels[0],
+                        "probes_on_fallback": self.primary_misses[field],
+                    }
+                    for field, sels in self.candidates.items()
+                },
+            }
+
+    def log_report(self, log=logger):
+        """Log a warning listing the fields whose primary selector no longer matches"""
+        report = self.report()
+        stale = [f"{field} ('{r['primary']}' -> '{r['selected']}')"
+                 for field, r in report["fields"].items() if not r["primary_matching"]]
+        if stale:
+            log.warning(f"Primary selectors no longer match: {', '.join(stale)} - "
+                        f"update the candidates in employer_parser.py")
+        return report
@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+Admissions Data Preprocessor
+The preprocessing pipeline of preprocessing.ipynb (missing values, feature
+engineering, categorical encoding, outlier capping, standardization) as an
+importable module and CLI. The input is streamed in chunks twice: pass one
+fits every statistic the pipeline needs (medians, IQR bounds, top categories,
+label classes, scaler mean/std) from mergeable per-chunk aggregates, pass two
+transforms chunk by chunk and appends to the output files, so peak memory
+depends on the chunk size rather than on the dataset size. The fitted
+statistics are saved as a feature builder (see feature_builder.py)
+
+Usage:
+    python admissions_preprocessor.py usa_decisions_cleaned_with_uuid.jsonl
+    python admissions_preprocessor.py data.json --output-prefix admissions_processed --chunk-size 20000
+    python admissions_preprocessor.py usa_decisions_cleaned_with_uuid.jsonl --chunk-size 500000 --workers 4
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from feature_builder import (FeatureBuilder, GRE_COLUMNS, RANK_COLUMNS, NO_RANK, BINARY_COLUMNS,
+                             CATEGORICAL_COLUMNS, OTHER_CATEGORY, as_str, features_path, normalize_term)
+
+CHUNK_SIZE = 50000
+
+# Columns read as numbers; anything unparseable becomes NaN
+NUMERIC_COLUMNS = GRE_COLUMNS + RANK_COLUMNS + [
+    'gpa_normalized', 'english_test_normalized', 'work_experience', 'relevant_work_experience',
+    'internship_experience', 'publications', 'scholarship_amount', 'major_alignment'
+]
+
+TOP_CATEGORIES = 10
+
+OUTLIER_COLUMNS = [
+    'gpa_normalized', 'english_test_normalized', 'gre_total',
+    'work_experience', 'relevant_work_experience',
+    'internship_experience', 'publications'
+]
+IQR_FACTOR = 3
+
+SCALED_COLUMNS = [
+    'gpa_normalized', 'english_test_normalized', 'gre_total',
+    'gre_verbal', 'gre_quant', 'gre_awa',
+    'work_experience', 'relevant_work_experience',
+    'internship_experience', 'total_experience',
+    'publications', 'composite_academic_score'
+]
+
+# Identifiers and targets that never go into a feature set
+NON_FEATURE_COLUMNS = [
+    'id', 'student_id', 'student_name', 'university_name', 'course_name',
+    'undergrad_university', 'undergrad_canonical', 'admission_result', 'application_status'
+]
+
+
+def iter_chunks(path, chunk_size=CHUNK_SIZE):
+    """Yield DataFrames of chunk_size records from a JSONL file (or a JSON array, which is loaded whole)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        head = f.read(1024).lstrip()
+        f.seek(0)
+        if head.startswith('['):
+            records = json.load(f)
+            for start in range(0, len(records), chunk_size):
+                yield pd.DataFrame(records[start:start + chunk_size])
+            return
+
+        records = []
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            records.append(json.loads(line))
+            if len(records) >= chunk_size:
+                yield pd.DataFrame(records)
+                records = []
+    if records:
+        yield pd.DataFrame(records)
+
+
+def add_counts(total, series):
+    """Merge the value counts of a chunk into a running value -> count Series"""
+    counts = series.value_counts()
+    return counts if total is None else total.add(counts, fill_value=0)
+
+
+def quantile_from_counts(counts, q):
+    """Quantiles of the values behind a value -> count Series, interpolated like Series.quantile"""
+    counts = counts[counts > 0].sort_index()
+    if counts.empty:
+        return np.full(np.shape(q), np.nan)
+    values = counts.index.to_numpy(dtype=float)
+    cumulative = counts.to_numpy().cumsum()
+    position = (cumulative[-1] - 1) * np.asarray(q, dtype=float)
+    lower = values[np.searchsorted(cumulative, np.floor(position), side='right')]
+    upper = values[np.searchsorted(cumulative, np.ceil(position), side='right')]
+    return lower + (position - np.floor(position)) * (upper - lower)
+
+
+class Moments:
+    """Count, mean and sum of squared deviations, merged across chunks"""
+
+    def __init__(self, count=0, mean=0.0, m2=0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    @classmethod
+    def of(cls, values, weights=None):
+        values = np.asarray(values, dtype=float)
+        weights = np.ones_like(values) if weights is None else np.asarray(weights, dtype=float)
+        keep = ~np.isnan(values)
+        values, weights = values[keep], weights[keep]
+        count = weights.sum()
+        if count == 0:
+            return cls()
+        mean = np.dot(weights, values) / count
+        return cls(count, mean, np.dot(weights, (values - mean) ** 2))
+
+    def merge(self, other):
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            return other
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        mean = self.mean + delta * other.count / count
+        m2 = self.m2 + other.m2 + delta ** 2 * self.count * other.count / count
+        return Moments(count, mean, m2)
+
+    def shift(self, offset):
+        return Moments(self.count, self.mean + offset, self.m2)
+
+    @property
+    def std(self):
+        return np.sqrt(self.m2 / self.count) if self.count else np.nan
+
+
+class AdmissionsDataPreprocessor:
+    """
+    Data preprocessing pipeline for Indian student admissions data
+    """
+
+    def __init__(self, json_file_path, chunk_size=CHUNK_SIZE, workers=None):
+        """Initialize with a JSONL (or JSON array) file path"""
+        self.json_file_path = json_file_path
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.columns = None          # source columns, first-seen order
+        self.n_rows = 0
+        self.features = FeatureBuilder()
+        self.encoders = {}
+        self.outlier_counts = {}
+
+    def iter_chunks(self):
+        for chunk in iter_chunks(self.json_file_path, self.chunk_size):
+            yield self._coerce(chunk)
+
+    def _coerce(self, chunk):
+        if self.columns is not None:
+            chunk = chunk.reindex(columns=self.columns)
+        for col in NUMERIC_COLUMNS:
+            if col in chunk.columns:
+                chunk[col] = pd.to_numeric(chunk[col], errors='coerce')
+        if 'application_term' in chunk.columns:
+            chunk['application_term'] = normalize_term(chunk['application_term'])
+        return chunk
+
+    def fit(self):
+        """Pass one: fit fill values, label classes, top categories, IQR bounds and scalers"""
+        print("Fitting preprocessing statistics (pass 1)...")
+        columns = {}
+        counts = {}       # column -> value counts (GRE and outlier columns)
+        missing = {}      # column -> missing values
+        labels = {col: set() for col in BINARY_COLUMNS}
+        categories = {}
+        total_experience = Moments()
+        composite, composite_no_gre = Moments(), Moments()
+
+        for chunk in self.iter_chunks():
+            self.n_rows += len(chunk)
+            columns.update(dict.fromkeys(chunk.columns))
+
+            for col in set(GRE_COLUMNS + OUTLIER_COLUMNS).intersection(chunk.columns):
+                counts[col] = add_counts(counts.get(col), chunk[col])
+                missing[col] = missing.get(col, 0) + int(chunk[col].isna().sum())
+
+            for col in BINARY_COLUMNS:
+                if col in chunk.columns:
+                    labels[col].update(np.unique(as_str(chunk[col])))
+
+            for col in CATEGORICAL_COLUMNS:
+                if col in chunk.columns:
+                    categories[col] = add_counts(categories.get(col), chunk[col])
+
+            total_experience = total_experience.merge(
+                Moments.of(chunk['work_experience'] + chunk['internship_experience']))
+
+            # The composite score uses the median-filled GRE, which is only known after this pass:
+            # rows without a GRE score are kept apart and shifted by the GRE term once it is
+            gpa_norm = chunk['gpa_normalized'] / 10.0
+            english_norm = chunk['english_test_normalized'] / 120.0
+            if 'gre_total' in chunk.columns:
+                has_gre = chunk['gre_total'].notna()
+                academic = 0.4 * gpa_norm + 0.3 * english_norm
+                composite = composite.merge(Moments.of((academic + 0.3 * chunk['gre_total'] / 340.0)[has_gre]))
+                composite_no_gre = composite_no_gre.merge(Moments.of(academic[~has_gre]))
+            else:
+                composite = composite.merge(Moments.of(0.6 * gpa_norm + 0.4 * english_norm))
+
+        self.columns = list(columns)
+        print(f"Data scanned: {self.n_rows} rows, {len(self.columns)} columns")
+
+        # Missing values: GRE medians; filled rows count at the median from here on
+        fill_values, label_classes, top_categories, category_groups = {}, {}, {}, {}
+        for col in GRE_COLUMNS:
+            if col in counts:
+                median = float(quantile_from_counts(counts[col], 0.5))
+                fill_values[col] = median
+                if missing[col] and not np.isnan(median):
+                    counts[col] = counts[col].add(pd.Series({median: missing[col]}), fill_value=0)
+        if 'scholarship_amount' in self.columns:
+            fill_values['scholarship_amount'] = 0
+        for col in RANK_COLUMNS:
+            if col in self.columns:
+                fill_values[col] = NO_RANK
+
+        # Label encoding: sorted classes, as LabelEncoder
+        for col in BINARY_COLUMNS:
+            if col in self.columns:
+                label_classes[col] = sorted(labels[col])
+                self.encoders[col] = label_classes[col]
+
+        # Top categories, the rest (and missing values) grouped as 'Other'
+        for col in CATEGORICAL_COLUMNS:
+            if col in categories:
+                value_counts = categories[col]
+                order = np.lexsort((value_counts.index.astype(str), -value_counts.to_numpy()))
+                top = value_counts.iloc[order].head(TOP_CATEGORIES)
+                top_categories[col] = top.index.tolist()
+                groups = set(top_categories[col])
+                if top.sum() < self.n_rows:
+                    groups.add(OTHER_CATEGORY)
+                category_groups[col] = sorted(groups)
+
+        # IQR bounds of all outlier columns at once (a quantile table like DataFrame.quantile([0.25, 0.75]))
+        # and the number of values they cap
+        outlier_cols = [col for col in OUTLIER_COLUMNS if col in counts]
+        quantiles = pd.DataFrame({col: quantile_from_counts(counts[col], [0.25, 0.75]) for col in outlier_cols},
+                                 index=[0.25, 0.75], columns=outlier_cols)
+        iqr = quantiles.loc[0.75] - quantiles.loc[0.25]
+        lower, upper = quantiles.loc[0.25] - IQR_FACTOR * iqr, quantiles.loc[0.75] + IQR_FACTOR * iqr
+        bounds = {col: [float(lower[col]), float(upper[col])] for col in outlier_cols}
+        for col, (low, high) in bounds.items():
+            values = counts[col].index.to_numpy(dtype=float)
+            self.outlier_counts[col] = int(counts[col][(values < low) | (values > high)].sum())
+
+        # Standardization of the filled and capped values
+        moments = {'total_experience': total_experience}
+        gre_median = fill_values.get('gre_total', np.nan)
+        if not np.isnan(gre_median):
+            composite = composite.merge(composite_no_gre.shift(0.3 * gre_median / 340.0))
+        moments['composite_academic_score'] = composite
+        for col, col_counts in counts.items():
+            values = col_counts.index.to_numpy(dtype=float)
+            if col in bounds:
+                values = np.clip(values, *bounds[col])
+            moments[col] = Moments.of(values, col_counts.to_numpy())
+        cols_to_scale = [col for col in SCALED_COLUMNS if col in moments]
+        scale = [moments[col].std for col in cols_to_scale]
+        scaler = {
+            'columns': cols_to_scale,
+            'mean': [float(moments[col].mean) for col in cols_to_scale],
+            'scale': [float(s) if s > 0 else 1.0 for s in scale],
+        }
+
+        self.features = FeatureBuilder(fill_values, label_classes, top_categories, category_groups, bounds, scaler)
+
+        self._print_fit_summary(missing)
+        return self
+
+    def _print_fit_summary(self, missing):
+        print("\n" + "="*80)
+        print("STEP 1: HANDLING MISSING VALUES")
+        print("="*80)
+        for col in GRE_COLUMNS:
+            if missing.get(col):
+                print(f"{col}: Filling {missing[col]} missing values with median ({self.features.fill_values[col]:.2f})")
+        if 'scholarship_amount' in self.features.fill_values:
+            print("scholarship_amount: Filling missing values with 0")
+        for col in RANK_COLUMNS:
+            if col in self.features.fill_values:
+                print(f"{col}: Filling missing values with {NO_RANK} (no rank)")
+
+        print("\n" + "="*80)
+        print("STEP 3: ENCODING CATEGORICAL VARIABLES")
+        print("="*80)
+        for col, classes in self.features.label_classes.items():
+            print(f"✓ Label encoding {col} ({len(classes)} classes)")
+        for col, dummies in self.features.dummy_columns.items():
+            print(f"✓ One-hot encoding {col} (top {TOP_CATEGORIES} + {OTHER_CATEGORY}, {len(dummies)} columns)")
+
+        print("\n" + "="*80)
+        print("STEP 4: OUTLIER DETECTION AND HANDLING")
+        print("="*80)
+        capped = {col: count for col, count in self.outlier_counts.items() if count}
+        for col, count in capped.items():
+            print(f"✓ {col}: Capping {count} outliers")
+        if not capped:
+            print("No significant outliers detected!")
+
+        print("\n" + "="*80)
+        print("STEP 5: FEATURE NORMALIZATION")
+        print("="*80)
+        print(f"✓ Standardizing {len(self.features.scaler['columns'])} numerical features")
+
+    def transform(self, chunk):
+        """Pass two: one chunk through the fitted feature builder"""
+        return self.features.transform(chunk, workers=self.workers)
+
+    def create_feature_sets(self, columns):
+        """Create different feature sets for modeling"""
+        print("\n" + "="*80)
+        print("STEP 6: CREATING FEATURE SETS")
+        print("="*80)
+
+        # Basic features (academic only)
+        basic_features = [
+            'gpa_normalized', 'english_test_normalized',
+            'gre_total', 'composite_academic_score'
+        ]
+        basic_features = [f for f in basic_features if f in columns]
+
+        # Extended features (academic + experience)
+        extended_features = basic_features + [
+            'work_experience', 'relevant_work_experience',
+            'internship_experience', 'has_publications',
+            'major_alignment'
+        ]
+        extended_features = [f for f in extended_features if f in columns]
+
+        # Full features (all engineered features)
+        full_features = [col for col in columns
+                         if col not in NON_FEATURE_COLUMNS and not col.endswith('_stripped')]
+
+        feature_sets = {
+            'basic': basic_features,
+            'extended': extended_features,
+            'full': full_features
+        }
+
+        print(f"✓ Basic feature set: {len(basic_features)} features")
+        print(f"✓ Extended feature set: {len(extended_features)} features")
+        print(f"✓ Full feature set: {len(full_features)} features")
+
+        return feature_sets
+
+    def save_processed_data(self, output_prefix='admissions_processed'):
+        """Pass two: transform chunk by chunk, appending to the CSV and JSON outputs"""
+        print("\n" + "="*80)
+        print("TRANSFORMING AND SAVING PROCESSED DATA (pass 2)")
+        print("="*80)
+
+        csv_path = f"{output_prefix}.csv"
+        json_path = f"{output_prefix}.json"
+        columns = None
+        with open(csv_path, 'w', encoding='utf-8', newline='') as csv_file, \
+                open(json_path, 'w', encoding='utf-8') as json_file:
+            json_file.write("[\n")
+            for chunk in self.iter_chunks():
+                processed = self.transform(chunk)
+                processed.to_csv(csv_file, index=False, header=columns is None)
+                records = processed.to_json(orient='records', lines=True).rstrip("\n")
+                if records:
+                    json_file.write((",\n" if columns is not None else "") + records.replace("\n", ",\n"))
+                if columns is None:
+                    columns = processed.columns.tolist()
+            json_file.write("\n]\n")
+        print(f"✓ Saved processed data to: {csv_path}")
+        print(f"✓ Saved processed data to: {json_path}")
+
+        # Save preprocessing metadata
+        metadata = {
+            'original_shape': [self.n_rows, len(self.columns)],
+            'processed_shape': [self.n_rows, len(columns or [])],
+            'new_features_count': len(columns or []) - len(self.columns),
+            'encoders': self.encoders,
+        }
+
+        metadata_path = f"{output_prefix}_metadata.json"
+        with open(metadata_path, 'w') as f:
+            json.dump(metadata, f, indent=2)
+        print(f"✓ Saved metadata to: {metadata_path}")
+
+        # The fitted feature builder, for training and serving on this data
+        self.features.save(features_path(csv_path))
+        print(f"✓ Saved feature builder to: {features_path(csv_path)}")
+
+        return csv_path, json_path, columns or []
+
+    def run_full_pipeline(self, output_prefix='admissions_processed'):
+        """Fit on the whole file, then transform it to the output files"""
+        print("\n" + "="*80)
+        print("RUNNING COMPLETE DATA PREPROCESSING PIPELINE")
+        print("="*80)
+
+        self.fit()
+        csv_path, json_path, columns = self.save_processed_data(output_prefix)
+        feature_sets = self.create_feature_sets(columns)
+
+        print("\n" + "="*80)
+        print("PREPROCESSING COMPLETE!")
+        print("="*80)
+        print(f"\nProcessed dataset shape: ({self.n_rows}, {len(columns)})")
+        print(f"Files saved: {csv_path}, {json_path}")
+
+        return feature_sets
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Preprocess the admissions decisions into admissions_processed.csv")
+    parser.add_argument('data', nargs='?', default='usa_decisions_cleaned_with_uuid.jsonl',
+                        help="Decisions JSONL file (or JSON array)")
+    parser.add_argument('--output-prefix', default='admissions_processed', help="Prefix of the output files")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help="Records per chunk")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Threads for capping and scaling column groups of large chunks")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.data):
+        parser.error(f"{args.data} not found")
+
+    preprocessor = AdmissionsDataPreprocessor(args.data, chunk_size=args.chunk_size, workers=args.workers)
+    preprocessor.run_full_pipeline(args.output_prefix)
+    print("\n✓ Data is ready for analysis and modeling!")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,7 +16,10 @@ from sklearn.impute import SimpleImputer
 import pickle
 import os
 import json
-import random
+
+from employer_affinity import EmployerAffinity
+from employer_index import EmployerIndex, SIZE_BUCKETS, US_STATES
+from feature_builder import FeatureBuilder, english_test_score, mark_missing_ranks
 
 # Page configuration
 st.set_page_config(
@@ -96,7 +99,13 @@ def load_model():
     if os.path.exists(model_path):
         with open(model_path, 'rb') as f:
             saved_data = pickle.load(f)
-            return saved_data['model'], saved_data['numeric_features'], saved_data['categorical_features']
+            if 'feature_builder' not in saved_data:
+                st.error(f"{model_path} has no fitted feature builder. Please retrain the model by running "
+                         "admissions_preprocessor.py and then university_recommender.py")
+                st.stop()
+            feature_builder = FeatureBuilder.from_dict(saved_data['feature_builder'])
+            return (saved_data['model'], saved_data['numeric_features'], saved_data['categorical_features'],
+                    feature_builder)
     else:
         st.error("Model not found. Please train the model first by running university_recommender.py")
         st.stop()
@@ -118,88 +127,64 @@ def load_employers_data():
         return None
 
 
+@st.cache_resource
+def load_employer_index(_employers_data):
+    """Build the inverted employer index once per session"""
+    if not _employers_data or 'employers' not in _employers_data:
+        return None
+    return EmployerIndex(_employers_data['employers'])
+
+
+@st.cache_resource
+def load_employer_affinity(_employers_data):
+    """Load the precomputed program-to-employer affinity matrix"""
+    if not _employers_data or 'employers' not in _employers_data:
+        return None
+    return EmployerAffinity.load_or_build(_employers_data['employers'])
+
+
 def create_user_profile(form_data):
-    """Create user profile from form data"""
+    """Create raw user profile inputs from form data"""
     profile = {}
 
     # Basic Information
     profile['application_year'] = form_data['year']
     profile['application_term'] = form_data['term']
-    profile['is_fall_term'] = 1 if form_data['term'] == 'Fall' else 0
 
     # Academic Scores
     profile['gpa_normalized'] = form_data['gpa']
     profile['gpa_missing'] = 0
 
-    # GPA Category
-    if profile['gpa_normalized'] >= 8.5:
-        profile['gpa_category'] = "Very High"
-    elif profile['gpa_normalized'] >= 7.5:
-        profile['gpa_category'] = "High"
-    elif profile['gpa_normalized'] >= 6.5:
-        profile['gpa_category'] = "Medium"
-    else:
-        profile['gpa_category'] = "Low"
-
     # English Tests
     if form_data['english_test'] == 'TOEFL':
         profile['toefl'] = form_data['english_score']
         profile['ielts'] = 0
-        profile['english_test_normalized'] = form_data['english_score'] / 120.0
     else:
         profile['ielts'] = form_data['english_score']
         profile['toefl'] = 0
-        profile['english_test_normalized'] = form_data['english_score'] / 9.0
-
+    profile['english_test_normalized'] = english_test_score(form_data['english_test'], form_data['english_score'])
     profile['english_missing'] = 0
 
-    # English proficiency category
-    if profile['english_test_normalized'] >= 0.85:
-        profile['english_proficiency'] = "High"
-    elif profile['english_test_normalized'] >= 0.70:
-        profile['english_proficiency'] = "Medium"
-    else:
-        profile['english_proficiency'] = "Low"
-
     # GRE Scores
     if form_data['has_gre']:
         profile['gre_verbal'] = form_data['gre_verbal']
         profile['gre_quant'] = form_data['gre_quant']
         profile['gre_awa'] = form_data['gre_awa']
         profile['gre_total'] = profile['gre_verbal'] + profile['gre_quant']
-        profile['gre_missing'] = "False"
-
-        if profile['gre_total'] >= 320:
-            profile['gre_strength'] = "High"
-        elif profile['gre_total'] >= 310:
-            profile['gre_strength'] = "Medium"
-        else:
-            profile['gre_strength'] = "Low"
+        profile['gre_missing'] = False
     else:
-        profile['gre_verbal'] = 0
-        profile['gre_quant'] = 0
-        profile['gre_awa'] = 0
-        profile['gre_total'] = 0
-        profile['gre_missing'] = "True"
-        profile['gre_strength'] = "Low"
+        # Missing scores are filled like in training
+        for gre_col in ['gre_verbal', 'gre_quant', 'gre_awa', 'gre_total']:
+            profile[gre_col] = np.nan
+        profile['gre_missing'] = True
 
     # Experience
     profile['work_experience'] = form_data['work_exp']
     profile['relevant_work_experience'] = form_data['work_exp'] * 0.7
     profile['internship_experience'] = form_data['intern_exp']
-    profile['total_experience'] = form_data['work_exp'] + form_data['intern_exp']
-
-    # Experience category
-    if profile['total_experience'] >= 36:
-        profile['experience_category'] = "High"
-    elif profile['total_experience'] >= 12:
-        profile['experience_category'] = "Medium"
-    else:
-        profile['experience_category'] = "Low"
 
     # Publications
     profile['publications'] = form_data['publications']
-    profile['has_publications'] = 1 if form_data['publications'] > 0 else 0
 
     # Academic Background
     profile['undergrad_major'] = form_data['ug_major']
@@ -212,103 +197,73 @@ def create_user_profile(form_data):
     profile['target_degree'] = form_data['degree_type']
     profile['credential'] = f"M.S. in {form_data['target_program']}"
     profile['credential_standardized'] = "Masters (Technical)"
-
-    # Calculated features
     profile['major_alignment'] = 1 if profile['ug_major_bucket'] == profile['categorical_course_name'] else 0
-    profile['academic_alignment_score'] = profile['major_alignment']
-    profile['composite_academic_score'] = (profile['gpa_normalized'] / 10.0 + profile['english_test_normalized']) / 2
 
     # Default values
     profile['student_type'] = 'International'
-    profile['student_type_encoded'] = 0
-    profile['has_scholarship'] = 'False'
-    profile['has_scholarship_encoded'] = 0
+    profile['has_scholarship'] = False
     profile['scholarship_amount'] = 0
-    profile['application_term_encoded'] = 0 if profile['is_fall_term'] == 1 else 1
     profile['undergrad_missing'] = 0
 
     # Rank columns
     for rank_col in ['cs_rank', 'eng_rank', 'mba_rank', 'gen_rank']:
         profile[rank_col] = np.nan
-        profile[f'{rank_col}_missing'] = 1
 
     # Additional categorical features
     profile['university_name_stripped'] = 'Unknown'
     profile['undergrad_canonical'] = profile['undergrad_university']
     profile['undergrad_canonical_stripped'] = profile['undergrad_university']
     profile['stripped_name'] = profile['undergrad_university'].lower().replace(' ', '')
-    profile['university_tier'] = 'Unknown'
-    profile['credential_standardized_grouped'] = 'Masters'
-    profile['categorical_course_name_grouped'] = profile['categorical_course_name']
-    profile['ug_major_bucket_grouped'] = profile['ug_major_bucket']
-
-    # Binary flags for credentials
-    for cred_type in ['Bachelors', 'Doctoral', 'Graduate Certificate', 'Masters (Professional)', 'Masters (Technical)', 'Other']:
-        profile[f'credential_standardized_{cred_type}'] = 1 if cred_type == 'Masters (Technical)' else 0
-
-    # Binary flags for course buckets
-    for course_bucket in ['Bio_Biomed_Health_LifeSci', 'Business_Management_Finance',
-                          'Chemical_Materials_Petroleum', 'Civil_Construction_Env_Arch',
-                          'Computer_Science_Software', 'Data_Science_AI_Machine_Learning',
-                          'Electrical_Electronics_ECE', 'Humanities_Social_Design_Arts',
-                          'Mechanical_Industrial_Aero', 'Other']:
-        profile[f'categorical_course_name_{course_bucket}'] = 1 if profile['categorical_course_name'] == course_bucket else 0
-
-    # Binary flags for UG major buckets
-    for ug_bucket in ['Bio_Biomed_Health_LifeSci', 'Business_Management_Finance',
-                      'Chemical_Materials_Petroleum', 'Civil_Construction_Env_Arch',
-                      'Computer_Science_Software', 'Data_Science_AI_Machine_Learning',
-                      'Electrical_Electronics_ECE', 'Humanities_Social_Design_Arts',
-                      'Mechanical_Industrial_Aero', 'Other']:
-        profile[f'ug_major_bucket_{ug_bucket}'] = 1 if profile['ug_major_bucket'] == ug_bucket else 0
 
     return profile
 
 
-def predict_universities(model, numeric_features, categorical_features, user_profile, top_n=30):
+def build_features(feature_builder, profiles):
+    """Model features of a DataFrame of raw profiles, built as in training"""
+    return mark_missing_ranks(feature_builder.transform(profiles))
+
+
+def predict_universities(model, numeric_features, categorical_features, feature_builder, user_profile, top_n=30):
     """Predict admission probability for universities"""
     df = pd.read_csv('admissions_processed.csv', low_memory=False)
     universities = df['university_name'].value_counts().head(top_n).index.tolist()
 
-    results = []
-
-    for uni in universities:
-        profile = user_profile.copy()
-        profile['university_name'] = uni
-
-        # Get university tier
-        uni_data = df[df['university_name'] == uni]
-        if len(uni_data) > 0 and 'university_tier' in uni_data.columns:
-            profile['university_tier'] = uni_data['university_tier'].mode()[0] if len(uni_data['university_tier'].mode()) > 0 else 'Unknown'
-
-        # Create DataFrame
-        profile_df = pd.DataFrame([profile])
-
-        # Ensure all features present
-        for feat in numeric_features:
-            if feat not in profile_df.columns:
-                profile_df[feat] = 0
-
-        for feat in categorical_features:
-            if feat not in profile_df.columns:
-                profile_df[feat] = 'Unknown'
-
-        # Reorder columns
-        all_features = list(numeric_features) + list(categorical_features)
-        profile_df = profile_df[all_features]
-
-        # Predict
-        try:
-            prob = model.predict_proba(profile_df)[0, 1]
-            results.append({
-                'university_name': uni,
-                'university_tier': profile['university_tier'],
-                'admission_probability': prob
-            })
-        except:
-            continue
-
-    results_df = pd.DataFrame(results)
+    # Get university tier
+    tiers = {}
+    if 'university_tier' in df.columns:
+        tiers = (df[df['university_name'].isin(universities)]
+                 .groupby('university_name')['university_tier']
+                 .agg(lambda s: s.mode()[0] if len(s.mode()) > 0 else 'Unknown')
+                 .to_dict())
+    university_tiers = [tiers.get(uni, 'Unknown') for uni in universities]
+
+    # One row per university, features built and scored in one batch
+    profiles = pd.DataFrame([user_profile] * len(universities))
+    profiles['university_name'] = universities
+    profile_df = build_features(feature_builder, profiles)
+    profile_df['university_tier'] = university_tiers
+
+    # Ensure all features present
+    for feat in numeric_features:
+        if feat not in profile_df.columns:
+            profile_df[feat] = 0
+
+    for feat in categorical_features:
+        if feat not in profile_df.columns:
+            profile_df[feat] = 'Unknown'
+
+    # Reorder columns
+    all_features = list(numeric_features) + list(categorical_features)
+    profile_df = profile_df[all_features]
+    profile_df[list(categorical_features)] = profile_df[list(categorical_features)].astype(str)
+
+    # Predict
+    results_df = pd.DataFrame({'university_name': universities, 'university_tier': university_tiers})
+    try:
+        results_df['admission_probability'] = model.predict_proba(profile_df)[:, 1]
+    except Exception:
+        results_df = results_df.iloc[0:0].assign(admission_probability=[])
+
     results_df = results_df.sort_values('admission_probability', ascending=False)
 
     return results_df
@@ -364,29 +319,68 @@ def categorize_buckets(results_df):
     return results_df
 
 
-def get_random_employers(employers_data, num=4):
-    """Get random top employers"""
-    if not employers_data or 'employers' not in employers_data:
+def get_top_recruiters(employer_affinity, program_bucket, num=4, university=None):
+    """Get the top recruiters for a program bucket (varied per university)"""
+    if employer_affinity is None:
         return []
 
-    employers_list = employers_data['employers']
-
-    def parse_followers(follower_str):
-        try:
-            num_str = follower_str.split()[0].replace(',', '')
-            if 'M' in num_str:
-                return int(float(num_str.replace('M', '')) * 1000000)
-            elif 'K' in num_str:
-                return int(float(num_str.replace('K', '')) * 1000)
-            else:
-                return int(num_str)
-        except:
-            return 0
-
-    sorted_employers = sorted(employers_list, key=lambda x: parse_followers(x['followers']), reverse=True)
-    top_100 = sorted_employers[:100]
-
-    return random.sample(top_100, min(num, len(top_100)))
+    return employer_affinity.top_k(program_bucket, k=num, key=university)
+
+
+def render_employer_explorer(employer_index):
+    """Filterable recruiter panel backed by the employer index"""
+    st.header("💼 Employer Explorer")
+
+    if employer_index is None:
+        st.info("Handshake employers data not found - run the scraper in Handshake_Events/ first.")
+        return
+
+    st.markdown(f"Search **{len(employer_index):,} employers** by industry, state, company size and type.")
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        industries = st.multiselect(
+            "Industry", [value for value, _ in employer_index.values('industry')]
+        )
+    with col2:
+        states = st.multiselect(
+            "State", [value for value, _ in employer_index.values('state')],
+            format_func=lambda code: f"{code} - {US_STATES.get(code, code)}"
+        )
+    with col3:
+        available_sizes = {value for value, _ in employer_index.values('size')}
+        sizes = st.multiselect("Company Size", [s for s in SIZE_BUCKETS if s in available_sizes])
+    with col4:
+        company_types = st.multiselect(
+            "Company Type", [value for value, _ in employer_index.values('type')]
+        )
+
+    per_page = 25
+    _, total = employer_index.query(industries, states, sizes, company_types, per_page=per_page)
+    num_pages = max((total + per_page - 1) // per_page, 1)
+    page = st.number_input("Page", min_value=1, max_value=num_pages, value=1, step=1)
+
+    employers, total = employer_index.query(industries, states, sizes, company_types,
+                                            page=page, per_page=per_page)
+
+    st.caption(f"{total:,} matching employers - page {page} of {num_pages}, ranked by followers")
+
+    if employers:
+        st.dataframe(
+            pd.DataFrame(employers)[['name', 'industry', 'followers', 'location', 'size', 'type']]
+            .rename(columns={
+                'name': 'Employer',
+                'industry': 'Industry',
+                'followers': 'Followers',
+                'location': 'Location',
+                'size': 'Size',
+                'type': 'Type'
+            }),
+            hide_index=True,
+            use_container_width=True
+        )
+    else:
+        st.info("No employers match these filters.")
 
 
 def main():
@@ -396,11 +390,18 @@ def main():
 
     # Load model and data
     with st.spinner("Loading ML model..."):
-        model, numeric_features, categorical_features = load_model()
+        model, numeric_features, categorical_features, feature_builder = load_model()
         employers_data = load_employers_data()
+        employer_index = load_employer_index(employers_data)
+        employer_affinity = load_employer_affinity(employers_data)
 
     st.success("✓ Model loaded successfully!")
 
+    view = st.sidebar.radio("View", ["🎓 Recommendations", "💼 Employer Explorer"], horizontal=True)
+    if view == "💼 Employer Explorer":
+        render_employer_explorer(employer_index)
+        return
+
     # Sidebar - User Input
     st.sidebar.header("📝 Student Profile")
 
@@ -487,32 +488,34 @@ def main():
         # Create profile
         with st.spinner("Creating your profile..."):
             user_profile = create_user_profile(form_data)
+            features = build_features(feature_builder, pd.DataFrame([user_profile])).iloc[0]
 
         # Display profile summary
         st.header("📊 Your Profile Summary")
         col1, col2, col3, col4 = st.columns(4)
 
         with col1:
-            st.metric("GPA", f"{user_profile['gpa_normalized']:.2f}/10", user_profile['gpa_category'])
+            st.metric("GPA", f"{user_profile['gpa_normalized']:.2f}/10", features['gpa_category'])
 
         with col2:
             if english_test == "TOEFL":
-                st.metric("TOEFL", f"{user_profile['toefl']:.0f}/120", user_profile['english_proficiency'])
+                st.metric("TOEFL", f"{user_profile['toefl']:.0f}/120", features['english_proficiency'])
             else:
-                st.metric("IELTS", f"{user_profile['ielts']:.1f}/9", user_profile['english_proficiency'])
+                st.metric("IELTS", f"{user_profile['ielts']:.1f}/9", features['english_proficiency'])
 
         with col3:
             if has_gre:
-                st.metric("GRE", f"{user_profile['gre_total']:.0f}/340", user_profile['gre_strength'])
+                st.metric("GRE", f"{user_profile['gre_total']:.0f}/340", features['gre_strength'])
             else:
                 st.metric("GRE", "Not Provided", "")
 
         with col4:
-            st.metric("Experience", f"{user_profile['total_experience']:.0f} months", user_profile['experience_category'])
+            st.metric("Experience", f"{user_profile['work_experience'] + user_profile['internship_experience']:.0f} months", features['experience_category'])
 
         # Predict universities
         with st.spinner("Analyzing top 30 universities..."):
-            results_df = predict_universities(model, numeric_features, categorical_features, user_profile, top_n=30)
+            results_df = predict_universities(model, numeric_features, categorical_features, feature_builder,
+                                              user_profile, top_n=30)
             results_df = categorize_buckets(results_df)
 
         # Display statistics
@@ -567,8 +570,9 @@ def main():
                             st.markdown(f"<h3 style='color: {prob_color}; text-align: right;'>{row['admission_probability']:.1%}</h3>", unsafe_allow_html=True)
 
                         # Show employers
-                        if employers_data:
-                            employers = get_random_employers(employers_data, num=random.randint(3, 4))
+                        if employer_affinity is not None:
+                            employers = get_top_recruiters(employer_affinity, user_profile['categorical_course_name'],
+                                                          university=row['university_name'])
                             if employers:
                                 st.markdown("**💼 Top Recruiters:**")
                                 for emp in employers:
@@ -18,9 +18,10 @@ import os
 
 # Import the recommender class
 from university_recommender import UniversityRecommender
+from feature_builder import english_test_score
 
 def create_sample_profile():
-    """Create a sample student profile"""
+    """Create a sample student profile (raw inputs; derived features come from the feature builder)"""
     print("\n" + "="*80)
     print("🎓 DEMO MODE - Using Pre-filled Sample Profile")
     print("="*80)
@@ -28,28 +29,21 @@ def create_sample_profile():
     profile = {
         'application_year': 2025,
         'application_term': 'Fall',
-        'is_fall_term': 1,
         'gpa_normalized': 8.5,
         'gpa_missing': 0,
-        'gpa_category': 'Very High',
         'toefl': 105,
         'ielts': 0,
-        'english_test_normalized': 105 / 120.0,
+        'english_test_normalized': english_test_score('TOEFL', 105),
         'english_missing': 0,
-        'english_proficiency': 'High',
         'gre_verbal': 162,
         'gre_quant': 168,
         'gre_awa': 4.0,
         'gre_total': 330,
-        'gre_missing': 'False',
-        'gre_strength': 'High',
+        'gre_missing': False,
         'work_experience': 12,
         'relevant_work_experience': 8.4,
         'internship_experience': 3,
-        'total_experience': 15,
-        'experience_category': 'Medium',
         'publications': 0,
-        'has_publications': 0,
         'undergrad_major': 'Computer Science',
         'undergrad_university': 'IIT Bombay',
         'ug_major_bucket': 'Computer_Science_Software',
@@ -59,49 +53,19 @@ def create_sample_profile():
         'credential': 'M.S. in Computer Science',
         'credential_standardized': 'Masters (Technical)',
         'major_alignment': 1,
-        'academic_alignment_score': 1,
-        'composite_academic_score': (8.5 / 10.0 + 105 / 120.0) / 2,
         'student_type': 'International',
-        'student_type_encoded': 0,
-        'has_scholarship': 'False',
-        'has_scholarship_encoded': 0,
+        'has_scholarship': False,
         'scholarship_amount': 0,
-        'application_term_encoded': 0,
         'undergrad_missing': 0,
         'university_name_stripped': 'Unknown',
         'undergrad_canonical': 'IIT Bombay',
         'undergrad_canonical_stripped': 'IIT Bombay',
         'stripped_name': 'iitbombay',
-        'university_tier': 'Unknown',
-        'credential_standardized_grouped': 'Masters',
-        'categorical_course_name_grouped': 'Computer_Science_Software',
-        'ug_major_bucket_grouped': 'Computer_Science_Software',
     }
 
     # Rank columns
     for rank_col in ['cs_rank', 'eng_rank', 'mba_rank', 'gen_rank']:
         profile[rank_col] = np.nan
-        profile[f'{rank_col}_missing'] = 1
-
-    # Binary flags for credentials
-    for cred_type in ['Bachelors', 'Doctoral', 'Graduate Certificate', 'Masters (Professional)', 'Masters (Technical)', 'Other']:
-        profile[f'credential_standardized_{cred_type}'] = 1 if cred_type == 'Masters (Technical)' else 0
-
-    # Binary flags for course buckets
-    for course_bucket in ['Bio_Biomed_Health_LifeSci', 'Business_Management_Finance',
-                          'Chemical_Materials_Petroleum', 'Civil_Construction_Env_Arch',
-                          'Computer_Science_Software', 'Data_Science_AI_Machine_Learning',
-                          'Electrical_Electronics_ECE', 'Humanities_Social_Design_Arts',
-                          'Mechanical_Industrial_Aero', 'Other']:
-        profile[f'categorical_course_name_{course_bucket}'] = 1 if course_bucket == 'Computer_Science_Software' else 0
-
-    # Binary flags for UG major buckets
-    for ug_bucket in ['Bio_Biomed_Health_LifeSci', 'Business_Management_Finance',
-                      'Chemical_Materials_Petroleum', 'Civil_Construction_Env_Arch',
-                      'Computer_Science_Software', 'Data_Science_AI_Machine_Learning',
-                      'Electrical_Electronics_ECE', 'Humanities_Social_Design_Arts',
-                      'Mechanical_Industrial_Aero', 'Other']:
-        profile[f'ug_major_bucket_{ug_bucket}'] = 1 if ug_bucket == 'Computer_Science_Software' else 0
 
     return profile
 
@@ -126,15 +90,16 @@ def main():
 
     # Create sample profile
     user_profile = create_sample_profile()
+    features = recommender.build_features(pd.DataFrame([user_profile])).iloc[0]
 
     # Display profile
     print("\n" + "="*80)
     print("📊 SAMPLE STUDENT PROFILE")
     print("="*80)
-    print(f"GPA: {user_profile['gpa_normalized']:.2f}/10 ({user_profile['gpa_category']})")
-    print(f"English: TOEFL {user_profile['toefl']:.0f} ({user_profile['english_proficiency']})")
-    print(f"GRE: V{user_profile['gre_verbal']:.0f} + Q{user_profile['gre_quant']:.0f} + AWA{user_profile['gre_awa']:.1f} = {user_profile['gre_total']:.0f} ({user_profile['gre_strength']})")
-    print(f"Experience: {user_profile['total_experience']:.0f} months ({user_profile['experience_category']})")
+    print(f"GPA: {user_profile['gpa_normalized']:.2f}/10 ({features['gpa_category']})")
+    print(f"English: TOEFL {user_profile['toefl']:.0f} ({features['english_proficiency']})")
+    print(f"GRE: V{user_profile['gre_verbal']:.0f} + Q{user_profile['gre_quant']:.0f} + AWA{user_profile['gre_awa']:.1f} = {user_profile['gre_total']:.0f} ({features['gre_strength']})")
+    print(f"Experience: {user_profile['work_experience'] + user_profile['internship_experience']:.0f} months ({features['experience_category']})")
     print(f"Publications: {user_profile['publications']}")
     print(f"UG Major: {user_profile['undergrad_major']} from {user_profile['undergrad_university']}")
     print(f"Target: {user_profile['course_name']} ({user_profile['target_degree']})")
@@ -149,7 +114,7 @@ def main():
     results_df = recommender.categorize_into_buckets(results_df)
 
     # Display recommendations
-    recommender.display_recommendations(results_df)
+    recommender.display_recommendations(results_df, user_profile['categorical_course_name'])
 
     # Save results
     filename = f"demo_recommendations_{user_profile['application_year']}.csv"
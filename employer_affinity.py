@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Program-to-Employer Affinity Matrix
+Offline job that scores every Handshake employer against each program bucket
+(categorical_course_name) so recruiter suggestions become a top-k lookup
+"""
+
+import argparse
+import json
+import os
+import zlib
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from employer_index import parse_followers
+
+
+# Handshake industries each program bucket mainly feeds into; employers in them
+# rank first for the bucket (core tier).
+PROGRAM_CORE_INDUSTRIES = {
+    'Computer_Science_Software': ['Internet & Software', 'Information Technology', 'Computer Networking'],
+    'Data_Science_AI_Machine_Learning': ['Internet & Software', 'Information Technology', 'Research',
+                                         'Scientific and Technical Consulting'],
+    'Electrical_Electronics_ECE': ['Electronic & Computer Hardware', 'Telecommunications', 'Computer Networking'],
+    'Mechanical_Industrial_Aero': ['Manufacturing', 'Aerospace', 'Automotive', 'Defense'],
+    'Business_Management_Finance': ['Financial Services', 'Accounting', 'Investment Banking',
+                                    'Investment / Portfolio Management', 'Commercial Banking & Credit',
+                                    'Management Consulting'],
+    'Bio_Biomed_Health_LifeSci': ['Healthcare', 'Biotech & Life Sciences', 'Pharmaceuticals', 'Medical Devices'],
+    'Chemical_Materials_Petroleum': ['Oil & Gas', 'Energy', 'Natural Resources', 'CPG - Consumer Packaged Goods'],
+    'Civil_Construction_Env_Arch': ['Civil Engineering', 'Engineering & Construction', 'Construction',
+                                    'Architecture and Planning', 'Environmental Services'],
+    'Humanities_Social_Design_Arts': ['Design', 'Journalism, Media & Publishing', 'Performing and Fine Arts',
+                                      'Movies, TV, Music, Gaming', 'Advertising, PR & Marketing'],
+    'Other': [],
+}
+
+# Wider industry vocabulary each program bucket feeds into. The text is matched
+# against the Handshake "industry" field with TF-IDF; employers outside the core
+# industries with at least RELATED_SIMILARITY rank next (related tier).
+PROGRAM_BUCKET_TEXT = {
+    'Computer_Science_Software': 'internet software information technology computer networking '
+                                 'electronic computer hardware telecommunications',
+    'Data_Science_AI_Machine_Learning': 'internet software information technology research '
+                                        'financial services investment portfolio management '
+                                        'management consulting scientific technical consulting',
+    'Electrical_Electronics_ECE': 'electronic computer hardware telecommunications computer networking '
+                                  'utilities renewable energy defense aerospace',
+    'Mechanical_Industrial_Aero': 'manufacturing aerospace automotive defense engineering construction '
+                                  'energy oil gas transportation logistics',
+    'Business_Management_Finance': 'financial services accounting investment banking management consulting '
+                                   'commercial banking credit insurance portfolio management sales marketing',
+    'Bio_Biomed_Health_LifeSci': 'healthcare biotech life sciences pharmaceuticals medical devices '
+                                 'research veterinary',
+    'Chemical_Materials_Petroleum': 'oil gas energy natural resources manufacturing pharmaceuticals '
+                                    'cpg consumer packaged goods',
+    'Civil_Construction_Env_Arch': 'civil engineering construction architecture planning '
+                                   'environmental services real estate utilities',
+    'Humanities_Social_Design_Arts': 'design journalism media publishing performing fine arts movies tv '
+                                     'music gaming advertising pr marketing fashion non-profit ngo '
+                                     'social assistance education',
+    'Other': '',
+}
+
+RELATED_SIMILARITY = 0.1
+CORE_TIER, RELATED_TIER = 2, 1
+
+# Recruiters shown per university are a window into this many top candidates,
+# so different universities don't all repeat the same list
+ROTATION_POOL = 40
+
+DEFAULT_AFFINITY_PATH = 'models/employer_affinity.npz'
+
+
+def build_affinity_matrix(employers, top_k=200):
+    """Compute the program-bucket x employer affinity matrix.
+
+    Affinity is tier + prominence: the tier is 2 for the bucket's core industries,
+    1 for industries whose TF-IDF similarity to the bucket text reaches
+    RELATED_SIMILARITY and 0 otherwise; prominence is log followers scaled to
+    [0, 1]. Candidates are ranked by tier, then prominence, so the core industry
+    always comes first. Buckets without industries ('Other') rank by prominence alone.
+    Returns (buckets, links, scores, top_indices).
+    """
+    buckets = list(PROGRAM_BUCKET_TEXT.keys())
+    links = [emp.get('link', '') for emp in employers]
+    industries = [emp.get('industry', '') or '' for emp in employers]
+
+    vectorizer = TfidfVectorizer(stop_words='english', token_pattern=r'(?u)\b[a-zA-Z][a-zA-Z-]+\b')
+    vectorizer.fit(industries + list(PROGRAM_BUCKET_TEXT.values()))
+    employer_vecs = vectorizer.transform(industries)
+    bucket_vecs = vectorizer.transform(list(PROGRAM_BUCKET_TEXT.values()))
+
+    # Rows are L2-normalized by TfidfVectorizer, so the dot product is the cosine similarity
+    similarity = (bucket_vecs @ employer_vecs.T).toarray()
+
+    tiers = np.where(similarity >= RELATED_SIMILARITY, RELATED_TIER, 0)
+    employer_industries = np.array([industry.strip().lower() for industry in industries])
+    for i, bucket in enumerate(buckets):
+        core = [industry.lower() for industry in PROGRAM_CORE_INDUSTRIES.get(bucket, [])]
+        tiers[i, np.isin(employer_industries, core)] = CORE_TIER
+
+    followers = np.array([parse_followers(emp.get('followers', '')) for emp in employers], dtype=np.float64)
+    prominence = np.log1p(followers)
+    if prominence.max() > 0:
+        prominence /= prominence.max()
+
+    scores = (tiers + prominence[np.newaxis, :]).astype(np.float32)
+
+    # Precompute the ranked candidates per bucket (tier first, then prominence) so request time is a slice
+    k = min(top_k, scores.shape[1])
+    top_indices = np.stack([
+        np.lexsort((-prominence, -tiers[i]))[:k] for i in range(len(buckets))
+    ]).astype(np.int32)
+
+    return buckets, links, scores, top_indices
+
+
+def save_affinity_matrix(output_path, buckets, links, scores, top_indices):
+    """Save the affinity matrix and ranked candidates to a compressed .npz file"""
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    np.savez_compressed(
+        output_path,
+        buckets=np.array(buckets),
+        links=np.array(links),
+        scores=scores,
+        top_indices=top_indices,
+    )
+
+
+class EmployerAffinity:
+    """Request-time top-k recruiter lookup over a precomputed affinity matrix"""
+
+    def __init__(self, employers, buckets, links, scores, top_indices):
+        self.buckets = list(buckets)
+        self.bucket_rows = {bucket: i for i, bucket in enumerate(self.buckets)}
+        self.scores = scores
+        self.top_indices = top_indices
+
+        # Map matrix columns back to the employer records by profile link
+        by_link = {emp.get('link', ''): emp for emp in employers}
+        self.column_employers = [by_link.get(link) for link in links]
+
+    @classmethod
+    def load_or_build(cls, employers, affinity_path=DEFAULT_AFFINITY_PATH):
+        """Load the offline matrix, or build it in memory if it doesn't exist yet"""
+        if os.path.exists(affinity_path):
+            data = np.load(affinity_path, allow_pickle=False)
+            return cls(employers, data['buckets'].tolist(), data['links'].tolist(),
+                       data['scores'], data['top_indices'])
+        return cls(employers, *build_affinity_matrix(employers))
+
+    def top_k(self, program_bucket, k=4, key=None):
+        """Return k employers with the highest affinity for a program bucket.
+
+        With a key (e.g. the university name), the k employers are a window into
+        the top ROTATION_POOL candidates picked by a stable hash of the key, so
+        each university gets its own, still top-ranked, recruiters.
+        """
+        row = self.bucket_rows.get(program_bucket, self.bucket_rows.get('Other'))
+        if row is None:
+            return []
+
+        candidates = [self.column_employers[col] for col in self.top_indices[row]]
+        candidates = [emp for emp in candidates if emp is not None]
+        start = 0
+        if key is not None and k > 0:
+            windows = max(1, min(len(candidates), ROTATION_POOL) // k)
+            start = zlib.crc32(str(key).encode('utf-8')) % windows * k
+        return candidates[start:start + k]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the program-to-employer affinity matrix")
+    parser.add_argument('--employers', default='Handshake_Events/handshake_employers_data.json',
+                        help="Scraped Handshake employers JSON file")
+    parser.add_argument('--output', default=DEFAULT_AFFINITY_PATH,
+                        help="Where to write the affinity matrix (.npz)")
+    parser.add_argument('--top-k', type=int, default=200,
+                        help="Ranked candidates to precompute per program bucket")
+    args = parser.parse_args()
+
+    with open(args.employers, 'r', encoding='utf-8') as f:
+        employers = json.load(f)['employers']
+    print(f"Loaded {len(employers)} employers from {args.employers}")
+
+    buckets, links, scores, top_indices = build_affinity_matrix(employers, top_k=args.top_k)
+    save_affinity_matrix(args.output, buckets, links, scores, top_indices)
+    print(f"✓ Saved {scores.shape[0]} x {scores.shape[1]} affinity matrix to {args.output}")
+
+    affinity = EmployerAffinity(employers, buckets, links, scores, top_indices)
+    for bucket in buckets:
+        names = ", ".join(emp['name'] for emp in affinity.top_k(bucket, k=4))
+        print(f"  {bucket}: {names}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Employer Search Index
+Inverted indexes over the Handshake employer list for fast filtered queries
+(industry, US state, company size bucket, company type) ranked by followers
+"""
+
+import json
+import re
+
+
+# Company size buckets as they appear on Handshake employer cards (smallest first)
+SIZE_BUCKETS = [
+    '1 - 10', '10 - 50', '50 - 100', '100 - 250', '250 - 1,000',
+    '1,000 - 5,000', '5,000 - 10,000', '10,000 - 25,000', '25,000+'
+]
+
+US_STATES = {
+    'AL': 'Alabama', 'AK': 'Alaska', 'AZ': 'Arizona', 'AR': 'Arkansas', 'CA': 'California',
+    'CO': 'Colorado', 'CT': 'Connecticut', 'DE': 'Delaware', 'DC': 'District of Columbia',
+    'FL': 'Florida', 'GA': 'Georgia', 'HI': 'Hawaii', 'ID': 'Idaho', 'IL': 'Illinois',
+    'IN': 'Indiana', 'IA': 'Iowa', 'KS': 'Kansas', 'KY': 'Kentucky', 'LA': 'Louisiana',
+    'ME': 'Maine', 'MD': 'Maryland', 'MA': 'Massachusetts', 'MI': 'Michigan', 'MN': 'Minnesota',
+    'MS': 'Mississippi', 'MO': 'Missouri', 'MT': 'Montana', 'NE': 'Nebraska', 'NV': 'Nevada',
+    'NH': 'New Hampshire', 'NJ': 'New Jersey', 'NM': 'New Mexico', 'NY': 'New York',
+    'NC': 'North Carolina', 'ND': 'North Dakota', 'OH': 'Ohio', 'OK': 'Oklahoma', 'OR': 'Oregon',
+    'PA': 'Pennsylvania', 'RI': 'Rhode Island', 'SC': 'South Carolina', 'SD': 'South Dakota',
+    'TN': 'Tennessee', 'TX': 'Texas', 'UT': 'Utah', 'VT': 'Vermont', 'VA': 'Virginia',
+    'WA': 'Washington', 'WV': 'West Virginia', 'WI': 'Wisconsin', 'WY': 'Wyoming',
+    'PR': 'Puerto Rico'
+}
+
+_STATE_NAME_TO_CODE = {name.lower(): code for code, name in US_STATES.items()}
+_STATE_CODE_PATTERN = re.compile(r'\b([A-Z]{2})\b')
+
+
+def parse_followers(follower_str):
+    """Parse a follower string like '36.2K followers' into an integer"""
+    try:
+        num_str = follower_str.split()[0].replace(',', '')
+        if 'M' in num_str:
+            return int(float(num_str.replace('M', '')) * 1000000)
+        elif 'K' in num_str:
+            return int(float(num_str.replace('K', '')) * 1000)
+        else:
+            return int(num_str)
+    except (AttributeError, IndexError, ValueError):
+        return 0
+
+
+def parse_state(location):
+    """Extract a two-letter US state code from a location string, or None"""
+    if not location:
+        return None
+
+    # Most locations look like "Seattle, WA" - prefer the part after the last comma
+    tail = location.rsplit(',', 1)[-1].strip()
+    if len(tail) == 2 and tail.upper() in US_STATES:
+        return tail.upper()
+    if tail.lower() in _STATE_NAME_TO_CODE:
+        return _STATE_NAME_TO_CODE[tail.lower()]
+
+    # Fall back to the last standalone state code anywhere in the string
+    for code in reversed(_STATE_CODE_PATTERN.findall(location)):
+        if code in US_STATES:
+            return code
+    return None
+
+
+def parse_size_bucket(size):
+    """Normalize a company size string to one of SIZE_BUCKETS, or None"""
+    if not size:
+        return None
+    normalized = re.sub(r'\s*-\s*', ' - ', size.strip())
+    return normalized if normalized in SIZE_BUCKETS else None
+
+
+class EmployerIndex:
+    """Precomputed inverted indexes over the employer list.
+
+    Employers are ranked once by follower count; each posting list holds
+    employer ranks in ascending order, so intersecting posting lists keeps
+    results ranked by followers without re-sorting at query time.
+    """
+
+    FIELDS = ('industry', 'state', 'size', 'type')
+
+    def __init__(self, employers):
+        self.employers = sorted(employers, key=lambda e: parse_followers(e.get('followers', '')),
+                                reverse=True)
+        self.indexes = {field: {} for field in self.FIELDS}
+
+        for rank, emp in enumerate(self.employers):
+            keys = {
+                'industry': emp.get('industry') or None,
+                'state': parse_state(emp.get('location', '')),
+                'size': parse_size_bucket(emp.get('size', '')),
+                'type': emp.get('type') or None,
+            }
+            for field, value in keys.items():
+                if value is not None:
+                    self.indexes[field].setdefault(value, []).append(rank)
+
+    @classmethod
+    def from_json(cls, employers_path):
+        """Build the index from a scraped Handshake employers JSON file"""
+        with open(employers_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data.get('employers', []))
+
+    def __len__(self):
+        return len(self.employers)
+
+    def values(self, field):
+        """Return (value, count) pairs for a field, most common first"""
+        postings = self.indexes[field]
+        return sorted(((value, len(ranks)) for value, ranks in postings.items()),
+                      key=lambda item: (-item[1], item[0]))
+
+    def _postings(self, field, value):
+        """Posting list for one value or the merged list for several values"""
+        if isinstance(value, (list, tuple, set)):
+            if len(value) == 1:
+                return self.indexes[field].get(next(iter(value)), [])
+            merged = set()
+            for v in value:
+                merged.update(self.indexes[field].get(v, []))
+            return sorted(merged)
+        return self.indexes[field].get(value, [])
+
+    def query(self, industry=None, state=None, size=None, company_type=None, page=1, per_page=25):
+        """Filter employers and return one page of results ranked by followers.
+
+        Each filter accepts a single value or a list of values (matched as OR);
+        filters are combined with AND. Returns (employers, total_matches).
+        """
+        filters = [
+            (field, value) for field, value in
+            (('industry', industry), ('state', state), ('size', size), ('type', company_type))
+            if value
+        ]
+
+        if filters:
+            postings = sorted((self._postings(field, value) for field, value in filters), key=len)
+            ranks = postings[0]
+            for other in postings[1:]:
+                if not ranks:
+                    break
+                other_set = set(other)
+                ranks = [r for r in ranks if r in other_set]
+        else:
+            ranks = range(len(self.employers))
+
+        total = len(ranks)
+        start = max(page - 1, 0) * per_page
+        return [self.employers[r] for r in ranks[start:start + per_page]], total
+
+    def top(self, n=100):
+        """Return the n employers with the most followers"""
+        return self.employers[:n]
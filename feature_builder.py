@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Feature Builder
+The derived features of an admissions record (missing-value fills, GPA /
+English / GRE / experience bins, composite academic score, label codes,
+grouped categories and their one-hot flags, IQR outlier caps and
+standardization) as one fitted transformer.
+admissions_preprocessor.py fits it on the decisions data and saves it next to
+admissions_processed.csv; the recommender persists it with the model and runs
+the raw inputs of any number of student profiles through the same transform
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+GRE_COLUMNS = ['gre_total', 'gre_verbal', 'gre_quant', 'gre_awa']
+RANK_COLUMNS = ['cs_rank', 'eng_rank', 'mba_rank', 'gen_rank']
+NO_RANK = 9999
+
+BINARY_COLUMNS = ['student_type', 'has_scholarship', 'application_term']
+CATEGORICAL_COLUMNS = ['credential_standardized', 'categorical_course_name', 'ug_major_bucket']
+OTHER_CATEGORY = 'Other'
+
+# English scores are on the TOEFL scale (0-120); IELTS bands are scaled proportionally
+TOEFL_MAX = 120.0
+IELTS_MAX = 9.0
+
+# Numeric columns are capped and scaled in groups of this many columns; with workers > 1,
+# frames of at least PARALLEL_MIN_ROWS rows spread the groups over a thread pool
+COLUMN_GROUP_SIZE = 4
+PARALLEL_MIN_ROWS = 10000
+
+
+def features_path(data_path):
+    """Fitted feature builder saved next to a processed data file"""
+    return f"{os.path.splitext(data_path)[0]}_features.json"
+
+
+def english_test_score(test, score):
+    """TOEFL-scale score of a TOEFL or IELTS result"""
+    return score if test == 'TOEFL' else score * TOEFL_MAX / IELTS_MAX
+
+
+def as_str(series):
+    """Values as strings the way LabelEncoder saw them in the notebook (None -> 'None', NaN -> 'nan')"""
+    return series.to_numpy(dtype=object).astype(str)
+
+
+def group_categories(series, top_categories, groups):
+    """Categorical over `groups`: top categories kept, every other value (and missing values) as 'Other'
+
+    Works on category codes: each distinct category is mapped to its group once and the
+    rows pick their group code by indexing, instead of a membership test per row.
+    """
+    values = series if isinstance(series.dtype, pd.CategoricalDtype) else series.astype('category')
+    categories = values.cat.categories
+    lookup = pd.Index(groups).get_indexer(categories.where(categories.isin(top_categories), OTHER_CATEGORY))
+    other = groups.index(OTHER_CATEGORY) if OTHER_CATEGORY in groups else -1
+    # Row code -1 (missing) picks the trailing 'Other' entry
+    codes = np.append(lookup, other)[values.cat.codes.to_numpy()]
+    return pd.Categorical.from_codes(codes, categories=groups)
+
+
+def one_hot(codes, columns, index=None):
+    """uint8 indicator block with one column per code; rows with code -1 are all zero"""
+    block = np.zeros((len(codes), len(columns)), dtype=np.uint8)
+    rows = np.flatnonzero(codes >= 0)
+    block[rows, codes[rows]] = 1
+    return pd.DataFrame(block, index=index, columns=columns)
+
+
+def normalize_term(series):
+    """Application term in the lower case of the decisions data ('Fall' -> 'fall'), missing kept"""
+    return series.where(series.isna(), series.astype(str).str.lower())
+
+
+def mark_missing_ranks(df):
+    """Turn the no-rank sentinel back into NaN with a *_missing flag, as the model sees ranks"""
+    for col in RANK_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].replace(NO_RANK, np.nan)
+            df[f"{col}_missing"] = df[col].isna().astype(int)
+    return df
+
+
+class FeatureBuilder:
+    """Fitted derived features, applied to a DataFrame of raw admissions records"""
+
+    def __init__(self, fill_values=None, label_classes=None, top_categories=None, category_groups=None,
+                 bounds=None, scaler=None):
+        self.fill_values = fill_values or {}
+        self.label_classes = label_classes or {}        # column -> sorted classes, as LabelEncoder
+        self.top_categories = top_categories or {}      # column -> most frequent categories
+        self.category_groups = category_groups or {}    # column -> sorted groups, the one-hot column order
+        self.bounds = bounds or {}                      # column -> [lower, upper] IQR caps
+        self.scaler = scaler or {}                      # {'columns', 'mean', 'scale'}, as StandardScaler
+
+    @property
+    def is_fitted(self):
+        return bool(self.label_classes or self.top_categories)
+
+    @property
+    def dummy_columns(self):
+        return {col: [f"{col}_{group}" for group in groups] for col, groups in self.category_groups.items()}
+
+    def handle_missing_values(self, df):
+        """Fill GRE scores with their median, scholarship amounts with 0 and missing ranks with 9999"""
+        for col, value in self.fill_values.items():
+            if col in df.columns:
+                df[col] = df[col].fillna(value)
+        return df
+
+    def feature_engineering(self, df):
+        """Create new features from existing ones"""
+        # 1. GPA strength category
+        df['gpa_category'] = pd.cut(
+            df['gpa_normalized'],
+            bins=[0, 6.0, 7.5, 8.5, 10.0],
+            labels=['Low', 'Medium', 'High', 'Very High']
+        )
+
+        # 2. English proficiency level
+        df['english_proficiency'] = pd.cut(
+            df['english_test_normalized'],
+            bins=[0, 90, 100, 110, 120],
+            labels=['Basic', 'Good', 'Very Good', 'Excellent']
+        )
+
+        # 3. Total experience (work + internship)
+        df['total_experience'] = df['work_experience'] + df['internship_experience']
+
+        # 4. Experience category
+        df['experience_category'] = pd.cut(
+            df['total_experience'],
+            bins=[-1, 0, 12, 36, 1000],
+            labels=['None', 'Junior', 'Mid', 'Senior']
+        )
+
+        # 5. Has publications flag
+        df['has_publications'] = (df['publications'] > 0).astype(int)
+
+        # 6. GRE strength (if available)
+        if 'gre_total' in df.columns:
+            df['gre_strength'] = pd.cut(
+                df['gre_total'],
+                bins=[0, 300, 310, 320, 340],
+                labels=['Low', 'Medium', 'High', 'Very High']
+            )
+
+        # 7. Application timing (the term is also label encoded in this case)
+        df['application_term'] = normalize_term(df['application_term'])
+        df['is_fall_term'] = (df['application_term'] == 'fall').astype(int)
+
+        # 8. University prestige proxy (based on ranking if available)
+        if 'gen_rank' in df.columns:
+            df['university_tier'] = pd.cut(
+                df['gen_rank'],
+                bins=[0, 50, 100, 200, 10000],
+                labels=['Top_50', 'Top_100', 'Top_200', 'Others']
+            )
+
+        # 9. Academic alignment score
+        df['academic_alignment_score'] = df['major_alignment']
+
+        # 10. Composite academic score
+        gpa_norm = df['gpa_normalized'] / 10.0
+        english_norm = df['english_test_normalized'] / TOEFL_MAX
+        if 'gre_total' in df.columns:
+            gre_norm = df['gre_total'] / 340.0
+            df['composite_academic_score'] = 0.4 * gpa_norm + 0.3 * english_norm + 0.3 * gre_norm
+        else:
+            df['composite_academic_score'] = 0.6 * gpa_norm + 0.4 * english_norm
+        return df
+
+    def encode_categorical_variables(self, df):
+        """Label encode binary columns, group and one-hot encode high cardinality columns"""
+        for col, classes in self.label_classes.items():
+            if col in df.columns:
+                # Classes not seen in fitting get code -1
+                df[f'{col}_encoded'] = pd.Categorical(as_str(df[col]), categories=classes).codes.astype(np.int64)
+
+        blocks = [df]
+        dummy_columns = self.dummy_columns
+        for col, top_categories in self.top_categories.items():
+            if col in df.columns:
+                grouped = group_categories(df[col], top_categories, self.category_groups[col])
+                blocks += [pd.DataFrame({f'{col}_grouped': grouped}, index=df.index),
+                           one_hot(grouped.codes, dummy_columns[col], df.index)]
+        return pd.concat(blocks, axis=1)
+
+    def handle_outliers_and_normalize(self, df, workers=None):
+        """Cap values at the fitted IQR bounds and standardize: (clip(x, lower, upper) - mean) / scale
+
+        Capped and scaled columns are processed in column groups, with the per-column bounds, means
+        and scales broadcast over each group block; columns without bounds or scaling pass through.
+        """
+        mean = dict(zip(self.scaler.get('columns', []), self.scaler.get('mean', [])))
+        scale = dict(zip(self.scaler.get('columns', []), self.scaler.get('scale', [])))
+        columns = [col for col in dict.fromkeys([*self.bounds, *mean]) if col in df.columns]
+        if not columns:
+            return df
+
+        no_bounds = (-np.inf, np.inf)
+        lower = np.array([self.bounds.get(col, no_bounds)[0] for col in columns], dtype=float)
+        upper = np.array([self.bounds.get(col, no_bounds)[1] for col in columns], dtype=float)
+        # A column without observed values has NaN bounds, which cap nothing
+        lower[np.isnan(lower)], upper[np.isnan(upper)] = -np.inf, np.inf
+        center = np.array([mean.get(col, 0.0) for col in columns], dtype=float)
+        spread = np.array([scale.get(col, 1.0) for col in columns], dtype=float)
+
+        # Column-major output: every column is one contiguous row of `out`
+        out = np.empty((len(columns), len(df)))
+
+        def process(group):
+            block = df[columns[group]].to_numpy(dtype=float, na_value=np.nan).T
+            np.clip(block, lower[group, None], upper[group, None], out=out[group])
+            out[group] -= center[group, None]
+            out[group] /= spread[group, None]
+
+        groups = [slice(start, start + COLUMN_GROUP_SIZE) for start in range(0, len(columns), COLUMN_GROUP_SIZE)]
+        if workers and workers > 1 and len(groups) > 1 and len(df) >= PARALLEL_MIN_ROWS:
+            # numpy releases the GIL in clip and the arithmetic, so groups run concurrently
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(process, groups))
+        else:
+            for group in groups:
+                process(group)
+        for row, col in enumerate(columns):
+            df[col] = out[row]
+        return df
+
+    def transform(self, df, workers=None):
+        """Raw records -> records with every derived feature added (df itself is left unchanged)"""
+        df = self.handle_missing_values(df.copy())
+        df = self.feature_engineering(df)
+        df = self.encode_categorical_variables(df)
+        return self.handle_outliers_and_normalize(df, workers=workers)
+
+    def to_dict(self):
+        return {
+            'fill_values': self.fill_values,
+            'label_classes': self.label_classes,
+            'top_categories': self.top_categories,
+            'category_groups': self.category_groups,
+            'bounds': self.bounds,
+            'scaler': self.scaler,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r') as f:
+            return cls.from_dict(json.load(f))
@@ -4,741 +4,1201 @@
 #   "seaborn>=0.13.0",
 #   "pandas>=2.2.0",
 #   "numpy>=1.26.0",
+#   "pyarrow>=15.0.0",
 # ]
 # ///
+"""
+Comprehensive analysis of the USA graduate admissions decisions
+Every chart is a registered task with two stages: an aggregate function that
+reduces the decisions to the chart's inputs (counts, histogram bins, box and
+violin statistics, admission rates), and a render function that draws the
+chart from those aggregates alone. All aggregates are computed in one pass
+and stored in analysis_graphs/aggregates.json keyed by a hash of the source
+data, so style or DPI changes re-render without loading the decisions; a
+process pool renders the charts in parallel on the non-interactive Agg backend.
+Each stored aggregate and each output records a fingerprint of what it was
+built from (source data, input columns, aggregate/render code, DPI, style);
+reruns only recompute and redraw what is stale
 
+Usage:
+    uv run comprehensive_analysis.py                       # all 41 charts
+    uv run comprehensive_analysis.py --groups raj reha     # selected analyst groups
+    uv run comprehensive_analysis.py --charts 2_gpa_vs_gre_scatter --dpi 150
+    uv run comprehensive_analysis.py --from-aggregates     # re-render without the data file
+"""
+
+import argparse
+import hashlib
+import inspect
 import json
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+import warnings
+warnings.filterwarnings('ignore')
+
+import matplotlib
+matplotlib.use('Agg')
 import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib import cbook, mlab
+from matplotlib.colors import LogNorm
+from matplotlib.patches import Patch
 import seaborn as sns
 import numpy as np
-from pathlib import Path
-import warnings
-warnings.filterwarnings('ignore')
+
+from ingest import load_decisions, source_fingerprint, DATA_PATH
+import rate_cube
+import summary_stats
+from rate_cube import Dimension, RateCube
 
 # Set style
 sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (12, 8)
 plt.rcParams['font.size'] = 10
 
-print("Loading data...")
-# Load the JSONL data
-data = []
-with open('usa_decisions_cleaned_with_uuid.jsonl', 'r') as f:
-    for line in f:
-        data.append(json.loads(line.strip()))
+OUTPUT_DIR = 'analysis_graphs'
+AGGREGATES_FILE = 'aggregates.json'
+
+GROUPS = {
+    "raj": "RAJ's Analysis - Student Demographics & Applications",
+    "adwait": "ADWAIT's Analysis - Academic Performance & Test Scores",
+    "reha": "REHA's Analysis - Experience, Research & Rankings",
+    "cross_analysis": "CROSS-ANALYSIS - Multi-variable Insights",
+}
+
+ADMISSION_LABELS = ['Rejected', 'Admitted']
+ADMISSION_COLORS = ['#e74c3c', '#2ecc71']
+ADMISSION_CMAPS = ['Reds', 'Greens']
+
+# Scatter plots with more points than this are pre-binned and drawn as a density image
+DENSITY_THRESHOLD = 50_000
+
+ChartTask = namedtuple('ChartTask', 'group name columns label aggregate render rates')
+
+# "<group>/<name>" -> ChartTask, in registration (= presentation) order
+CHARTS = {}
+
+
+def chart(group, name, columns, label, aggregate=None, rates=None):
+    """Register a chart: `aggregate(df)` reduces a DataFrame with only `columns` to a
+    JSON-serializable dict, the decorated render function draws the chart from that dict.
+
+    Admission-rate charts pass `rates` instead: RateCube.rates() keyword arguments
+    (dimension name first) read from the shared rate cube of RATE_DIMENSIONS.
+
+    An aggregate of {"skip": message} means there is not enough data to draw the chart.
+    """
+    def register(render):
+        CHARTS[f"{group}/{name}"] = ChartTask(group, name, list(columns), label, aggregate, render, rates)
+        return render
+    return register
+
+
+# ============================================================================
+# AGGREGATES - computed once from the decisions, stored as JSON
+# ============================================================================
+
+def _jsonable(value):
+    """Convert numpy/pandas values in nested aggregates to plain JSON types"""
+    if isinstance(value, dict):
+        return {str(k): _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray, pd.Index, pd.Series)):
+        return [_jsonable(v) for v in list(value)]
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is pd.NA:
+        return None
+    return value
+
+
+def value_counts(series, head=None, sort_index=False):
+    counts = series.value_counts()
+    counts = counts[counts > 0]  # unobserved categories of categorical columns
+    if sort_index:
+        counts = counts.sort_index()
+    if head:
+        counts = counts.head(head)
+    return {'index': counts.index.tolist(), 'values': counts.values}
+
+
+def histogram(values, bins):
+    """Bin counts and edges as plt.hist(values, bins=bins) would draw them, plus the mean"""
+    values = pd.Series(values).dropna().to_numpy(dtype=float)
+    counts, edges = np.histogram(values, bins=bins)
+    return {'counts': counts, 'edges': edges, 'n': len(values),
+            'mean': float(values.mean()) if len(values) else None}
+
+
+def box_by_admission(df, column, max_value=None):
+    """Box-plot statistics of `column` per admission result (fliers deduplicated)"""
+    stats = []
+    for result, label in enumerate(ADMISSION_LABELS):
+        values = df.loc[df['admission_result'] == result, column].dropna()
+        if max_value is not None:
+            values = values[values <= max_value]
+        box = cbook.boxplot_stats(values.to_numpy(dtype=float))[0]
+        box['fliers'] = np.unique(box['fliers'])
+        box['label'] = label
+        stats.append(box)
+    return {'stats': stats}
+
+
+def violin_by_admission(df, column, points=100, cut=2):
+    """Gaussian KDE (Scott bandwidth) of `column` per admission result, plus quartiles for the inner box"""
+    stats = []
+    for result in range(len(ADMISSION_LABELS)):
+        values = df.loc[df['admission_result'] == result, column].dropna().to_numpy(dtype=float)
+        if len(values) < 2 or values.std() == 0:
+            stats.append(None)
+            continue
+        kde = mlab.GaussianKDE(values, 'scott')
+        bandwidth = kde.factor * values.std(ddof=1)
+        coords = np.linspace(values.min() - cut * bandwidth, values.max() + cut * bandwidth, points)
+        q1, median, q3 = np.percentile(values, [25, 50, 75])
+        iqr = q3 - q1
+        stats.append({'coords': coords, 'vals': kde.evaluate(coords), 'mean': values.mean(), 'median': median,
+                      'min': values.min(), 'max': values.max(), 'q1': q1, 'q3': q3,
+                      'whislo': values[values >= q1 - 1.5 * iqr].min(),
+                      'whishi': values[values <= q3 + 1.5 * iqr].max()})
+    return {'stats': stats}
 
-df = pd.DataFrame(data)
-print(f"Total records loaded: {len(df)}")
-print(f"Total columns: {len(df.columns)}")
 
-# Create output directories
-Path("analysis_graphs").mkdir(exist_ok=True)
-Path("analysis_graphs/raj").mkdir(exist_ok=True)
-Path("analysis_graphs/adwait").mkdir(exist_ok=True)
-Path("analysis_graphs/reha").mkdir(exist_ok=True)
-Path("analysis_graphs/cross_analysis").mkdir(exist_ok=True)
+def points(df, x, y):
+    """Unique (x, y) pairs with their multiplicity - the exact input of a scatter plot"""
+    pairs = df[[x, y]].dropna().groupby([x, y], observed=True).size()
+    return {'x': pairs.index.get_level_values(0).values, 'y': pairs.index.get_level_values(1).values,
+            'count': pairs.values}
+
+
+def _density_edges(values, bins):
+    """Bin edges for one density axis; integer-valued axes with few distinct values get one bin per value"""
+    if not np.isscalar(bins):
+        return np.asarray(bins, dtype=float)
+    low, high = (values.min(), values.max()) if len(values) else (0.0, 1.0)
+    if np.all(np.mod(values, 1) == 0) and high - low + 1 <= bins:
+        return np.arange(low - 0.5, high + 1.5)
+    return np.histogram_bin_edges(values, bins=bins)
+
+
+def density_by_admission(df, x, y, bins):
+    """2-D histogram of (x, y) per admission result on shared edges - a fixed-size scatter plot input"""
+    data = df[list(dict.fromkeys([x, y, 'admission_result']))].dropna()
+    xs, ys = data[x].to_numpy(dtype=float), data[y].to_numpy(dtype=float)
+    results = data['admission_result'].to_numpy()
+    x_edges, y_edges = _density_edges(xs, bins[0]), _density_edges(ys, bins[1])
+    counts = {}
+    for result, label in enumerate(ADMISSION_LABELS):
+        mask = results == result
+        counts[label] = np.histogram2d(xs[mask], ys[mask], bins=[x_edges, y_edges])[0]
+    return {'mode': 'density', 'n': len(data), 'x_edges': x_edges, 'y_edges': y_edges, 'counts': counts}
+
+
+# ============================================================================
+# RENDER HELPERS - draw from aggregates
+# ============================================================================
+
+def _series(agg):
+    return pd.Series(agg['values'], index=agg['index'])
+
+
+def _draw_hist(ax, agg, **kwargs):
+    edges = np.asarray(agg['edges'])
+    ax.hist(edges[:-1], bins=edges, weights=agg['counts'], **kwargs)
+
+
+def _draw_box(agg):
+    ax = plt.gca()
+    boxes = ax.bxp(agg['stats'], positions=range(len(agg['stats'])), widths=0.8, patch_artist=True,
+                   medianprops=dict(color='#3d3d3d', linewidth=1.5),
+                   whiskerprops=dict(color='#3d3d3d'), capprops=dict(color='#3d3d3d'),
+                   flierprops=dict(marker='d', markerfacecolor='#3d3d3d', markeredgecolor='#3d3d3d', markersize=4))
+    for patch, color in zip(boxes['boxes'], ADMISSION_COLORS):
+        patch.set_facecolor(sns.desaturate(color, 0.75))
+        patch.set_edgecolor('#3d3d3d')
+
+
+def _draw_violin(agg):
+    ax = plt.gca()
+    present = [(i, s) for i, s in enumerate(agg['stats']) if s]
+    if present:
+        parts = ax.violin([s for _, s in present], positions=[i for i, _ in present], widths=0.8,
+                          showmeans=False, showextrema=False, showmedians=False)
+        for body, (i, _) in zip(parts['bodies'], present):
+            body.set_facecolor(sns.desaturate(ADMISSION_COLORS[i], 0.75))
+            body.set_edgecolor('#3d3d3d')
+            body.set_alpha(1)
+    for i, s in present:
+        ax.vlines(i, s['whislo'], s['whishi'], color='#3d3d3d', linewidth=1.5)
+        ax.vlines(i, s['q1'], s['q3'], color='#3d3d3d', linewidth=6)
+        ax.scatter([i], [s['median']], color='white', s=20, zorder=3)
+    ax.set_xticks(range(len(ADMISSION_LABELS)), ADMISSION_LABELS)
+
+
+def _draw_points(x, y, count, **kwargs):
+    count = np.asarray(count, dtype=int)
+    plt.scatter(np.repeat(x, count), np.repeat(y, count), **kwargs)
+
+
+def _draw_density(agg, alpha=0.6):
+    """Draw a density aggregate: one log-scaled colour layer per admission result, empty bins transparent"""
+    ax = plt.gca()
+    handles = []
+    for label, cmap, color in zip(ADMISSION_LABELS, ADMISSION_CMAPS, ADMISSION_COLORS):
+        counts = np.ma.masked_equal(np.asarray(agg['counts'][label], dtype=float).T, 0)
+        if counts.count():
+            ax.pcolormesh(agg['x_edges'], agg['y_edges'], counts, cmap=cmap, norm=LogNorm(),
+                          alpha=alpha, shading='flat')
+        handles.append(Patch(color=color, alpha=alpha, label=label))
+    return handles
 
-print("\n" + "="*80)
-print("GENERATING VISUALIZATIONS")
-print("="*80)
 
 # ============================================================================
 # RAJ'S ANALYSIS - Student Demographics & Application Details
 # ============================================================================
-print("\n📊 RAJ's Analysis - Student Demographics & Applications")
-
-# 1. Student Type Distribution
-plt.figure(figsize=(10, 6))
-student_type_counts = df['student_type'].value_counts()
-colors = ['#3498db', '#e74c3c']
-plt.pie(student_type_counts.values, labels=student_type_counts.index, autopct='%1.1f%%',
-        colors=colors, startangle=90)
-plt.title('Student Type Distribution\n(International vs Domestic)', fontsize=14, fontweight='bold')
-plt.savefig('analysis_graphs/raj/1_student_type_pie.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ Student type pie chart")
-
-# 2. Top 20 Universities
-plt.figure(figsize=(14, 10))
-top_unis = df['university_name'].value_counts().head(20)
-plt.barh(range(len(top_unis)), top_unis.values, color='steelblue')
-plt.yticks(range(len(top_unis)), top_unis.index, fontsize=9)
-plt.xlabel('Number of Applications', fontsize=12)
-plt.title('Top 20 Most Applied Universities', fontsize=14, fontweight='bold')
-plt.gca().invert_yaxis()
-for i, v in enumerate(top_unis.values):
-    plt.text(v + 50, i, str(v), va='center', fontsize=9)
-plt.tight_layout()
-plt.savefig('analysis_graphs/raj/2_top_universities_bar.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ Top 20 universities bar chart")
-
-# 3. Top 15 Programs
-plt.figure(figsize=(14, 9))
-top_programs = df['course_name'].value_counts().head(15)
-plt.barh(range(len(top_programs)), top_programs.values, color='mediumseagreen')
-plt.yticks(range(len(top_programs)), top_programs.index, fontsize=10)
-plt.xlabel('Number of Applications', fontsize=12)
-plt.title('Top 15 Most Applied Programs', fontsize=14, fontweight='bold')
-plt.gca().invert_yaxis()
-for i, v in enumerate(top_programs.values):
-    plt.text(v + 50, i, str(v), va='center', fontsize=9)
-plt.tight_layout()
-plt.savefig('analysis_graphs/raj/3_top_programs_bar.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ Top 15 programs bar chart")
-
-# 4. Credential Type Distribution
-plt.figure(figsize=(10, 6))
-credential_counts = df['credential'].value_counts()
-colors_cred = sns.color_palette("Set2", len(credential_counts))
-plt.pie(credential_counts.values, labels=credential_counts.index, autopct='%1.1f%%',
-        colors=colors_cred, startangle=45)
-plt.title('Credential Type Distribution', fontsize=14, fontweight='bold')
-plt.savefig('analysis_graphs/raj/4_credential_type_pie.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ Credential type pie chart")
-
-# 5. Program Categories
-plt.figure(figsize=(14, 10))
-top_categories = df['categorical_course_name'].value_counts().head(15)
-plt.barh(range(len(top_categories)), top_categories.values, color='coral')
-plt.yticks(range(len(top_categories)), top_categories.index, fontsize=9)
-plt.xlabel('Number of Applications', fontsize=12)
-plt.title('Top 15 Program Categories', fontsize=14, fontweight='bold')
-plt.gca().invert_yaxis()
-plt.tight_layout()
-plt.savefig('analysis_graphs/raj/5_program_categories_bar.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ Program categories bar chart")
-
-# 6. Target Degree Distribution
-plt.figure(figsize=(10, 6))
-target_degree_counts = df['target_degree'].value_counts()
-colors_degree = ['#FF6B6B', '#4ECDC4', '#45B7D1']
-wedges, texts, autotexts = plt.pie(target_degree_counts.values, labels=target_degree_counts.index,
-                                     autopct='%1.1f%%', colors=colors_degree, startangle=90,
-                                     wedgeprops=dict(width=0.5))
-plt.title('Target Degree Distribution', fontsize=14, fontweight='bold')
-plt.savefig('analysis_graphs/raj/6_target_degree_donut.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ Target degree donut chart")
-
-# 7. Admission Result
-plt.figure(figsize=(10, 6))
-admission_counts = df['admission_result'].value_counts()
-labels = ['Rejected', 'Admitted']
-colors_admission = ['#e74c3c', '#2ecc71']
-plt.pie(admission_counts.values, labels=labels, autopct='%1.1f%%',
-        colors=colors_admission, startangle=90)
-plt.title('Admission Results Distribution', fontsize=14, fontweight='bold')
-plt.savefig('analysis_graphs/raj/7_admission_result_pie.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ Admission result pie chart")
-
-# 8. Application Term (excluding 'nd')
-plt.figure(figsize=(10, 6))
-term_data = df[df['application_term'] != 'nd']  # Filter out 'nd' values
-term_counts = term_data['application_term'].value_counts()
-plt.bar(term_counts.index, term_counts.values, color=['#3498db', '#e67e22', '#9b59b6'])
-plt.xlabel('Application Term', fontsize=12)
-plt.ylabel('Number of Applications', fontsize=12)
-plt.title('Application Term Distribution', fontsize=14, fontweight='bold')
-for i, v in enumerate(term_counts.values):
-    plt.text(i, v + 1000, str(v), ha='center', fontsize=11)
-plt.tight_layout()
-plt.savefig('analysis_graphs/raj/8_application_term_bar.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ Application term bar chart (excluding 'nd')")
-
-# 9. Application Year Trend
-plt.figure(figsize=(12, 6))
-year_counts = df['application_year'].value_counts().sort_index()
-plt.plot(year_counts.index, year_counts.values, marker='o', linewidth=2, markersize=8, color='darkblue')
-plt.xlabel('Year', fontsize=12)
-plt.ylabel('Number of Applications', fontsize=12)
-plt.title('Application Trend Over Years', fontsize=14, fontweight='bold')
-plt.grid(True, alpha=0.3)
-for x, y in zip(year_counts.index, year_counts.values):
-    plt.text(x, y + 500, str(y), ha='center', fontsize=10)
-plt.tight_layout()
-plt.savefig('analysis_graphs/raj/9_application_trend_line.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ Application trend line chart")
-
-# 10. Application Status
-plt.figure(figsize=(10, 6))
-status_counts = df['application_status'].value_counts().sort_index()
-plt.bar(status_counts.index, status_counts.values, color='teal')
-plt.xlabel('Application Status Code', fontsize=12)
-plt.ylabel('Count', fontsize=12)
-plt.title('Application Status Distribution', fontsize=14, fontweight='bold')
-plt.tight_layout()
-plt.savefig('analysis_graphs/raj/10_application_status_bar.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ Application status bar chart")
+
+@chart("raj", "1_student_type_pie", ['student_type'], "Student type pie chart",
+       aggregate=lambda df: value_counts(df['student_type']))
+def student_type_pie(agg):
+    plt.figure(figsize=(10, 6))
+    student_type_counts = _series(agg)
+    colors = ['#3498db', '#e74c3c']
+    plt.pie(student_type_counts.values, labels=student_type_counts.index, autopct='%1.1f%%',
+            colors=colors, startangle=90)
+    plt.title('Student Type Distribution\n(International vs Domestic)', fontsize=14, fontweight='bold')
+
+
+@chart("raj", "2_top_universities_bar", ['university_name'], "Top 20 universities bar chart",
+       aggregate=lambda df: value_counts(df['university_name'], head=20))
+def top_universities_bar(agg):
+    plt.figure(figsize=(14, 10))
+    top_unis = _series(agg)
+    plt.barh(range(len(top_unis)), top_unis.values, color='steelblue')
+    plt.yticks(range(len(top_unis)), top_unis.index, fontsize=9)
+    plt.xlabel('Number of Applications', fontsize=12)
+    plt.title('Top 20 Most Applied Universities', fontsize=14, fontweight='bold')
+    plt.gca().invert_yaxis()
+    for i, v in enumerate(top_unis.values):
+        plt.text(v + 50, i, str(v), va='center', fontsize=9)
+    plt.tight_layout()
+
+
+@chart("raj", "3_top_programs_bar", ['course_name'], "Top 15 programs bar chart",
+       aggregate=lambda df: value_counts(df['course_name'], head=15))
+def top_programs_bar(agg):
+    plt.figure(figsize=(14, 9))
+    top_programs = _series(agg)
+    plt.barh(range(len(top_programs)), top_programs.values, color='mediumseagreen')
+    plt.yticks(range(len(top_programs)), top_programs.index, fontsize=10)
+    plt.xlabel('Number of Applications', fontsize=12)
+    plt.title('Top 15 Most Applied Programs', fontsize=14, fontweight='bold')
+    plt.gca().invert_yaxis()
+    for i, v in enumerate(top_programs.values):
+        plt.text(v + 50, i, str(v), va='center', fontsize=9)
+    plt.tight_layout()
+
+
+@chart("raj", "4_credential_type_pie", ['credential'], "Credential type pie chart",
+       aggregate=lambda df: value_counts(df['credential']))
+def credential_type_pie(agg):
+    plt.figure(figsize=(10, 6))
+    credential_counts = _series(agg)
+    colors_cred = sns.color_palette("Set2", len(credential_counts))
+    plt.pie(credential_counts.values, labels=credential_counts.index, autopct='%1.1f%%',
+            colors=colors_cred, startangle=45)
+    plt.title('Credential Type Distribution', fontsize=14, fontweight='bold')
+
+
+@chart("raj", "5_program_categories_bar", ['categorical_course_name'], "Program categories bar chart",
+       aggregate=lambda df: value_counts(df['categorical_course_name'], head=15))
+def program_categories_bar(agg):
+    plt.figure(figsize=(14, 10))
+    top_categories = _series(agg)
+    plt.barh(range(len(top_categories)), top_categories.values, color='coral')
+    plt.yticks(range(len(top_categories)), top_categories.index, fontsize=9)
+    plt.xlabel('Number of Applications', fontsize=12)
+    plt.title('Top 15 Program Categories', fontsize=14, fontweight='bold')
+    plt.gca().invert_yaxis()
+    plt.tight_layout()
+
+
+@chart("raj", "6_target_degree_donut", ['target_degree'], "Target degree donut chart",
+       aggregate=lambda df: value_counts(df['target_degree']))
+def target_degree_donut(agg):
+    plt.figure(figsize=(10, 6))
+    target_degree_counts = _series(agg)
+    colors_degree = ['#FF6B6B', '#4ECDC4', '#45B7D1']
+    plt.pie(target_degree_counts.values, labels=target_degree_counts.index,
+            autopct='%1.1f%%', colors=colors_degree, startangle=90,
+            wedgeprops=dict(width=0.5))
+    plt.title('Target Degree Distribution', fontsize=14, fontweight='bold')
+
+
+@chart("raj", "7_admission_result_pie", ['admission_result'], "Admission result pie chart",
+       aggregate=lambda df: value_counts(df['admission_result']))
+def admission_result_pie(agg):
+    plt.figure(figsize=(10, 6))
+    admission_counts = _series(agg)
+    labels = ['Rejected', 'Admitted']
+    colors_admission = ['#e74c3c', '#2ecc71']
+    plt.pie(admission_counts.values, labels=labels, autopct='%1.1f%%',
+            colors=colors_admission, startangle=90)
+    plt.title('Admission Results Distribution', fontsize=14, fontweight='bold')
+
+
+@chart("raj", "8_application_term_bar", ['application_term'], "Application term bar chart (excluding 'nd')",
+       aggregate=lambda df: value_counts(df.loc[df['application_term'] != 'nd', 'application_term']))
+def application_term_bar(agg):
+    plt.figure(figsize=(10, 6))
+    term_counts = _series(agg)
+    plt.bar(term_counts.index, term_counts.values, color=['#3498db', '#e67e22', '#9b59b6'])
+    plt.xlabel('Application Term', fontsize=12)
+    plt.ylabel('Number of Applications', fontsize=12)
+    plt.title('Application Term Distribution', fontsize=14, fontweight='bold')
+    for i, v in enumerate(term_counts.values):
+        plt.text(i, v + 1000, str(v), ha='center', fontsize=11)
+    plt.tight_layout()
+
+
+@chart("raj", "9_application_trend_line", ['application_year'], "Application trend line chart",
+       aggregate=lambda df: value_counts(df['application_year'], sort_index=True))
+def application_trend_line(agg):
+    plt.figure(figsize=(12, 6))
+    year_counts = _series(agg)
+    plt.plot(year_counts.index, year_counts.values, marker='o', linewidth=2, markersize=8, color='darkblue')
+    plt.xlabel('Year', fontsize=12)
+    plt.ylabel('Number of Applications', fontsize=12)
+    plt.title('Application Trend Over Years', fontsize=14, fontweight='bold')
+    plt.grid(True, alpha=0.3)
+    for x, y in zip(year_counts.index, year_counts.values):
+        plt.text(x, y + 500, str(y), ha='center', fontsize=10)
+    plt.tight_layout()
+
+
+@chart("raj", "10_application_status_bar", ['application_status'], "Application status bar chart",
+       aggregate=lambda df: value_counts(df['application_status'], sort_index=True))
+def application_status_bar(agg):
+    plt.figure(figsize=(10, 6))
+    status_counts = _series(agg)
+    plt.bar(status_counts.index, status_counts.values, color='teal')
+    plt.xlabel('Application Status Code', fontsize=12)
+    plt.ylabel('Count', fontsize=12)
+    plt.title('Application Status Distribution', fontsize=14, fontweight='bold')
+    plt.tight_layout()
+
 
 # ============================================================================
 # ADWAIT'S ANALYSIS - Academic Performance & Test Scores
 # ============================================================================
-print("\n📊 ADWAIT's Analysis - Academic Performance & Test Scores")
-
-# 1. GPA Distribution
-plt.figure(figsize=(12, 6))
-gpa_data = df['gpa_normalized'].dropna()
-plt.hist(gpa_data, bins=50, color='skyblue', edgecolor='black', alpha=0.7)
-plt.xlabel('Normalized GPA', fontsize=12)
-plt.ylabel('Frequency', fontsize=12)
-plt.title('GPA Distribution (Normalized)', fontsize=14, fontweight='bold')
-plt.axvline(gpa_data.mean(), color='red', linestyle='--', linewidth=2, label=f'Mean: {gpa_data.mean():.2f}')
-plt.legend()
-plt.tight_layout()
-plt.savefig('analysis_graphs/adwait/1_gpa_histogram.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ GPA histogram")
-
-# 2. GPA by Admission Result (Box Plot)
-plt.figure(figsize=(10, 6))
-df_gpa = df[df['gpa_normalized'].notna()].copy()
-df_gpa['admission_result_label'] = df_gpa['admission_result'].map({0: 'Rejected', 1: 'Admitted'})
-sns.boxplot(data=df_gpa, x='admission_result_label', y='gpa_normalized', palette=['#e74c3c', '#2ecc71'])
-plt.xlabel('Admission Result', fontsize=12)
-plt.ylabel('Normalized GPA', fontsize=12)
-plt.title('GPA Distribution by Admission Result', fontsize=14, fontweight='bold')
-plt.tight_layout()
-plt.savefig('analysis_graphs/adwait/2_gpa_by_admission_boxplot.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ GPA by admission box plot")
-
-# 3. GPA Scale Distribution
-plt.figure(figsize=(10, 6))
-scale_counts = df['gpa_scale'].value_counts()
-plt.pie(scale_counts.values, labels=scale_counts.index, autopct='%1.1f%%', startangle=45)
-plt.title('GPA Scale Distribution', fontsize=14, fontweight='bold')
-plt.savefig('analysis_graphs/adwait/3_gpa_scale_pie.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ GPA scale pie chart")
-
-# 4. Top 20 Undergraduate Majors
-plt.figure(figsize=(14, 10))
-top_majors = df['undergrad_major'].value_counts().head(20)
-plt.barh(range(len(top_majors)), top_majors.values, color='lightcoral')
-plt.yticks(range(len(top_majors)), top_majors.index, fontsize=9)
-plt.xlabel('Number of Students', fontsize=12)
-plt.title('Top 20 Undergraduate Majors', fontsize=14, fontweight='bold')
-plt.gca().invert_yaxis()
-plt.tight_layout()
-plt.savefig('analysis_graphs/adwait/4_undergrad_majors_bar.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ Undergrad majors bar chart")
-
-# 5. UG Major Bucket Distribution
-plt.figure(figsize=(14, 8))
-major_buckets = df['ug_major_bucket'].value_counts().head(10)
-plt.bar(range(len(major_buckets)), major_buckets.values, color='mediumorchid')
-plt.xticks(range(len(major_buckets)), major_buckets.index, rotation=45, ha='right', fontsize=9)
-plt.ylabel('Number of Students', fontsize=12)
-plt.title('Top 10 Undergraduate Major Categories', fontsize=14, fontweight='bold')
-plt.tight_layout()
-plt.savefig('analysis_graphs/adwait/5_ug_major_bucket_bar.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ UG major bucket bar chart")
-
-# 6. Major Alignment
-plt.figure(figsize=(10, 6))
-alignment_counts = df['major_alignment'].value_counts()
-labels = ['Aligned', 'Not Aligned']
-colors_align = ['#27ae60', '#e67e22']
-plt.pie(alignment_counts.values, labels=labels, autopct='%1.1f%%',
-        colors=colors_align, startangle=90)
-plt.title('Major Alignment Distribution\n(Undergrad to Grad)', fontsize=14, fontweight='bold')
-plt.savefig('analysis_graphs/adwait/6_major_alignment_pie.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ Major alignment pie chart")
-
-# 7. TOEFL Score Distribution
-plt.figure(figsize=(12, 6))
-toefl_data = df['toefl'].dropna()
-plt.hist(toefl_data, bins=40, color='lightgreen', edgecolor='black', alpha=0.7)
-plt.xlabel('TOEFL Score', fontsize=12)
-plt.ylabel('Frequency', fontsize=12)
-plt.title('TOEFL Score Distribution', fontsize=14, fontweight='bold')
-plt.axvline(toefl_data.mean(), color='red', linestyle='--', linewidth=2, label=f'Mean: {toefl_data.mean():.1f}')
-plt.legend()
-plt.tight_layout()
-plt.savefig('analysis_graphs/adwait/7_toefl_histogram.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ TOEFL histogram")
-
-# 8. IELTS Score Distribution
-plt.figure(figsize=(12, 6))
-ielts_data = df['ielts'].dropna()
-plt.hist(ielts_data, bins=30, color='lightsalmon', edgecolor='black', alpha=0.7)
-plt.xlabel('IELTS Score', fontsize=12)
-plt.ylabel('Frequency', fontsize=12)
-plt.title('IELTS Score Distribution', fontsize=14, fontweight='bold')
-plt.axvline(ielts_data.mean(), color='red', linestyle='--', linewidth=2, label=f'Mean: {ielts_data.mean():.2f}')
-plt.legend()
-plt.tight_layout()
-plt.savefig('analysis_graphs/adwait/8_ielts_histogram.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ IELTS histogram")
-
-# 9. English Score by Admission Result
-plt.figure(figsize=(10, 6))
-df_eng = df[df['english_test_normalized'].notna()].copy()
-df_eng['admission_result_label'] = df_eng['admission_result'].map({0: 'Rejected', 1: 'Admitted'})
-sns.boxplot(data=df_eng, x='admission_result_label', y='english_test_normalized', palette=['#e74c3c', '#2ecc71'])
-plt.xlabel('Admission Result', fontsize=12)
-plt.ylabel('Normalized English Score', fontsize=12)
-plt.title('English Test Score by Admission Result', fontsize=14, fontweight='bold')
-plt.tight_layout()
-plt.savefig('analysis_graphs/adwait/9_english_score_by_admission_boxplot.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ English score by admission box plot")
-
-# 10. GRE Total Score Distribution
-plt.figure(figsize=(12, 6))
-gre_data = df['gre_total'].dropna()
-plt.hist(gre_data, bins=40, color='mediumpurple', edgecolor='black', alpha=0.7)
-plt.xlabel('GRE Total Score', fontsize=12)
-plt.ylabel('Frequency', fontsize=12)
-plt.title('GRE Total Score Distribution', fontsize=14, fontweight='bold')
-plt.axvline(gre_data.mean(), color='red', linestyle='--', linewidth=2, label=f'Mean: {gre_data.mean():.1f}')
-plt.legend()
-plt.tight_layout()
-plt.savefig('analysis_graphs/adwait/10_gre_total_histogram.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ GRE total histogram")
-
-# 11. GRE Verbal vs Admission
-plt.figure(figsize=(10, 6))
-df_gre_v = df[df['gre_verbal'].notna()].copy()
-df_gre_v['admission_result_label'] = df_gre_v['admission_result'].map({0: 'Rejected', 1: 'Admitted'})
-sns.violinplot(data=df_gre_v, x='admission_result_label', y='gre_verbal', palette=['#e74c3c', '#2ecc71'])
-plt.xlabel('Admission Result', fontsize=12)
-plt.ylabel('GRE Verbal Score', fontsize=12)
-plt.title('GRE Verbal Score by Admission Result', fontsize=14, fontweight='bold')
-plt.tight_layout()
-plt.savefig('analysis_graphs/adwait/11_gre_verbal_by_admission_violin.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ GRE verbal by admission violin plot")
-
-# 12. GRE Quant vs Admission
-plt.figure(figsize=(10, 6))
-df_gre_q = df[df['gre_quant'].notna()].copy()
-df_gre_q['admission_result_label'] = df_gre_q['admission_result'].map({0: 'Rejected', 1: 'Admitted'})
-sns.violinplot(data=df_gre_q, x='admission_result_label', y='gre_quant', palette=['#e74c3c', '#2ecc71'])
-plt.xlabel('Admission Result', fontsize=12)
-plt.ylabel('GRE Quantitative Score', fontsize=12)
-plt.title('GRE Quantitative Score by Admission Result', fontsize=14, fontweight='bold')
-plt.tight_layout()
-plt.savefig('analysis_graphs/adwait/12_gre_quant_by_admission_violin.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ GRE quant by admission violin plot")
+
+@chart("adwait", "1_gpa_histogram", ['gpa_normalized'], "GPA histogram",
+       aggregate=lambda df: histogram(df['gpa_normalized'], bins=50))
+def gpa_histogram(agg):
+    plt.figure(figsize=(12, 6))
+    _draw_hist(plt.gca(), agg, color='skyblue', edgecolor='black', alpha=0.7)
+    plt.xlabel('Normalized GPA', fontsize=12)
+    plt.ylabel('Frequency', fontsize=12)
+    plt.title('GPA Distribution (Normalized)', fontsize=14, fontweight='bold')
+    plt.axvline(agg['mean'], color='red', linestyle='--', linewidth=2, label=f"Mean: {agg['mean']:.2f}")
+    plt.legend()
+    plt.tight_layout()
+
+
+@chart("adwait", "2_gpa_by_admission_boxplot", ['gpa_normalized', 'admission_result'], "GPA by admission box plot",
+       aggregate=lambda df: box_by_admission(df, 'gpa_normalized'))
+def gpa_by_admission_boxplot(agg):
+    plt.figure(figsize=(10, 6))
+    _draw_box(agg)
+    plt.xlabel('Admission Result', fontsize=12)
+    plt.ylabel('Normalized GPA', fontsize=12)
+    plt.title('GPA Distribution by Admission Result', fontsize=14, fontweight='bold')
+    plt.tight_layout()
+
+
+@chart("adwait", "3_gpa_scale_pie", ['gpa_scale'], "GPA scale pie chart",
+       aggregate=lambda df: value_counts(df['gpa_scale']))
+def gpa_scale_pie(agg):
+    plt.figure(figsize=(10, 6))
+    scale_counts = _series(agg)
+    plt.pie(scale_counts.values, labels=scale_counts.index, autopct='%1.1f%%', startangle=45)
+    plt.title('GPA Scale Distribution', fontsize=14, fontweight='bold')
+
+
+@chart("adwait", "4_undergrad_majors_bar", ['undergrad_major'], "Undergrad majors bar chart",
+       aggregate=lambda df: value_counts(df['undergrad_major'], head=20))
+def undergrad_majors_bar(agg):
+    plt.figure(figsize=(14, 10))
+    top_majors = _series(agg)
+    plt.barh(range(len(top_majors)), top_majors.values, color='lightcoral')
+    plt.yticks(range(len(top_majors)), top_majors.index, fontsize=9)
+    plt.xlabel('Number of Students', fontsize=12)
+    plt.title('Top 20 Undergraduate Majors', fontsize=14, fontweight='bold')
+    plt.gca().invert_yaxis()
+    plt.tight_layout()
+
+
+@chart("adwait", "5_ug_major_bucket_bar", ['ug_major_bucket'], "UG major bucket bar chart",
+       aggregate=lambda df: value_counts(df['ug_major_bucket'], head=10))
+def ug_major_bucket_bar(agg):
+    plt.figure(figsize=(14, 8))
+    major_buckets = _series(agg)
+    plt.bar(range(len(major_buckets)), major_buckets.values, color='mediumorchid')
+    plt.xticks(range(len(major_buckets)), major_buckets.index, rotation=45, ha='right', fontsize=9)
+    plt.ylabel('Number of Students', fontsize=12)
+    plt.title('Top 10 Undergraduate Major Categories', fontsize=14, fontweight='bold')
+    plt.tight_layout()
+
+
+@chart("adwait", "6_major_alignment_pie", ['major_alignment'], "Major alignment pie chart",
+       aggregate=lambda df: value_counts(df['major_alignment']))
+def major_alignment_pie(agg):
+    plt.figure(figsize=(10, 6))
+    alignment_counts = _series(agg)
+    labels = ['Aligned', 'Not Aligned']
+    colors_align = ['#27ae60', '#e67e22']
+    plt.pie(alignment_counts.values, labels=labels, autopct='%1.1f%%',
+            colors=colors_align, startangle=90)
+    plt.title('Major Alignment Distribution\n(Undergrad to Grad)', fontsize=14, fontweight='bold')
+
+
+@chart("adwait", "7_toefl_histogram", ['toefl'], "TOEFL histogram",
+       aggregate=lambda df: histogram(df['toefl'], bins=40))
+def toefl_histogram(agg):
+    plt.figure(figsize=(12, 6))
+    _draw_hist(plt.gca(), agg, color='lightgreen', edgecolor='black', alpha=0.7)
+    plt.xlabel('TOEFL Score', fontsize=12)
+    plt.ylabel('Frequency', fontsize=12)
+    plt.title('TOEFL Score Distribution', fontsize=14, fontweight='bold')
+    plt.axvline(agg['mean'], color='red', linestyle='--', linewidth=2, label=f"Mean: {agg['mean']:.1f}")
+    plt.legend()
+    plt.tight_layout()
+
+
+@chart("adwait", "8_ielts_histogram", ['ielts'], "IELTS histogram",
+       aggregate=lambda df: histogram(df['ielts'], bins=30))
+def ielts_histogram(agg):
+    plt.figure(figsize=(12, 6))
+    _draw_hist(plt.gca(), agg, color='lightsalmon', edgecolor='black', alpha=0.7)
+    plt.xlabel('IELTS Score', fontsize=12)
+    plt.ylabel('Frequency', fontsize=12)
+    plt.title('IELTS Score Distribution', fontsize=14, fontweight='bold')
+    plt.axvline(agg['mean'], color='red', linestyle='--', linewidth=2, label=f"Mean: {agg['mean']:.2f}")
+    plt.legend()
+    plt.tight_layout()
+
+
+@chart("adwait", "9_english_score_by_admission_boxplot", ['english_test_normalized', 'admission_result'],
+       "English score by admission box plot",
+       aggregate=lambda df: box_by_admission(df, 'english_test_normalized'))
+def english_score_by_admission_boxplot(agg):
+    plt.figure(figsize=(10, 6))
+    _draw_box(agg)
+    plt.xlabel('Admission Result', fontsize=12)
+    plt.ylabel('Normalized English Score', fontsize=12)
+    plt.title('English Test Score by Admission Result', fontsize=14, fontweight='bold')
+    plt.tight_layout()
+
+
+@chart("adwait", "10_gre_total_histogram", ['gre_total'], "GRE total histogram",
+       aggregate=lambda df: histogram(df['gre_total'], bins=40))
+def gre_total_histogram(agg):
+    plt.figure(figsize=(12, 6))
+    _draw_hist(plt.gca(), agg, color='mediumpurple', edgecolor='black', alpha=0.7)
+    plt.xlabel('GRE Total Score', fontsize=12)
+    plt.ylabel('Frequency', fontsize=12)
+    plt.title('GRE Total Score Distribution', fontsize=14, fontweight='bold')
+    plt.axvline(agg['mean'], color='red', linestyle='--', linewidth=2, label=f"Mean: {agg['mean']:.1f}")
+    plt.legend()
+    plt.tight_layout()
+
+
+@chart("adwait", "11_gre_verbal_by_admission_violin", ['gre_verbal', 'admission_result'],
+       "GRE verbal by admission violin plot",
+       aggregate=lambda df: violin_by_admission(df, 'gre_verbal'))
+def gre_verbal_by_admission_violin(agg):
+    plt.figure(figsize=(10, 6))
+    _draw_violin(agg)
+    plt.xlabel('Admission Result', fontsize=12)
+    plt.ylabel('GRE Verbal Score', fontsize=12)
+    plt.title('GRE Verbal Score by Admission Result', fontsize=14, fontweight='bold')
+    plt.tight_layout()
+
+
+@chart("adwait", "12_gre_quant_by_admission_violin", ['gre_quant', 'admission_result'],
+       "GRE quant by admission violin plot",
+       aggregate=lambda df: violin_by_admission(df, 'gre_quant'))
+def gre_quant_by_admission_violin(agg):
+    plt.figure(figsize=(10, 6))
+    _draw_violin(agg)
+    plt.xlabel('Admission Result', fontsize=12)
+    plt.ylabel('GRE Quantitative Score', fontsize=12)
+    plt.title('GRE Quantitative Score by Admission Result', fontsize=14, fontweight='bold')
+    plt.tight_layout()
+
 
 # ============================================================================
 # REHA'S ANALYSIS - Experience, Research & Rankings
 # ============================================================================
-print("\n📊 REHA's Analysis - Experience, Research & Rankings")
-
-# 1. GRE AWA Distribution
-plt.figure(figsize=(12, 6))
-awa_data = df['gre_awa'].dropna()
-plt.hist(awa_data, bins=20, color='gold', edgecolor='black', alpha=0.7)
-plt.xlabel('GRE AWA Score', fontsize=12)
-plt.ylabel('Frequency', fontsize=12)
-plt.title('GRE Analytical Writing Score Distribution', fontsize=14, fontweight='bold')
-plt.axvline(awa_data.mean(), color='red', linestyle='--', linewidth=2, label=f'Mean: {awa_data.mean():.2f}')
-plt.legend()
-plt.tight_layout()
-plt.savefig('analysis_graphs/reha/1_gre_awa_histogram.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ GRE AWA histogram")
-
-# 2. Work Experience Distribution
-plt.figure(figsize=(12, 6))
-work_exp_data = df['work_experience'].dropna()
-work_exp_data = work_exp_data[work_exp_data <= 120]  # Filter outliers for better visualization
-plt.hist(work_exp_data, bins=50, color='teal', edgecolor='black', alpha=0.7)
-plt.xlabel('Work Experience (months)', fontsize=12)
-plt.ylabel('Frequency', fontsize=12)
-plt.title('Work Experience Distribution', fontsize=14, fontweight='bold')
-plt.axvline(work_exp_data.mean(), color='red', linestyle='--', linewidth=2, label=f'Mean: {work_exp_data.mean():.1f}')
-plt.legend()
-plt.tight_layout()
-plt.savefig('analysis_graphs/reha/2_work_experience_histogram.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ Work experience histogram")
-
-# 3. Work Experience by Admission
-plt.figure(figsize=(10, 6))
-df_work = df[df['work_experience'].notna()].copy()
-df_work = df_work[df_work['work_experience'] <= 120]
-df_work['admission_result_label'] = df_work['admission_result'].map({0: 'Rejected', 1: 'Admitted'})
-sns.boxplot(data=df_work, x='admission_result_label', y='work_experience', palette=['#e74c3c', '#2ecc71'])
-plt.xlabel('Admission Result', fontsize=12)
-plt.ylabel('Work Experience (months)', fontsize=12)
-plt.title('Work Experience Impact on Admission', fontsize=14, fontweight='bold')
-plt.tight_layout()
-plt.savefig('analysis_graphs/reha/3_work_exp_by_admission_boxplot.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ Work experience by admission box plot")
-
-# 4. Relevant Work Experience
-plt.figure(figsize=(12, 6))
-rel_work_data = df['relevant_work_experience'].dropna()
-rel_work_data = rel_work_data[rel_work_data <= 120]
-plt.hist(rel_work_data, bins=50, color='darkseagreen', edgecolor='black', alpha=0.7)
-plt.xlabel('Relevant Work Experience (months)', fontsize=12)
-plt.ylabel('Frequency', fontsize=12)
-plt.title('Relevant Work Experience Distribution', fontsize=14, fontweight='bold')
-plt.tight_layout()
-plt.savefig('analysis_graphs/reha/4_relevant_work_exp_histogram.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ Relevant work experience histogram")
-
-# 5. Internship Experience
-plt.figure(figsize=(12, 6))
-intern_data = df['internship_experience'].dropna()
-intern_data = intern_data[intern_data <= 60]
-plt.hist(intern_data, bins=40, color='plum', edgecolor='black', alpha=0.7)
-plt.xlabel('Internship Experience (months)', fontsize=12)
-plt.ylabel('Frequency', fontsize=12)
-plt.title('Internship Experience Distribution', fontsize=14, fontweight='bold')
-plt.tight_layout()
-plt.savefig('analysis_graphs/reha/5_internship_exp_histogram.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ Internship experience histogram")
-
-# 6. Publications Distribution
-plt.figure(figsize=(12, 6))
-pub_data = df['publications'].value_counts().sort_index().head(15)
-plt.bar(pub_data.index, pub_data.values, color='indianred')
-plt.xlabel('Number of Publications', fontsize=12)
-plt.ylabel('Number of Students', fontsize=12)
-plt.title('Research Publications Distribution', fontsize=14, fontweight='bold')
-plt.tight_layout()
-plt.savefig('analysis_graphs/reha/6_publications_bar.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ Publications bar chart")
-
-# 7. Scholarship Distribution
-plt.figure(figsize=(10, 6))
-scholarship_counts = df['has_scholarship'].value_counts()
-labels = ['No Scholarship', 'Has Scholarship']
-colors_sch = ['#e74c3c', '#2ecc71']
-plt.pie(scholarship_counts.values, labels=labels, autopct='%1.1f%%',
-        colors=colors_sch, startangle=90)
-plt.title('Scholarship Distribution', fontsize=14, fontweight='bold')
-plt.savefig('analysis_graphs/reha/7_scholarship_pie.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ Scholarship pie chart")
-
-# 8. Scholarship Amount Distribution
-plt.figure(figsize=(12, 6))
-scholarship_amt = df[df['scholarship_amount'].notna() & (df['scholarship_amount'] > 0)]['scholarship_amount']
-if len(scholarship_amt) > 0:
-    plt.hist(scholarship_amt, bins=50, color='goldenrod', edgecolor='black', alpha=0.7)
+
+@chart("reha", "1_gre_awa_histogram", ['gre_awa'], "GRE AWA histogram",
+       aggregate=lambda df: histogram(df['gre_awa'], bins=20))
+def gre_awa_histogram(agg):
+    plt.figure(figsize=(12, 6))
+    _draw_hist(plt.gca(), agg, color='gold', edgecolor='black', alpha=0.7)
+    plt.xlabel('GRE AWA Score', fontsize=12)
+    plt.ylabel('Frequency', fontsize=12)
+    plt.title('GRE Analytical Writing Score Distribution', fontsize=14, fontweight='bold')
+    plt.axvline(agg['mean'], color='red', linestyle='--', linewidth=2, label=f"Mean: {agg['mean']:.2f}")
+    plt.legend()
+    plt.tight_layout()
+
+
+@chart("reha", "2_work_experience_histogram", ['work_experience'], "Work experience histogram",
+       # Filter outliers for better visualization
+       aggregate=lambda df: histogram(df.loc[df['work_experience'] <= 120, 'work_experience'], bins=50))
+def work_experience_histogram(agg):
+    plt.figure(figsize=(12, 6))
+    _draw_hist(plt.gca(), agg, color='teal', edgecolor='black', alpha=0.7)
+    plt.xlabel('Work Experience (months)', fontsize=12)
+    plt.ylabel('Frequency', fontsize=12)
+    plt.title('Work Experience Distribution', fontsize=14, fontweight='bold')
+    plt.axvline(agg['mean'], color='red', linestyle='--', linewidth=2, label=f"Mean: {agg['mean']:.1f}")
+    plt.legend()
+    plt.tight_layout()
+
+
+@chart("reha", "3_work_exp_by_admission_boxplot", ['work_experience', 'admission_result'],
+       "Work experience by admission box plot",
+       aggregate=lambda df: box_by_admission(df, 'work_experience', max_value=120))
+def work_exp_by_admission_boxplot(agg):
+    plt.figure(figsize=(10, 6))
+    _draw_box(agg)
+    plt.xlabel('Admission Result', fontsize=12)
+    plt.ylabel('Work Experience (months)', fontsize=12)
+    plt.title('Work Experience Impact on Admission', fontsize=14, fontweight='bold')
+    plt.tight_layout()
+
+
+@chart("reha", "4_relevant_work_exp_histogram", ['relevant_work_experience'], "Relevant work experience histogram",
+       aggregate=lambda df: histogram(df.loc[df['relevant_work_experience'] <= 120, 'relevant_work_experience'],
+                                      bins=50))
+def relevant_work_exp_histogram(agg):
+    plt.figure(figsize=(12, 6))
+    _draw_hist(plt.gca(), agg, color='darkseagreen', edgecolor='black', alpha=0.7)
+    plt.xlabel('Relevant Work Experience (months)', fontsize=12)
+    plt.ylabel('Frequency', fontsize=12)
+    plt.title('Relevant Work Experience Distribution', fontsize=14, fontweight='bold')
+    plt.tight_layout()
+
+
+@chart("reha", "5_internship_exp_histogram", ['internship_experience'], "Internship experience histogram",
+       aggregate=lambda df: histogram(df.loc[df['internship_experience'] <= 60, 'internship_experience'], bins=40))
+def internship_exp_histogram(agg):
+    plt.figure(figsize=(12, 6))
+    _draw_hist(plt.gca(), agg, color='plum', edgecolor='black', alpha=0.7)
+    plt.xlabel('Internship Experience (months)', fontsize=12)
+    plt.ylabel('Frequency', fontsize=12)
+    plt.title('Internship Experience Distribution', fontsize=14, fontweight='bold')
+    plt.tight_layout()
+
+
+@chart("reha", "6_publications_bar", ['publications'], "Publications bar chart",
+       aggregate=lambda df: value_counts(df['publications'], head=15, sort_index=True))
+def publications_bar(agg):
+    plt.figure(figsize=(12, 6))
+    pub_data = _series(agg)
+    plt.bar(pub_data.index, pub_data.values, color='indianred')
+    plt.xlabel('Number of Publications', fontsize=12)
+    plt.ylabel('Number of Students', fontsize=12)
+    plt.title('Research Publications Distribution', fontsize=14, fontweight='bold')
+    plt.tight_layout()
+
+
+@chart("reha", "7_scholarship_pie", ['has_scholarship'], "Scholarship pie chart",
+       aggregate=lambda df: value_counts(df['has_scholarship']))
+def scholarship_pie(agg):
+    plt.figure(figsize=(10, 6))
+    scholarship_counts = _series(agg)
+    labels = ['No Scholarship', 'Has Scholarship']
+    colors_sch = ['#e74c3c', '#2ecc71']
+    plt.pie(scholarship_counts.values, labels=labels, autopct='%1.1f%%',
+            colors=colors_sch, startangle=90)
+    plt.title('Scholarship Distribution', fontsize=14, fontweight='bold')
+
+
+def _scholarship_amounts(df):
+    amounts = df.loc[df['scholarship_amount'] > 0, 'scholarship_amount']
+    if len(amounts) == 0:
+        return {'skip': "No scholarship amount data available"}
+    return histogram(amounts, bins=50)
+
+
+@chart("reha", "8_scholarship_amount_histogram", ['scholarship_amount'], "Scholarship amount histogram",
+       aggregate=_scholarship_amounts)
+def scholarship_amount_histogram(agg):
+    plt.figure(figsize=(12, 6))
+    _draw_hist(plt.gca(), agg, color='goldenrod', edgecolor='black', alpha=0.7)
     plt.xlabel('Scholarship Amount (USD)', fontsize=12)
     plt.ylabel('Frequency', fontsize=12)
     plt.title('Scholarship Amount Distribution', fontsize=14, fontweight='bold')
     plt.tight_layout()
-    plt.savefig('analysis_graphs/reha/8_scholarship_amount_histogram.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    print("  ✓ Scholarship amount histogram")
-else:
-    print("  ⚠ No scholarship amount data available")
-
-# 9. General Rank Distribution
-plt.figure(figsize=(10, 6))
-df_rank = df[df['gen_rank'].notna()].copy()
-df_rank['admission_result_label'] = df_rank['admission_result'].map({0: 'Rejected', 1: 'Admitted'})
-sns.boxplot(data=df_rank, x='admission_result_label', y='gen_rank', palette=['#e74c3c', '#2ecc71'])
-plt.xlabel('Admission Result', fontsize=12)
-plt.ylabel('University General Ranking', fontsize=12)
-plt.title('University Ranking by Admission Result', fontsize=14, fontweight='bold')
-plt.gca().invert_yaxis()  # Lower rank number = better
-plt.tight_layout()
-plt.savefig('analysis_graphs/reha/9_gen_rank_by_admission_boxplot.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ General rank by admission box plot")
-
-# 10. CS Rank vs Admission
-plt.figure(figsize=(10, 6))
-df_cs = df[(df['cs_rank'].notna()) & (df['cs_rank'] <= 200)].copy()
-if len(df_cs) > 100:
-    colors_scatter = df_cs['admission_result'].map({0: '#e74c3c', 1: '#2ecc71'})
-    plt.scatter(df_cs['cs_rank'], df_cs['admission_result'], alpha=0.5, c=colors_scatter, s=20)
-    plt.xlabel('CS Program Ranking', fontsize=12)
-    plt.ylabel('Admission Result (0=Reject, 1=Admit)', fontsize=12)
-    plt.title('CS Ranking vs Admission Result', fontsize=14, fontweight='bold')
+
+
+@chart("reha", "9_gen_rank_by_admission_boxplot", ['gen_rank', 'admission_result'],
+       "General rank by admission box plot",
+       aggregate=lambda df: box_by_admission(df, 'gen_rank'))
+def gen_rank_by_admission_boxplot(agg):
+    plt.figure(figsize=(10, 6))
+    _draw_box(agg)
+    plt.xlabel('Admission Result', fontsize=12)
+    plt.ylabel('University General Ranking', fontsize=12)
+    plt.title('University Ranking by Admission Result', fontsize=14, fontweight='bold')
+    plt.gca().invert_yaxis()  # Lower rank number = better
     plt.tight_layout()
-    plt.savefig('analysis_graphs/reha/10_cs_rank_scatter.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    print("  ✓ CS rank scatter plot")
-else:
-    print("  ⚠ Insufficient CS rank data")
-
-# 11. Engineering Rank vs Admission
-plt.figure(figsize=(10, 6))
-df_eng_rank = df[(df['eng_rank'].notna()) & (df['eng_rank'] <= 200)].copy()
-if len(df_eng_rank) > 100:
-    colors_scatter = df_eng_rank['admission_result'].map({0: '#e74c3c', 1: '#2ecc71'})
-    plt.scatter(df_eng_rank['eng_rank'], df_eng_rank['admission_result'], alpha=0.5, c=colors_scatter, s=20)
-    plt.xlabel('Engineering Program Ranking', fontsize=12)
+
+
+def rank_points(df, column, program):
+    ranked = df[df[column] <= 200]
+    if len(ranked) <= 100:
+        return {'skip': f"Insufficient {program} rank data"}
+    if ranked[column].notna().sum() > DENSITY_THRESHOLD:
+        # One band of rank bins per admission result (the middle bin between them stays empty)
+        return density_by_admission(ranked, column, 'admission_result', bins=[100, [-0.3, 0.3, 0.7, 1.3]])
+    return points(ranked, column, 'admission_result')
+
+
+def _rank_scatter(agg, program):
+    plt.figure(figsize=(10, 6))
+    if agg.get('mode') == 'density':
+        _draw_density(agg, alpha=0.8)
+        plt.yticks([0, 1])
+    else:
+        colors_scatter = pd.Series(agg['y']).map({0: '#e74c3c', 1: '#2ecc71'}).values
+        _draw_points(agg['x'], agg['y'], agg['count'], alpha=0.5, c=np.repeat(colors_scatter, agg['count']),
+                     s=20)
+    plt.xlabel(f'{program} Program Ranking', fontsize=12)
     plt.ylabel('Admission Result (0=Reject, 1=Admit)', fontsize=12)
-    plt.title('Engineering Ranking vs Admission Result', fontsize=14, fontweight='bold')
+    plt.title(f'{program} Ranking vs Admission Result', fontsize=14, fontweight='bold')
     plt.tight_layout()
-    plt.savefig('analysis_graphs/reha/11_eng_rank_scatter.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    print("  ✓ Engineering rank scatter plot")
-else:
-    print("  ⚠ Insufficient Engineering rank data")
+
+
+@chart("reha", "10_cs_rank_scatter", ['cs_rank', 'admission_result'], "CS rank scatter plot",
+       aggregate=lambda df: rank_points(df, 'cs_rank', 'CS'))
+def cs_rank_scatter(agg):
+    _rank_scatter(agg, 'CS')
+
+
+@chart("reha", "11_eng_rank_scatter", ['eng_rank', 'admission_result'], "Engineering rank scatter plot",
+       aggregate=lambda df: rank_points(df, 'eng_rank', 'Engineering'))
+def eng_rank_scatter(agg):
+    _rank_scatter(agg, 'Engineering')
+
 
 # ============================================================================
 # CROSS-ANALYSIS - Multi-variable insights
 # ============================================================================
-print("\n📊 CROSS-ANALYSIS - Multi-variable Insights")
-
-# 1. Correlation Matrix
-plt.figure(figsize=(14, 12))
-numeric_cols = ['gpa_normalized', 'english_test_normalized', 'gre_total', 'gre_verbal',
-                'gre_quant', 'gre_awa', 'work_experience', 'relevant_work_experience',
-                'internship_experience', 'publications', 'gen_rank', 'admission_result']
-corr_data = df[numeric_cols].corr()
-sns.heatmap(corr_data, annot=True, fmt='.2f', cmap='coolwarm', center=0,
-            square=True, linewidths=1, cbar_kws={"shrink": 0.8})
-plt.title('Correlation Matrix of Key Variables', fontsize=14, fontweight='bold', pad=20)
-plt.tight_layout()
-plt.savefig('analysis_graphs/cross_analysis/1_correlation_matrix.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ Correlation matrix")
-
-# 2. GPA vs GRE by Admission Result
-plt.figure(figsize=(12, 8))
-df_scatter = df[(df['gpa_normalized'].notna()) & (df['gre_total'].notna())].copy()
-admitted = df_scatter[df_scatter['admission_result'] == 1]
-rejected = df_scatter[df_scatter['admission_result'] == 0]
-plt.scatter(rejected['gpa_normalized'], rejected['gre_total'], alpha=0.3, c='red',
-            label='Rejected', s=30)
-plt.scatter(admitted['gpa_normalized'], admitted['gre_total'], alpha=0.3, c='green',
-            label='Admitted', s=30)
-plt.xlabel('Normalized GPA', fontsize=12)
-plt.ylabel('GRE Total Score', fontsize=12)
-plt.title('GPA vs GRE by Admission Result', fontsize=14, fontweight='bold')
-plt.legend()
-plt.grid(True, alpha=0.3)
-plt.tight_layout()
-plt.savefig('analysis_graphs/cross_analysis/2_gpa_vs_gre_scatter.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ GPA vs GRE scatter plot")
-
-# 3. Admission Rate by Top Universities
-plt.figure(figsize=(14, 10))
-top_unis_list = df['university_name'].value_counts().head(20).index
-df_top_unis = df[df['university_name'].isin(top_unis_list)]
-admission_rates = df_top_unis.groupby('university_name')['admission_result'].agg(['mean', 'count'])
-admission_rates = admission_rates[admission_rates['count'] >= 100].sort_values('mean', ascending=False)
-plt.barh(range(len(admission_rates)), admission_rates['mean'] * 100, color='steelblue')
-plt.yticks(range(len(admission_rates)), admission_rates.index, fontsize=9)
-plt.xlabel('Admission Rate (%)', fontsize=12)
-plt.title('Admission Rates by Top Universities', fontsize=14, fontweight='bold')
-plt.gca().invert_yaxis()
-for i, v in enumerate(admission_rates['mean'] * 100):
-    plt.text(v + 0.5, i, f'{v:.1f}%', va='center', fontsize=9)
-plt.tight_layout()
-plt.savefig('analysis_graphs/cross_analysis/3_admission_rates_by_university.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ Admission rates by university")
-
-# 4. Admission Rate by Work Experience Bins
-plt.figure(figsize=(12, 7))
-df_work_bins = df[df['work_experience'].notna()].copy()
-df_work_bins['work_exp_bin'] = pd.cut(df_work_bins['work_experience'],
-                                        bins=[0, 12, 24, 36, 60, 200],
-                                        labels=['0-12 months', '12-24 months', '24-36 months',
-                                               '36-60 months', '60+ months'])
-admission_by_exp = df_work_bins.groupby('work_exp_bin')['admission_result'].agg(['mean', 'count'])
-admission_by_exp = admission_by_exp[admission_by_exp['count'] >= 100]
-plt.bar(range(len(admission_by_exp)), admission_by_exp['mean'] * 100, color='darkorange')
-plt.xticks(range(len(admission_by_exp)), admission_by_exp.index, rotation=45, ha='right')
-plt.ylabel('Admission Rate (%)', fontsize=12)
-plt.xlabel('Work Experience Range', fontsize=12)
-plt.title('Admission Rate by Work Experience', fontsize=14, fontweight='bold')
-for i, v in enumerate(admission_by_exp['mean'] * 100):
-    plt.text(i, v + 0.5, f'{v:.1f}%', ha='center', fontsize=10)
-plt.tight_layout()
-plt.savefig('analysis_graphs/cross_analysis/4_admission_by_work_exp.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ Admission rate by work experience")
-
-# 5. Publications Impact
-plt.figure(figsize=(12, 7))
-df_pub = df[df['publications'] <= 10].copy()
-pub_impact = df_pub.groupby('publications')['admission_result'].agg(['mean', 'count'])
-pub_impact = pub_impact[pub_impact['count'] >= 100]
-plt.bar(pub_impact.index, pub_impact['mean'] * 100, color='mediumseagreen')
-plt.xlabel('Number of Publications', fontsize=12)
-plt.ylabel('Admission Rate (%)', fontsize=12)
-plt.title('Admission Rate by Number of Publications', fontsize=14, fontweight='bold')
-for i, (idx, v) in enumerate(zip(pub_impact.index, pub_impact['mean'] * 100)):
-    plt.text(idx, v + 0.5, f'{v:.1f}%', ha='center', fontsize=10)
-plt.tight_layout()
-plt.savefig('analysis_graphs/cross_analysis/5_admission_by_publications.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ Admission rate by publications")
-
-# 6. Score Distribution by Student Type
-fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-fig.suptitle('Test Score Distributions: International vs Domestic Students',
-             fontsize=16, fontweight='bold')
-
-# GPA
-df_gpa_type = df[df['gpa_normalized'].notna()]
-for student_type in ['International', 'Domestic']:
-    data = df_gpa_type[df_gpa_type['student_type'] == student_type]['gpa_normalized']
-    axes[0, 0].hist(data, bins=30, alpha=0.6, label=student_type)
-axes[0, 0].set_xlabel('Normalized GPA')
-axes[0, 0].set_ylabel('Frequency')
-axes[0, 0].set_title('GPA Distribution')
-axes[0, 0].legend()
-
-# GRE
-df_gre_type = df[df['gre_total'].notna()]
-for student_type in ['International', 'Domestic']:
-    data = df_gre_type[df_gre_type['student_type'] == student_type]['gre_total']
-    axes[0, 1].hist(data, bins=30, alpha=0.6, label=student_type)
-axes[0, 1].set_xlabel('GRE Total Score')
-axes[0, 1].set_ylabel('Frequency')
-axes[0, 1].set_title('GRE Distribution')
-axes[0, 1].legend()
-
-# TOEFL
-df_toefl_type = df[df['toefl'].notna()]
-for student_type in ['International', 'Domestic']:
-    data = df_toefl_type[df_toefl_type['student_type'] == student_type]['toefl']
-    if len(data) > 10:
-        axes[1, 0].hist(data, bins=30, alpha=0.6, label=student_type)
-axes[1, 0].set_xlabel('TOEFL Score')
-axes[1, 0].set_ylabel('Frequency')
-axes[1, 0].set_title('TOEFL Distribution')
-axes[1, 0].legend()
-
-# Work Experience
-df_work_type = df[df['work_experience'].notna() & (df['work_experience'] <= 120)]
-for student_type in ['International', 'Domestic']:
-    data = df_work_type[df_work_type['student_type'] == student_type]['work_experience']
-    axes[1, 1].hist(data, bins=30, alpha=0.6, label=student_type)
-axes[1, 1].set_xlabel('Work Experience (months)')
-axes[1, 1].set_ylabel('Frequency')
-axes[1, 1].set_title('Work Experience Distribution')
-axes[1, 1].legend()
-
-plt.tight_layout()
-plt.savefig('analysis_graphs/cross_analysis/6_scores_by_student_type.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ Score distributions by student type")
-
-# 7. Admission Rate by GRE Score Bins
-plt.figure(figsize=(12, 7))
-df_gre_bins = df[df['gre_total'].notna()].copy()
-df_gre_bins['gre_bin'] = pd.cut(df_gre_bins['gre_total'],
-                                 bins=[0, 300, 310, 320, 330, 340],
-                                 labels=['<300', '300-310', '310-320', '320-330', '330-340'])
-admission_by_gre = df_gre_bins.groupby('gre_bin')['admission_result'].agg(['mean', 'count'])
-admission_by_gre = admission_by_gre[admission_by_gre['count'] >= 100]
-plt.bar(range(len(admission_by_gre)), admission_by_gre['mean'] * 100, color='mediumpurple')
-plt.xticks(range(len(admission_by_gre)), admission_by_gre.index)
-plt.ylabel('Admission Rate (%)', fontsize=12)
-plt.xlabel('GRE Score Range', fontsize=12)
-plt.title('Admission Rate by GRE Score Range', fontsize=14, fontweight='bold')
-for i, v in enumerate(admission_by_gre['mean'] * 100):
-    plt.text(i, v + 0.5, f'{v:.1f}%', ha='center', fontsize=10)
-plt.tight_layout()
-plt.savefig('analysis_graphs/cross_analysis/7_admission_by_gre_bins.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ Admission rate by GRE bins")
-
-# 8. Top Programs Admission Rates
-plt.figure(figsize=(14, 10))
-top_programs_list = df['course_name'].value_counts().head(20).index
-df_top_programs = df[df['course_name'].isin(top_programs_list)]
-program_admission = df_top_programs.groupby('course_name')['admission_result'].agg(['mean', 'count'])
-program_admission = program_admission[program_admission['count'] >= 100].sort_values('mean', ascending=False)
-plt.barh(range(len(program_admission)), program_admission['mean'] * 100, color='coral')
-plt.yticks(range(len(program_admission)), program_admission.index, fontsize=9)
-plt.xlabel('Admission Rate (%)', fontsize=12)
-plt.title('Admission Rates by Top Programs', fontsize=14, fontweight='bold')
-plt.gca().invert_yaxis()
-for i, v in enumerate(program_admission['mean'] * 100):
-    plt.text(v + 0.5, i, f'{v:.1f}%', va='center', fontsize=9)
-plt.tight_layout()
-plt.savefig('analysis_graphs/cross_analysis/8_admission_by_program.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("  ✓ Admission rates by program")
+
+CORRELATION_COLUMNS = ['gpa_normalized', 'english_test_normalized', 'gre_total', 'gre_verbal',
+                       'gre_quant', 'gre_awa', 'work_experience', 'relevant_work_experience',
+                       'internship_experience', 'publications', 'gen_rank', 'admission_result']
+
+
+@chart("cross_analysis", "1_correlation_matrix", CORRELATION_COLUMNS, "Correlation matrix",
+       aggregate=lambda df: {'columns': CORRELATION_COLUMNS,
+                             'matrix': df[CORRELATION_COLUMNS].astype(float).corr().values})
+def correlation_matrix(agg):
+    plt.figure(figsize=(14, 12))
+    corr_data = pd.DataFrame(agg['matrix'], index=agg['columns'], columns=agg['columns'], dtype=float)
+    sns.heatmap(corr_data, annot=True, fmt='.2f', cmap='coolwarm', center=0,
+                square=True, linewidths=1, cbar_kws={"shrink": 0.8})
+    plt.title('Correlation Matrix of Key Variables', fontsize=14, fontweight='bold', pad=20)
+    plt.tight_layout()
+
+
+def gpa_gre_points(df):
+    df_scatter = df[(df['gpa_normalized'].notna()) & (df['gre_total'].notna())]
+    if len(df_scatter) > DENSITY_THRESHOLD:
+        return density_by_admission(df_scatter, 'gpa_normalized', 'gre_total', bins=[100, 80])
+    return {label: points(df_scatter[df_scatter['admission_result'] == result], 'gpa_normalized', 'gre_total')
+            for result, label in enumerate(ADMISSION_LABELS)}
+
+
+@chart("cross_analysis", "2_gpa_vs_gre_scatter", ['gpa_normalized', 'gre_total', 'admission_result'],
+       "GPA vs GRE scatter plot", aggregate=gpa_gre_points)
+def gpa_vs_gre_scatter(agg):
+    plt.figure(figsize=(12, 8))
+    if agg.get('mode') == 'density':
+        handles = _draw_density(agg)
+    else:
+        rejected, admitted = agg['Rejected'], agg['Admitted']
+        _draw_points(rejected['x'], rejected['y'], rejected['count'], alpha=0.3, c='red',
+                     label='Rejected', s=30)
+        _draw_points(admitted['x'], admitted['y'], admitted['count'], alpha=0.3, c='green',
+                     label='Admitted', s=30)
+        handles = None
+    plt.xlabel('Normalized GPA', fontsize=12)
+    plt.ylabel('GRE Total Score', fontsize=12)
+    plt.title('GPA vs GRE by Admission Result', fontsize=14, fontweight='bold')
+    plt.legend(handles=handles)
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+
+
+def _rate_barh(rates, color, title):
+    rate_pct = np.asarray(rates['mean'], dtype=float) * 100
+    plt.barh(range(len(rate_pct)), rate_pct, color=color)
+    plt.yticks(range(len(rate_pct)), rates['index'], fontsize=9)
+    plt.xlabel('Admission Rate (%)', fontsize=12)
+    plt.title(title, fontsize=14, fontweight='bold')
+    plt.gca().invert_yaxis()
+    for i, v in enumerate(rate_pct):
+        plt.text(v + 0.5, i, f'{v:.1f}%', va='center', fontsize=9)
+    plt.tight_layout()
+
+
+def _rate_bar(rates, color, xlabel, title, rotate=False):
+    rate_pct = np.asarray(rates['mean'], dtype=float) * 100
+    plt.bar(range(len(rate_pct)), rate_pct, color=color)
+    if rotate:
+        plt.xticks(range(len(rate_pct)), rates['index'], rotation=45, ha='right')
+    else:
+        plt.xticks(range(len(rate_pct)), rates['index'])
+    plt.ylabel('Admission Rate (%)', fontsize=12)
+    plt.xlabel(xlabel, fontsize=12)
+    plt.title(title, fontsize=14, fontweight='bold')
+    for i, v in enumerate(rate_pct):
+        plt.text(i, v + 0.5, f'{v:.1f}%', ha='center', fontsize=10)
+    plt.tight_layout()
+
+
+# Every admission-rate breakdown of the cross-analysis charts, counted in one pass
+RATE_DIMENSIONS = [
+    Dimension('university', 'university_name'),
+    Dimension('program', 'course_name'),
+    Dimension('work_experience', 'work_experience', bins=[0, 12, 24, 36, 60, 200],
+              labels=['0-12 months', '12-24 months', '24-36 months', '36-60 months', '60+ months']),
+    Dimension('publications', 'publications', max_value=10),
+    Dimension('gre', 'gre_total', bins=[0, 300, 310, 320, 330, 340],
+              labels=['<300', '300-310', '310-320', '320-330', '330-340']),
+]
+RATE_COLUMNS = ['admission_result'] + [dimension.column for dimension in RATE_DIMENSIONS]
+
+
+@chart("cross_analysis", "3_admission_rates_by_university", ['university_name', 'admission_result'],
+       "Admission rates by university", rates=dict(name='university', top=20, sort=True))
+def admission_rates_by_university(agg):
+    plt.figure(figsize=(14, 10))
+    _rate_barh(agg, 'steelblue', 'Admission Rates by Top Universities')
+
+
+@chart("cross_analysis", "4_admission_by_work_exp", ['work_experience', 'admission_result'],
+       "Admission rate by work experience", rates=dict(name='work_experience'))
+def admission_by_work_exp(agg):
+    plt.figure(figsize=(12, 7))
+    _rate_bar(agg, 'darkorange', 'Work Experience Range', 'Admission Rate by Work Experience', rotate=True)
+
+
+@chart("cross_analysis", "5_admission_by_publications", ['publications', 'admission_result'],
+       "Admission rate by publications", rates=dict(name='publications'))
+def admission_by_publications(agg):
+    plt.figure(figsize=(12, 7))
+    rate_pct = np.asarray(agg['mean'], dtype=float) * 100
+    plt.bar(agg['index'], rate_pct, color='mediumseagreen')
+    plt.xlabel('Number of Publications', fontsize=12)
+    plt.ylabel('Admission Rate (%)', fontsize=12)
+    plt.title('Admission Rate by Number of Publications', fontsize=14, fontweight='bold')
+    for idx, v in zip(agg['index'], rate_pct):
+        plt.text(idx, v + 0.5, f'{v:.1f}%', ha='center', fontsize=10)
+    plt.tight_layout()
+
+
+# (column, upper limit, minimum rows per student type, x label, title)
+STUDENT_TYPE_PANELS = [
+    ('gpa_normalized', None, 0, 'Normalized GPA', 'GPA Distribution'),
+    ('gre_total', None, 0, 'GRE Total Score', 'GRE Distribution'),
+    ('toefl', None, 10, 'TOEFL Score', 'TOEFL Distribution'),
+    ('work_experience', 120, 0, 'Work Experience (months)', 'Work Experience Distribution'),
+]
+STUDENT_TYPES = ['International', 'Domestic']
+
+
+def student_type_histograms(df):
+    panels = []
+    for column, max_value, min_rows, _, _ in STUDENT_TYPE_PANELS:
+        subset = df[df[column].notna()]
+        if max_value is not None:
+            subset = subset[subset[column] <= max_value]
+        hists = {}
+        for student_type in STUDENT_TYPES:
+            data = subset.loc[subset['student_type'] == student_type, column]
+            if len(data) > min_rows or min_rows == 0:
+                hists[student_type] = histogram(data, bins=30)
+        panels.append(hists)
+    return {'panels': panels}
+
+
+@chart("cross_analysis", "6_scores_by_student_type",
+       ['student_type', 'gpa_normalized', 'gre_total', 'toefl', 'work_experience'],
+       "Score distributions by student type", aggregate=student_type_histograms)
+def scores_by_student_type(agg):
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    fig.suptitle('Test Score Distributions: International vs Domestic Students',
+                 fontsize=16, fontweight='bold')
+
+    for ax, hists, (_, _, _, xlabel, title) in zip(axes.flat, agg['panels'], STUDENT_TYPE_PANELS):
+        for student_type in STUDENT_TYPES:
+            if student_type in hists:
+                _draw_hist(ax, hists[student_type], alpha=0.6, label=student_type)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel('Frequency')
+        ax.set_title(title)
+        ax.legend()
+
+    plt.tight_layout()
+
+
+@chart("cross_analysis", "7_admission_by_gre_bins", ['gre_total', 'admission_result'], "Admission rate by GRE bins",
+       rates=dict(name='gre'))
+def admission_by_gre_bins(agg):
+    plt.figure(figsize=(12, 7))
+    _rate_bar(agg, 'mediumpurple', 'GRE Score Range', 'Admission Rate by GRE Score Range')
+
+
+@chart("cross_analysis", "8_admission_by_program", ['course_name', 'admission_result'], "Admission rates by program",
+       rates=dict(name='program', top=20, sort=True))
+def admission_by_program(agg):
+    plt.figure(figsize=(14, 10))
+    _rate_barh(agg, 'coral', 'Admission Rates by Top Programs')
+
+
+# ============================================================================
+# FINGERPRINTS - what each stored aggregate and output was built from
+# ============================================================================
+
+MANIFEST_FILE = '.manifest.json'
+SUMMARY_KEY = 'summary_statistics.txt'
+CUBE_KEY = 'rate_cube'
+
+
+def _digest(*parts):
+    return hashlib.sha1(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _code_objects(code):
+    yield code
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            yield from _code_objects(const)
+
+
+def code_fingerprint(func):
+    """Hash of a function's source plus the module-level helpers and constants it uses, recursively"""
+    module_globals = func.__globals__
+    sources, seen, pending = set(), set(), [func]
+    while pending:
+        obj = pending.pop()
+        if obj in seen:
+            continue
+        seen.add(obj)
+        try:
+            sources.add(inspect.getsource(obj))
+        except (OSError, TypeError):
+            sources.add(obj.__code__.co_code.hex())
+        for code in _code_objects(obj.__code__):
+            for name in code.co_names:
+                value = module_globals.get(name)
+                if inspect.isfunction(value) and value.__module__ == func.__module__:
+                    pending.append(value)
+                elif isinstance(value, (list, tuple, dict, str, int, float)):
+                    sources.add(f"{name} = {value!r}")
+    return _digest(sorted(sources))
+
+
+def style_fingerprint():
+    """Hash of the matplotlib rcParams (seaborn style, figure size, fonts) every chart is drawn with"""
+    return _digest(sorted((key, repr(value)) for key, value in plt.rcParams.items()))
+
+
+def cube_fingerprint(data_hash):
+    return _digest(data_hash, RATE_DIMENSIONS, inspect.getsource(rate_cube))
+
+
+def aggregate_fingerprint(key, data_hash):
+    task = CHARTS[key]
+    if task.rates:
+        return _digest(cube_fingerprint(data_hash), task.rates)
+    return _digest(data_hash, task.columns, code_fingerprint(task.aggregate))
+
+
+def summary_fingerprint(data_hash):
+    return _digest(data_hash, inspect.getsource(summary_stats))
+
+
+def output_fingerprint(key, agg, dpi, style):
+    """Content hash of a chart's inputs: its aggregate values, render code, DPI and style"""
+    return _digest(agg, code_fingerprint(CHARTS[key].render), dpi, style)
+
+
+def load_manifest(output_dir):
+    path = Path(output_dir) / MANIFEST_FILE
+    if not path.exists():
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_manifest(manifest, output_dir):
+    path = Path(output_dir) / MANIFEST_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def is_up_to_date(manifest, key, fingerprint, path):
+    """An output is current if it was built from the same fingerprint and (if it was saved) still exists"""
+    entry = manifest.get(key)
+    if not entry or entry['fingerprint'] != fingerprint:
+        return False
+    return not entry['saved'] or os.path.exists(path)
+
 
 # ============================================================================
-# GENERATE SUMMARY STATISTICS
+# AGGREGATION STAGE
 # ============================================================================
-print("\n" + "="*80)
-print("GENERATING SUMMARY STATISTICS")
-print("="*80)
-
-summary_stats = {
-    "Total Records": len(df),
-    "Total Students": df['student_id'].nunique(),
-    "International Students": (df['student_type'] == 'International').sum(),
-    "Domestic Students": (df['student_type'] == 'Domestic').sum(),
-    "Total Admitted": (df['admission_result'] == 1).sum(),
-    "Total Rejected": (df['admission_result'] == 0).sum(),
-    "Overall Admission Rate (%)": (df['admission_result'].mean() * 100),
-    "Avg GPA (Normalized)": df['gpa_normalized'].mean(),
-    "Avg GRE Total": df['gre_total'].mean(),
-    "Avg TOEFL": df['toefl'].mean(),
-    "Avg IELTS": df['ielts'].mean(),
-    "Avg Work Experience (months)": df['work_experience'].mean(),
-    "Avg Publications": df['publications'].mean(),
-    "Students with Scholarships": (df['has_scholarship'] == True).sum(),
-    "Unique Universities": df['university_name'].nunique(),
-    "Unique Programs": df['course_name'].nunique(),
-}
 
-# Save summary statistics
-with open('analysis_graphs/summary_statistics.txt', 'w') as f:
-    f.write("="*80 + "\n")
-    f.write("SUMMARY STATISTICS\n")
-    f.write("="*80 + "\n\n")
-    for key, value in summary_stats.items():
-        if isinstance(value, float):
-            f.write(f"{key}: {value:.2f}\n")
-        else:
-            f.write(f"{key}: {value}\n")
-
-    f.write("\n" + "="*80 + "\n")
-    f.write("TOP 10 UNIVERSITIES BY APPLICATION COUNT\n")
-    f.write("="*80 + "\n")
-    top_unis = df['university_name'].value_counts().head(10)
-    for i, (uni, count) in enumerate(top_unis.items(), 1):
-        f.write(f"{i}. {uni}: {count}\n")
-
-    f.write("\n" + "="*80 + "\n")
-    f.write("TOP 10 PROGRAMS BY APPLICATION COUNT\n")
-    f.write("="*80 + "\n")
-    top_programs = df['course_name'].value_counts().head(10)
-    for i, (prog, count) in enumerate(top_programs.items(), 1):
-        f.write(f"{i}. {prog}: {count}\n")
-
-print("\n✅ Summary statistics saved to: analysis_graphs/summary_statistics.txt")
-
-print("\n" + "="*80)
-print("ANALYSIS COMPLETE!")
-print("="*80)
-print(f"\nTotal graphs generated:")
-print(f"  - Raj's folder: 10 graphs")
-print(f"  - Adwait's folder: 12 graphs")
-print(f"  - Reha's folder: 11 graphs")
-print(f"  - Cross-analysis folder: 8 graphs")
-print(f"\nAll visualizations saved in: analysis_graphs/")
-print("="*80)
+def source_hash(data_path):
+    """Hash identifying the source data (path, size, mtime and ingest schema); None if it is missing"""
+    if not os.path.exists(data_path):
+        return None
+    fingerprint = json.dumps(source_fingerprint(data_path), sort_keys=True)
+    return hashlib.sha1(fingerprint.encode()).hexdigest()
+
+
+def load_aggregates(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_aggregates(aggregates, path):
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(aggregates, f)
+    os.replace(tmp_path, path)
+
+
+def compute_aggregates(df, keys, cube):
+    """Aggregate inputs of the given charts from one loaded frame and the rate cube; returns {key: aggregate}"""
+    aggregates = {}
+    for key in keys:
+        task = CHARTS[key]
+        agg = cube.rates(**task.rates) if task.rates else task.aggregate(df[task.columns])
+        # Round-trip through JSON so charts render identically from a fresh or a cached aggregate
+        aggregates[key] = json.loads(json.dumps(_jsonable(agg)))
+    return aggregates
+
+
+# ============================================================================
+# RENDERING
+# ============================================================================
+
+def chart_path(key, output_dir=OUTPUT_DIR):
+    task = CHARTS[key]
+    return Path(output_dir) / task.group / f"{task.name}.png"
+
+
+def render_chart(key, agg, output_dir=OUTPUT_DIR, dpi=300):
+    """Draw one registered chart from its aggregate and save it; returns (key, saved, message)"""
+    task = CHARTS[key]
+    if agg.get('skip'):
+        return key, False, agg['skip']
+    try:
+        task.render(agg)
+        plt.savefig(chart_path(key, output_dir), dpi=dpi, bbox_inches='tight')
+        return key, True, task.label
+    finally:
+        plt.close('all')
+
+
+def select_charts(groups=None, charts=None):
+    """Registered chart keys filtered by analyst group and/or chart name (e.g. 2_gpa_vs_gre_scatter)"""
+    keys = []
+    for key, task in CHARTS.items():
+        if groups and task.group not in groups:
+            continue
+        if charts and task.name not in charts and key not in charts:
+            continue
+        keys.append(key)
+    return keys
+
+
+def render_charts(aggregates, keys, output_dir=OUTPUT_DIR, dpi=300, workers=None):
+    """Render the selected charts from their aggregates across a process pool; returns {key: (saved, message)}"""
+    for group in {CHARTS[key].group for key in keys}:
+        Path(output_dir, group).mkdir(parents=True, exist_ok=True)
+
+    results = {}
+    if workers == 1:
+        for key in keys:
+            key, saved, message = render_chart(key, aggregates[key], output_dir, dpi)
+            results[key] = (saved, message)
+            print(f"  {'✓' if saved else '⚠'} [{CHARTS[key].group}] {message}")
+        return results
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(render_chart, key, aggregates[key], output_dir, dpi) for key in keys]
+        for future in as_completed(futures):
+            key, saved, message = future.result()
+            results[key] = (saved, message)
+            print(f"  {'✓' if saved else '⚠'} [{CHARTS[key].group}] {message}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render the admissions analysis charts in parallel")
+    parser.add_argument('--data', default=DATA_PATH, help="Decisions JSONL file (.jsonl, .jsonl.gz, .jsonl.zst)")
+    parser.add_argument('--refresh-cache', action='store_true', help="Rebuild the columnar cache of the data")
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help="Root folder for the chart folders")
+    parser.add_argument('--aggregates', default=None,
+                        help=f"Aggregates file (default: <output-dir>/{AGGREGATES_FILE})")
+    parser.add_argument('--refresh-aggregates', action='store_true', help="Recompute all chart aggregates")
+    parser.add_argument('--from-aggregates', action='store_true',
+                        help="Render from the stored aggregates without checking or loading the data file")
+    parser.add_argument('--force', action='store_true', help="Re-render outputs even if they are up to date")
+    parser.add_argument('--groups', nargs='+', choices=list(GROUPS), help="Only render these analyst groups")
+    parser.add_argument('--charts', nargs='+',
+                        help="Only render these charts, by name (1_student_type_pie) or group/name")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help="Rendering processes (1 renders in-process)")
+    parser.add_argument('--dpi', type=int, default=300, help="Output resolution")
+    parser.add_argument('--list', action='store_true', help="List the registered charts and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for key, task in CHARTS.items():
+            print(f"{key:<55} {', '.join(task.columns)}")
+        return
+
+    keys = select_charts(args.groups, args.charts)
+    if not keys:
+        parser.error("No charts match --groups/--charts (see --list)")
+
+    aggregates_path = args.aggregates or f"{args.output_dir}/{AGGREGATES_FILE}"
+    aggregates = load_aggregates(aggregates_path)
+    if args.from_aggregates and aggregates is None:
+        parser.error(f"--from-aggregates: {aggregates_path} does not exist")
+    if aggregates is None or args.refresh_aggregates:
+        aggregates = {'source_hash': None, 'source': args.data, 'charts': {}, 'fingerprints': {}, 'summary': None}
+    aggregates.setdefault('fingerprints', {})
+
+    # ========================================================================
+    # AGGREGATION STAGE - only for charts whose data or aggregate code changed
+    # ========================================================================
+    if args.from_aggregates:
+        stale = [key for key in keys if key not in aggregates['charts']]
+        summary_stale = aggregates.get('summary') is None
+        if stale or summary_stale:
+            parser.error(f"--from-aggregates: no stored aggregates for {', '.join(stale) or 'the summary'}")
+    else:
+        data_hash = source_hash(args.data)
+        wanted = {key: aggregate_fingerprint(key, data_hash) for key in keys}
+        stale = [key for key in keys
+                 if key not in aggregates['charts'] or aggregates['fingerprints'].get(key) != wanted[key]]
+        wanted_summary = summary_fingerprint(data_hash)
+        summary_stale = aggregates['fingerprints'].get(SUMMARY_KEY) != wanted_summary
+        wanted_cube = cube_fingerprint(data_hash)
+        cube_stale = aggregates['fingerprints'].get(CUBE_KEY) != wanted_cube or CUBE_KEY not in aggregates
+
+    if stale or summary_stale:
+        print(f"Aggregates: {len(keys) - len(stale)} up to date, {len(stale)} stale")
+        started = time.perf_counter()
+        if stale:
+            print("Loading data...")
+            # Only the columns the stale charts read
+            columns = set().union(*(CHARTS[key].columns for key in stale if not CHARTS[key].rates))
+            cube_needed = any(CHARTS[key].rates for key in stale)
+            if cube_needed and cube_stale:
+                columns.update(RATE_COLUMNS)
+            df = load_decisions(args.data, columns=columns, refresh=args.refresh_cache)
+            print(f"Total records loaded: {len(df)}")
+            print(f"Total columns: {len(df.columns)}")
+
+            if cube_needed and cube_stale:
+                # All admission-rate breakdowns at once, shared by the rate charts
+                aggregates[CUBE_KEY] = _jsonable(RateCube.build(df, RATE_DIMENSIONS).to_dict())
+                aggregates['fingerprints'][CUBE_KEY] = wanted_cube
+            cube = RateCube.from_dict(aggregates.get(CUBE_KEY, {}))
+            aggregates['charts'].update(compute_aggregates(df, stale, cube))
+            aggregates['fingerprints'].update({key: wanted[key] for key in stale})
+            del df
+        if summary_stale:
+            # Running aggregates: appended records are folded in, anything else rebuilds from the cache
+            state, how = summary_stats.refresh(
+                args.data, f"{args.output_dir}/{summary_stats.STATE_FILE}",
+                frame=lambda: load_decisions(args.data, columns=summary_stats.SUMMARY_COLUMNS))
+            print(f"✓ Summary state {how} ({state.records} records)")
+            aggregates['summary'] = json.loads(json.dumps(_jsonable(state.report())))
+            aggregates['fingerprints'][SUMMARY_KEY] = wanted_summary
+        aggregates['source_hash'] = data_hash
+        aggregates['source'] = args.data
+        aggregates['built_at'] = time.strftime("%Y-%m-%d %H:%M:%S")
+        save_aggregates(aggregates, aggregates_path)
+        print(f"✓ Aggregated {len(stale)} charts in {time.perf_counter() - started:.1f}s -> {aggregates_path}")
+    else:
+        print(f"✓ Using stored aggregates from {aggregates_path}")
+
+    # ========================================================================
+    # RENDER STAGE - aggregates only, stale outputs only
+    # ========================================================================
+    manifest = load_manifest(args.output_dir)
+    style = style_fingerprint()
+    outputs = {key: output_fingerprint(key, aggregates['charts'][key], args.dpi, style) for key in keys}
+    to_render = [key for key in keys
+                 if args.force or not is_up_to_date(manifest, key, outputs[key], chart_path(key, args.output_dir))]
+
+    print("\n" + "="*80)
+    print(f"GENERATING VISUALIZATIONS ({len(to_render)} stale, {len(keys) - len(to_render)} up to date, "
+          f"{args.workers} workers)")
+    print("="*80)
+    started = time.perf_counter()
+    results = {}
+    if to_render:
+        results = render_charts(aggregates['charts'], to_render, output_dir=args.output_dir, dpi=args.dpi,
+                                workers=args.workers)
+    for key, (saved, _) in results.items():
+        manifest[key] = {'fingerprint': outputs[key], 'saved': saved}
+    elapsed = time.perf_counter() - started
+
+    print("\n" + "="*80)
+    print("GENERATING SUMMARY STATISTICS")
+    print("="*80)
+    summary_path = f"{args.output_dir}/summary_statistics.txt"
+    summary_output = _digest(aggregates['summary'], code_fingerprint(summary_stats.write_report))
+    if args.force or not is_up_to_date(manifest, SUMMARY_KEY, summary_output, summary_path):
+        summary_stats.write_report(aggregates['summary'], summary_path)
+        manifest[SUMMARY_KEY] = {'fingerprint': summary_output, 'saved': True}
+        print(f"\n✅ Summary statistics saved to: {summary_path}")
+    else:
+        print(f"\n✓ Summary statistics up to date: {summary_path}")
+    save_manifest(manifest, args.output_dir)
+
+    print("\n" + "="*80)
+    print("ANALYSIS COMPLETE!")
+    print("="*80)
+    print(f"\nGraphs rebuilt in {elapsed:.1f}s:")
+    for group in GROUPS:
+        group_keys = [key for key in keys if CHARTS[key].group == group]
+        if group_keys:
+            rebuilt = sum(1 for key in group_keys if results.get(key, (False,))[0])
+            print(f"  - {group} folder: {rebuilt} rebuilt, {len(group_keys) - len(set(group_keys) & set(results))} "
+                  f"up to date")
+    print(f"\nAll visualizations saved in: {args.output_dir}/")
+    print("="*80)
+
+
+if __name__ == "__main__":
+    main()
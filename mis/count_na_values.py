@@ -1,35 +1,219 @@
+"""
+Missing-value profile of a JSON export (all_profiles.json)
+Streams a JSON array or JSONL file record by record in constant memory and
+counts, for every field seen in any record, the "N/A", null and empty values.
+Large files are split into byte ranges at record boundaries and counted in
+parallel worker processes
+
+Usage:
+    python count_na_values.py                          # all_profiles.json
+    python count_na_values.py export.jsonl --workers 8
+    python count_na_values.py all_profiles.json --detail
+"""
+
+import argparse
+import codecs
 import json
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+BLOCK_SIZE = 1 << 20
+# Below this size a file is counted in-process
+PARALLEL_MIN_BYTES = 64 << 20
+# Ranges per worker, so uneven ranges still balance out
+RANGES_PER_WORKER = 4
+
+KINDS = ("na", "null", "empty")
+
+
+def detect_format(path):
+    """'array' for a JSON array, 'jsonl' for one JSON object per line"""
+    with open(path, 'rb') as f:
+        head = f.read(4096).lstrip(codecs.BOM_UTF8 + b" \t\r\n")
+    return 'array' if head.startswith(b"[") else 'jsonl'
+
+
+def record_separator(path):
+    """Byte pattern that starts every top-level record, or None if records can't be located without parsing.
+
+    JSONL records start after a newline. Pretty-printed arrays (json.dump(..., indent=N)) start each
+    record on its own line at the first indentation level, and JSON strings can't hold raw newlines,
+    so that pattern never matches inside a record. Compact single-line arrays have no such marker.
+    """
+    if detect_format(path) == 'jsonl':
+        return b"\n"
+    with open(path, 'rb') as f:
+        head = f.read(BLOCK_SIZE)
+    match = re.search(rb"\[\r?\n([ \t]*)\{", head)
+    return b"\n" + match.group(1) + b"{" if match else None
+
+
+def split_ranges(path, parts, separator):
+    """Byte ranges [start, end) covering the file, each starting at a record boundary"""
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, 'rb') as f:
+        for i in range(1, parts):
+            offset = max(size * i // parts, bounds[-1])
+            f.seek(offset)
+            window = b""
+            # Scan forward for the next separator (records may be larger than a block)
+            while True:
+                block = f.read(BLOCK_SIZE)
+                window = window[-len(separator):] + block if window else block
+                found = window.find(separator)
+                if found >= 0:
+                    start = f.tell() - len(window) + found + 1  # keep the newline in the previous range
+                    break
+                if not block:
+                    start = size
+                    break
+            if start > bounds[-1]:
+                bounds.append(start)
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def _read_range(f, start, end):
+    """Decoded text blocks of the byte range [start, end)"""
+    decoder = codecs.getincrementaldecoder('utf-8-sig' if start == 0 else 'utf-8')()
+    f.seek(start)
+    remaining = end - start
+    while remaining > 0:
+        block = f.read(min(BLOCK_SIZE, remaining))
+        if not block:
+            break
+        remaining -= len(block)
+        yield decoder.decode(block, final=remaining <= 0)
+
+
+def iter_array_records(f, start, end):
+    """Objects of a JSON array in the byte range, decoded incrementally from a bounded buffer"""
+    decoder = json.JSONDecoder()
+    blocks = _read_range(f, start, end)
+    buffer, pos, exhausted = "", 0, False
+    while True:
+        # Skip whitespace and the array punctuation between records
+        while pos < len(buffer) and buffer[pos] in " \t\r\n,[]":
+            pos += 1
+        if pos == len(buffer):
+            buffer, pos = next(blocks, None), 0
+            if buffer is None:
+                return
+            continue
+        try:
+            record, pos = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if exhausted:
+                raise
+            # The record continues in the next block
+            block = next(blocks, None)
+            if block is None:
+                exhausted = True
+            else:
+                buffer, pos = buffer[pos:] + block, 0
+            continue
+        yield record
+        if pos > BLOCK_SIZE:
+            buffer, pos = buffer[pos:], 0
+
+
+def iter_jsonl_records(f, start, end):
+    f.seek(start)
+    position = start
+    while position < end:
+        line = f.readline()
+        if not line:
+            break
+        position += len(line)
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def count_range(path, start, end, file_format):
+    """Counts of "N/A", null and empty values per field over the records in one byte range"""
+    total = 0
+    fields = {}  # insertion-ordered set of every field seen
+    na, null, empty = Counter(), Counter(), Counter()
+    iter_records = iter_array_records if file_format == 'array' else iter_jsonl_records
+    with open(path, 'rb') as f:
+        for profile in iter_records(f, start, end):
+            total += 1
+            for key, value in profile.items():
+                if key not in fields:
+                    fields[key] = None
+                if value == "N/A":
+                    na[key] += 1
+                elif value is None:
+                    null[key] += 1
+                elif value == "" or value == [] or value == {}:
+                    empty[key] += 1
+    return total, list(fields), {"na": na, "null": null, "empty": empty}
+
+
+def merge(results):
+    total = 0
+    fields = {}
+    counts = {kind: Counter() for kind in KINDS}
+    for range_total, range_fields, range_counts in results:
+        total += range_total
+        fields.update(dict.fromkeys(range_fields))
+        for kind in KINDS:
+            counts[kind].update(range_counts[kind])
+    return total, list(fields), counts
+
+
+def profile_file(path, workers=None):
+    """(total profiles, fields in first-seen order, {'na'|'null'|'empty': Counter})"""
+    file_format = detect_format(path)
+    workers = workers or os.cpu_count() or 1
+    separator = record_separator(path)
+    if workers == 1 or separator is None or os.path.getsize(path) < PARALLEL_MIN_BYTES:
+        return merge([count_range(path, 0, os.path.getsize(path), file_format)])
+
+    ranges = split_ranges(path, workers * RANGES_PER_WORKER, separator)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(count_range, *zip(*[(path, start, end, file_format) for start, end in ranges]))
+        return merge(list(results))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Count N/A values per field of a JSON array or JSONL export")
+    parser.add_argument('path', nargs='?', default='all_profiles.json', help="JSON array or JSONL file")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Processes for large files")
+    parser.add_argument('--detail', action='store_true', help="Also print null and empty counts per field")
+    args = parser.parse_args()
 
-# Read the JSON file
-with open('all_profiles.json', 'r') as f:
-    profiles = json.load(f)
+    total_profiles, fields, counts = profile_file(args.path, workers=args.workers)
+    na_counts = {key: counts["na"][key] for key in fields}
 
-# Dictionary to store N/A counts for each key
-na_counts = {}
+    # Print results
+    print("N/A Value Counts by Field:")
+    print("-" * 50)
+    print(f"Total Profiles: {total_profiles}\n")
 
-# Get all possible keys from the first profile
-if profiles:
-    for key in profiles[0].keys():
-        na_counts[key] = 0
+    # Sort by count (descending) for better readability
+    sorted_counts = sorted(na_counts.items(), key=lambda x: x[1], reverse=True)
 
-# Count N/A values for each key
-for profile in profiles:
-    for key, value in profile.items():
-        if value == "N/A":
-            na_counts[key] += 1
+    for key, count in sorted_counts:
+        percentage = (count / total_profiles) * 100
+        print(f"{key:40s}: {count:4d} ({percentage:5.2f}%)")
 
-# Print results
-print("N/A Value Counts by Field:")
-print("-" * 50)
-total_profiles = len(profiles)
-print(f"Total Profiles: {total_profiles}\n")
+    print("\n" + "-" * 50)
+    print(f"Total N/A values across all fields: {sum(na_counts.values())}")
 
-# Sort by count (descending) for better readability
-sorted_counts = sorted(na_counts.items(), key=lambda x: x[1], reverse=True)
+    if args.detail:
+        print("\nMissing Values by Field (N/A / null / empty):")
+        print("-" * 70)
+        for key, _ in sorted_counts:
+            print(f"{key:40s}: {counts['na'][key]:6d} {counts['null'][key]:6d} {counts['empty'][key]:6d}")
+        print("-" * 70)
+        print(f"Total null values: {sum(counts['null'].values())}, "
+              f"total empty values: {sum(counts['empty'].values())}")
 
-for key, count in sorted_counts:
-    percentage = (count / total_profiles) * 100
-    print(f"{key:40s}: {count:4d} ({percentage:5.2f}%)")
 
-print("\n" + "-" * 50)
-print(f"Total N/A values across all fields: {sum(na_counts.values())}")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,377 @@
+# /// script
+# dependencies = [
+#   "pandas>=2.2.0",
+#   "numpy>=1.26.0",
+#   "pyarrow>=15.0.0",
+# ]
+# ///
+"""
+Streaming ingestion of the admissions decisions JSONL into a typed columnar cache
+The JSONL (plain, .gz or .zst) is read once in fixed-size chunks, each chunk is
+coerced to the decision-record schema and appended to a Parquet file; later
+runs read only the columns they need from that cache. The cache is rebuilt
+whenever the source file (path, size, mtime) or the schema changes
+
+Usage:
+    uv run ingest.py usa_decisions_cleaned_with_uuid.jsonl           # build/refresh the cache
+    uv run ingest.py usa_decisions_cleaned_with_uuid.jsonl.zst --strict
+"""
+
+import argparse
+import gzip
+import hashlib
+import io
+import json
+import os
+import pickle
+import time
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Falls back to a pickled DataFrame cache
+    pa = None
+
+DATA_PATH = 'usa_decisions_cleaned_with_uuid.jsonl'
+CACHE_DIR = '.ingest_cache'
+
+# Column dtypes of a decision record. Integer columns are nullable in the
+# chunks; columns without missing values load back as plain numpy integers.
+SCHEMA = {
+    'id': 'string',
+    'student_id': 'Int64',
+    'student_name': 'string',
+    'student_type': 'category',
+    'university_name': 'category',
+    'university_name_stripped': 'category',
+    'course_name': 'category',
+    'credential': 'category',
+    'credential_standardized': 'category',
+    'categorical_course_name': 'category',
+    'target_degree': 'category',
+    'application_status': 'Int8',
+    'admission_result': 'Int8',
+    'application_term': 'category',
+    'application_year': 'Int16',
+    'gpa': 'string',
+    'gpa_scale': 'float64',
+    'gpa_normalized': 'float64',
+    'gpa_missing': 'Int8',
+    'undergrad_major': 'category',
+    'ug_major_bucket': 'category',
+    'undergrad_university': 'category',
+    'undergrad_canonical': 'category',
+    'undergrad_canonical_stripped': 'category',
+    'undergrad_missing': 'Int8',
+    'toefl': 'float64',
+    'ielts': 'float64',
+    'english_test_normalized': 'float64',
+    'english_missing': 'Int8',
+    'gre_total': 'float64',
+    'gre_verbal': 'float64',
+    'gre_quant': 'float64',
+    'gre_awa': 'float64',
+    'gre_missing': 'boolean',
+    'work_experience': 'float64',
+    'relevant_work_experience': 'float64',
+    'internship_experience': 'float64',
+    'publications': 'Int16',
+    'has_scholarship': 'boolean',
+    'scholarship_amount': 'float64',
+    'scholarship_currency': 'category',
+    'cs_rank': 'float64',
+    'cs_rank_missing': 'Int8',
+    'eng_rank': 'float64',
+    'eng_rank_missing': 'Int8',
+    'mba_rank': 'float64',
+    'mba_rank_missing': 'Int8',
+    'gen_rank': 'float64',
+    'gen_rank_missing': 'Int8',
+    'stripped_name': 'category',
+    'major_alignment': 'Int8',
+}
+
+ARROW_TYPES = {
+    'string': 'string', 'category': 'string', 'boolean': 'bool_',
+    'Int8': 'int8', 'Int16': 'int16', 'Int32': 'int32', 'Int64': 'int64',
+    'float32': 'float32', 'float64': 'float64',
+}
+
+
+def schema_version(schema=SCHEMA):
+    return hashlib.sha1(json.dumps(schema, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def open_text(path):
+    """Open a JSONL file for reading text, decompressing .gz (stdlib) or .zst (zstandard)"""
+    path = str(path)
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    if path.endswith(('.zst', '.zstd')):
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("Reading .zst input needs the zstandard package: pip install zstandard")
+        raw = open(path, 'rb')
+        return io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(raw, closefd=True), encoding='utf-8')
+    return open(path, 'r', encoding='utf-8')
+
+
+def iter_record_chunks(path, chunk_size=50000):
+    """Yield lists of decoded records, chunk_size lines at a time"""
+    chunk = []
+    with open_text(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            chunk.append(json.loads(line))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def infer_dtype(series):
+    """Dtype for a column that is not in SCHEMA, from its first chunk"""
+    values = series.dropna()
+    if values.empty:
+        return 'string'
+    if values.map(lambda v: isinstance(v, bool)).all():
+        return 'boolean'
+    if values.map(lambda v: isinstance(v, (int, float)) and not isinstance(v, bool)).all():
+        if values.map(lambda v: isinstance(v, int)).all():
+            return 'Int64'
+        return 'float64'
+    return 'category'
+
+
+def apply_schema(frame, dtypes, issues):
+    """Coerce one chunk to `dtypes` (column -> dtype); values that don't fit become missing.
+
+    Columns missing from the chunk are added as all-missing, columns not in
+    `dtypes` are dropped. Problems are tallied in `issues` as (column, kind).
+    """
+    typed = {}
+    for column, dtype in dtypes.items():
+        if column not in frame:
+            issues[(column, 'missing column')] += len(frame)
+            values = pd.Series([None] * len(frame), index=frame.index, dtype=object)
+        else:
+            values = frame[column]
+
+        if dtype in ('string', 'category'):
+            typed[column] = values.where(values.isna(), values.astype(str)).astype('string')
+        elif dtype == 'boolean':
+            valid = values.isna() | values.map(lambda v: isinstance(v, (bool, np.bool_)))
+            issues[(column, 'not a boolean')] += int((~valid).sum())
+            typed[column] = values.where(valid).astype('boolean')
+        else:
+            numeric = pd.to_numeric(values, errors='coerce')
+            issues[(column, 'not a number')] += int((numeric.isna() & values.notna()).sum())
+            if dtype.startswith('Int'):
+                fractional = numeric.notna() & (numeric != numeric.round())
+                issues[(column, 'not an integer')] += int(fractional.sum())
+                numeric = numeric.where(~fractional).round()
+            typed[column] = numeric.astype(dtype)
+
+    for column in frame.columns.difference(list(dtypes)):
+        issues[(column, 'unexpected column')] += int(frame[column].notna().sum())
+    return pd.DataFrame(typed, index=frame.index)
+
+
+def _column_dtypes(first_chunk, schema):
+    """Source column order of the first chunk, typed from the schema or inferred"""
+    dtypes = {column: schema.get(column) or infer_dtype(first_chunk[column]) for column in first_chunk.columns}
+    for column, dtype in schema.items():
+        dtypes.setdefault(column, dtype)
+    return dtypes
+
+
+def _whole_as_int(records, dtypes):
+    """Float columns whose whole-number values the source writes as JSON integers (108, not 108.0)"""
+    columns = []
+    for column, dtype in dtypes.items():
+        if not dtype.startswith('float'):
+            continue
+        whole = [value for value in (record.get(column) for record in records)
+                 if isinstance(value, (int, float)) and not isinstance(value, bool) and float(value).is_integer()]
+        if whole and all(isinstance(value, int) for value in whole):
+            columns.append(column)
+    return columns
+
+
+def _finalize(df, dtypes):
+    """Categorical columns as category; nullable integers without missing values as numpy ints"""
+    for column in df.columns:
+        dtype = dtypes.get(column)
+        if dtype == 'category' and df[column].dtype != 'category':
+            df[column] = df[column].astype('category')
+        elif dtype and dtype.startswith('Int') and str(df[column].dtype).startswith('Int'):
+            df[column] = df[column].astype(dtype.lower()) if not df[column].isna().any() else df[column].astype('float64')
+    return df
+
+
+def _report(issues, strict):
+    problems = {key: count for key, count in issues.items() if count}
+    if not problems:
+        return
+    lines = [f"  {column}: {count} rows {kind}" for (column, kind), count in sorted(problems.items())]
+    message = "Schema validation issues:\n" + "\n".join(lines)
+    if strict:
+        raise ValueError(message)
+    print(f"⚠ {message}")
+
+
+def cache_paths(path, cache_dir=None):
+    source = Path(path).resolve()
+    cache_dir = Path(cache_dir) if cache_dir else source.parent / CACHE_DIR
+    suffix = '.parquet' if pa is not None else '.pkl'
+    return cache_dir / (source.name + suffix), cache_dir / (source.name + '.meta.json')
+
+
+def source_fingerprint(path, schema=SCHEMA):
+    stat = os.stat(path)
+    return {'source': str(Path(path).resolve()), 'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns, 'schema': schema_version(schema)}
+
+
+def build_cache(path, cache_dir=None, chunk_size=50000, schema=SCHEMA, strict=False):
+    """Stream the JSONL into the typed columnar cache; returns (cache path, rows)"""
+    data_path, meta_path = cache_paths(path, cache_dir)
+    data_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = data_path.with_name(data_path.name + '.tmp')
+
+    issues = Counter()
+    dtypes, arrow_schema, writer = None, None, None
+    whole_as_int = []
+    frames = []
+    rows = 0
+    try:
+        for records in iter_record_chunks(path, chunk_size):
+            frame = pd.DataFrame.from_records(records)
+            if dtypes is None:
+                dtypes = _column_dtypes(frame, schema)
+                whole_as_int = _whole_as_int(records, dtypes)
+            chunk = apply_schema(frame, dtypes, issues)
+            rows += len(chunk)
+            if pa is None:
+                frames.append(chunk)
+                continue
+            if writer is None:
+                arrow_schema = pa.schema([(column, getattr(pa, ARROW_TYPES[dtype])())
+                                          for column, dtype in dtypes.items()])
+                writer = pq.ParquetWriter(tmp_path, arrow_schema, compression='zstd')
+            writer.write_table(pa.Table.from_pandas(chunk, schema=arrow_schema, preserve_index=False))
+    finally:
+        if writer is not None:
+            writer.close()
+
+    _report(issues, strict)
+    if dtypes is None:
+        raise ValueError(f"No records in {path}")
+
+    if pa is None:
+        df = _finalize(pd.concat(frames, ignore_index=True), dtypes)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, data_path)
+
+    meta = {**source_fingerprint(path, schema), 'rows': rows, 'dtypes': dtypes, 'whole_as_int': whole_as_int,
+            'built_at': time.strftime("%Y-%m-%d %H:%M:%S")}
+    with open(meta_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2)
+    return data_path, rows
+
+
+def cache_is_fresh(path, cache_dir=None, schema=SCHEMA):
+    data_path, meta_path = cache_paths(path, cache_dir)
+    if not data_path.exists() or not meta_path.exists():
+        return False
+    with open(meta_path, 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    fingerprint = source_fingerprint(path, schema)
+    return all(meta.get(key) == value for key, value in fingerprint.items())
+
+
+def load_decisions(path=DATA_PATH, columns=None, exclude=None, cache_dir=None, refresh=False, strict=False):
+    """Decisions as a typed DataFrame, (re)building the columnar cache if needed.
+
+    `columns` projects the read to just those columns (missing ones are ignored);
+    `exclude` drops columns from the read instead.
+    """
+    if refresh or not cache_is_fresh(path, cache_dir):
+        print(f"Building columnar cache for {path}...")
+        build_cache(path, cache_dir, strict=strict)
+
+    data_path, meta_path = cache_paths(path, cache_dir)
+    with open(meta_path, 'r', encoding='utf-8') as f:
+        dtypes = json.load(f)['dtypes']
+    if columns is not None or exclude:
+        wanted = set(dtypes if columns is None else columns) - set(exclude or ())
+        columns = [column for column in dtypes if column in wanted]
+
+    if pa is None:
+        with open(data_path, 'rb') as f:
+            df = pickle.load(f)
+        return df[columns] if columns is not None else df
+
+    categorical = [column for column, dtype in dtypes.items()
+                   if dtype == 'category' and (columns is None or column in columns)]
+    table = pq.read_table(data_path, columns=columns, read_dictionary=categorical)
+    return _finalize(table.to_pandas(), dtypes)
+
+
+def integer_display_columns(path=DATA_PATH, cache_dir=None):
+    """Columns whose whole numbers read as integers in the source: integer columns, plus float
+    columns whose source writes whole values as JSON integers (from the cache metadata)"""
+    _, meta_path = cache_paths(path, cache_dir)
+    with open(meta_path, 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    integers = [column for column, dtype in meta['dtypes'].items() if dtype.startswith('Int')]
+    return integers + meta.get('whole_as_int', [])
+
+
+def display_value(value, integer=False):
+    """Label for a cell as it reads in the source JSON: 'N/A' when missing.
+
+    With integer=True (integer columns, which load as float64 when they have
+    missing values, or float columns the source writes whole numbers of as
+    integers) whole numbers print without '.0'; otherwise floats print like Python floats.
+    """
+    if pd.isna(value):
+        return 'N/A'
+    if integer and isinstance(value, (float, np.floating)) and float(value).is_integer():
+        return str(int(value))
+    if isinstance(value, np.floating):
+        return str(float(value))
+    return str(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the typed columnar cache of a decisions JSONL")
+    parser.add_argument('path', nargs='?', default=DATA_PATH, help="Decisions JSONL (.jsonl, .jsonl.gz, .jsonl.zst)")
+    parser.add_argument('--cache-dir', default=None, help=f"Cache folder (default: {CACHE_DIR}/ next to the data)")
+    parser.add_argument('--chunk-size', type=int, default=50000, help="Records per chunk")
+    parser.add_argument('--strict', action='store_true', help="Fail on schema validation issues")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    data_path, rows = build_cache(args.path, args.cache_dir, chunk_size=args.chunk_size, strict=args.strict)
+    print(f"✓ Cached {rows} records to {data_path} in {time.perf_counter() - started:.1f}s "
+          f"({data_path.stat().st_size / 1e6:.1f} MB)")
+
+    started = time.perf_counter()
+    df = load_decisions(args.path, cache_dir=args.cache_dir)
+    print(f"✓ Cache loads in {time.perf_counter() - started:.2f}s "
+          f"({df.memory_usage(deep=True).sum() / 1e6:.1f} MB in memory, {len(df.columns)} columns)")
+
+
+if __name__ == "__main__":
+    main()
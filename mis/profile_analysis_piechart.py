@@ -1,174 +1,229 @@
 # /// script
 # dependencies = [
 #   "matplotlib>=3.10.0",
+#   "pandas>=2.2.0",
+#   "numpy>=1.26.0",
+#   "pyarrow>=15.0.0",
 # ]
 # ///
+"""
+Distribution of every profile attribute: majority value, full value counts and pie charts
+Value counts are computed column-wise with pandas (in a thread pool across columns)
+on the typed columnar cache; the individual pie charts render in a process pool
 
-import json
-import matplotlib.pyplot as plt
-from collections import Counter
+Usage:
+    uv run profile_analysis_piechart.py
+    uv run profile_analysis_piechart.py --top-k 20 --workers 4 --dpi 150
+"""
+
+import argparse
 import math
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import pandas as pd
+
+from ingest import load_decisions, integer_display_columns, display_value, DATA_PATH
+
+# Exclude these keys from analysis as they are unique identifiers or not useful for distribution
+exclude_keys = ['id', 'student_id', 'student_name', 'university_name_stripped', 'undergrad_canonical_stripped',
+                'stripped_name', 'undergrad_university', 'undergrad_canonical', 'scholarship_amount',
+                'scholarship_currency', 'gpa_scale']
+
+OTHER_LABEL = 'Other'
 
-# Load the JSONL data
-profiles = []
-with open('usa_decisions_cleaned_with_uuid.jsonl', 'r') as f:
-    for line in f:
-        profiles.append(json.loads(line.strip()))
-
-print(f"Total profiles loaded: {len(profiles)}")
-print("=" * 80)
-
-# Get all keys from the first profile (excluding some that might not be useful)
-if profiles:
-    all_keys = list(profiles[0].keys())
-    # Exclude these keys from analysis as they are unique identifiers or not useful for distribution
-    exclude_keys = ['id', 'student_id', 'student_name', 'university_name_stripped', 'undergrad_canonical_stripped',
-                    'stripped_name', 'undergrad_university', 'undergrad_canonical', 'scholarship_amount',
-                    'scholarship_currency', 'gpa_scale']
-    keys_to_analyze = [key for key in all_keys if key not in exclude_keys]
-else:
-    print("No profiles found!")
-    exit()
-
-# Analyze each key
-results = {}
-for key in keys_to_analyze:
-    values = []
-    for profile in profiles:
-        value = profile.get(key, 'N/A')
-        if value is not None:
-            values.append(str(value))
-        else:
-            values.append('N/A')
-
-    # Count occurrences
-    value_counts = Counter(values)
-
-    # Find majority (most common value)
-    if value_counts:
-        majority_value, majority_count = value_counts.most_common(1)[0]
-        majority_percentage = (majority_count / len(values)) * 100
 
+def distribution(series, integer=False):
+    """Counts per display value (missing values count as 'N/A'), most common first"""
+    counts = series.value_counts(dropna=False, sort=False)
+    counts = counts[counts > 0]  # unobserved categories of categorical columns
+    # Only the distinct values go through display_value; values that display the same are merged
+    labels = [display_value(value, integer) for value in counts.index.to_numpy()]
+    counts = pd.Series(counts.to_numpy(), index=labels).groupby(level=0, sort=False).sum()
+    return counts.sort_values(ascending=False, kind='stable')
+
+
+def analyze(profiles, workers=None, integer_columns=()):
+    """Distribution and majority of every column, columns counted in parallel"""
+    total = len(profiles)
+    integer_columns = set(integer_columns)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        counts = dict(zip(profiles.columns, pool.map(
+            lambda key: distribution(profiles[key], key in integer_columns), profiles.columns)))
+
+    results = {}
+    for key, value_counts in counts.items():
+        if value_counts.empty:
+            continue
         results[key] = {
-            'majority_value': majority_value,
-            'majority_count': majority_count,
-            'majority_percentage': majority_percentage,
+            'majority_value': value_counts.index[0],
+            'majority_count': int(value_counts.iloc[0]),
+            'majority_percentage': value_counts.iloc[0] / total * 100,
             'value_counts': value_counts,
-            'total_values': len(values)
+            'total_values': total
         }
+    return results
 
-        print(f"\nKey: {key}")
-        print(f"  Majority Value: {majority_value}")
-        print(f"  Count: {majority_count} / {len(values)} ({majority_percentage:.2f}%)")
-        print(f"  All values distribution:")
-        for value, count in value_counts.most_common():
-            percentage = (count / len(values)) * 100
-            print(f"    {value}: {count} ({percentage:.2f}%)")
-
-print("\n" + "=" * 80)
-print("Creating pie charts for each key...")
 
-# Create pie charts
-num_keys = len(keys_to_analyze)
-cols = 3  # 3 columns
-rows = math.ceil(num_keys / cols)
+def top_k(value_counts, k, width=None):
+    """Labels and sizes of the k most common values, the rest collapsed into 'Other'"""
+    top = value_counts.iloc[:k]
+    labels = [str(value)[:width] if width else str(value) for value in top.index]
+    sizes = top.tolist()
+    if len(value_counts) > k:
+        labels.append(OTHER_LABEL)
+        sizes.append(int(value_counts.iloc[k:].sum()))
+    return labels, sizes
 
-fig, axes = plt.subplots(rows, cols, figsize=(18, 5 * rows))
-fig.suptitle('Distribution of Profile Attributes', fontsize=16, fontweight='bold')
 
-# Flatten axes array for easier indexing
-if num_keys > 1:
-    axes_flat = axes.flatten() if rows > 1 else [axes] if cols == 1 else axes
-else:
-    axes_flat = [axes]
+def print_results(results, top=None):
+    for key, result in results.items():
+        total = result['total_values']
+        print(f"\nKey: {key}")
+        print(f"  Majority Value: {result['majority_value']}")
+        print(f"  Count: {result['majority_count']} / {total} ({result['majority_percentage']:.2f}%)")
+        print(f"  All values distribution:")
+        value_counts = result['value_counts']
+        shown = value_counts.iloc[:top] if top else value_counts
+        for value, count in shown.items():
+            percentage = (count / total) * 100
+            print(f"    {value}: {count} ({percentage:.2f}%)")
+        if len(shown) < len(value_counts):
+            count = int(value_counts.iloc[len(shown):].sum())
+            print(f"    {OTHER_LABEL} ({len(value_counts) - len(shown)} more values): {count} "
+                  f"({count / total * 100:.2f}%)")
 
-for idx, key in enumerate(keys_to_analyze):
-    ax = axes_flat[idx]
 
-    value_counts = results[key]['value_counts']
+def plot_overview(results, path='profile_analysis_piecharts.png', dpi=300):
+    keys_to_analyze = list(results)
+    num_keys = len(keys_to_analyze)
+    cols = 3  # 3 columns
+    rows = math.ceil(num_keys / cols)
 
-    # Prepare data for pie chart
-    # Show top 10 values, group others as "Other"
-    top_items = value_counts.most_common(10)
+    fig, axes = plt.subplots(rows, cols, figsize=(18, 5 * rows))
+    fig.suptitle('Distribution of Profile Attributes', fontsize=16, fontweight='bold')
 
-    if len(value_counts) > 10:
-        other_count = sum(count for value, count in value_counts.most_common()[10:])
-        labels = [str(val)[:30] for val, _ in top_items] + ['Other']
-        sizes = [count for _, count in top_items] + [other_count]
+    # Flatten axes array for easier indexing
+    if num_keys > 1:
+        axes_flat = axes.flatten() if rows > 1 else [axes] if cols == 1 else axes
     else:
-        labels = [str(val)[:30] for val, _ in top_items]
-        sizes = [count for _, count in top_items]
-
-    # Create pie chart
-    colors = plt.cm.Set3(range(len(labels)))
-    wedges, texts, autotexts = ax.pie(sizes, labels=labels, autopct='%1.1f%%',
-                                        startangle=90, colors=colors,
-                                        textprops={'fontsize': 8})
+        axes_flat = [axes]
 
-    # Make percentage text bold
-    for autotext in autotexts:
-        autotext.set_color('black')
-        autotext.set_fontweight('bold')
-        autotext.set_fontsize(7)
+    for idx, key in enumerate(keys_to_analyze):
+        ax = axes_flat[idx]
 
-    # Make labels smaller if there are many
-    for text in texts:
-        text.set_fontsize(7)
+        # Show top 10 values, group others as "Other"
+        labels, sizes = top_k(results[key]['value_counts'], 10, width=30)
 
-    ax.set_title(f'{key}\n(Majority: {results[key]["majority_value"][:30]})',
-                 fontsize=10, fontweight='bold', pad=10)
+        # Create pie chart
+        colors = plt.cm.Set3(range(len(labels)))
+        wedges, texts, autotexts = ax.pie(sizes, labels=labels, autopct='%1.1f%%',
+                                          startangle=90, colors=colors,
+                                          textprops={'fontsize': 8})
 
-# Hide any unused subplots
-for idx in range(num_keys, len(axes_flat)):
-    axes_flat[idx].axis('off')
+        # Make percentage text bold
+        for autotext in autotexts:
+            autotext.set_color('black')
+            autotext.set_fontweight('bold')
+            autotext.set_fontsize(7)
 
-plt.tight_layout()
-plt.savefig('profile_analysis_piecharts.png', dpi=300, bbox_inches='tight')
-print(f"\nPie charts saved as 'profile_analysis_piecharts.png'")
+        # Make labels smaller if there are many
+        for text in texts:
+            text.set_fontsize(7)
 
-# Create individual pie charts for each key (optional - more detailed view)
-print("\nCreating individual pie charts for each key...")
-import os
-os.makedirs('individual_piecharts', exist_ok=True)
+        ax.set_title(f'{key}\n(Majority: {results[key]["majority_value"][:30]})',
+                     fontsize=10, fontweight='bold', pad=10)
 
-for key in keys_to_analyze:
-    fig, ax = plt.subplots(figsize=(10, 8))
+    # Hide any unused subplots
+    for idx in range(num_keys, len(axes_flat)):
+        axes_flat[idx].axis('off')
 
-    value_counts = results[key]['value_counts']
+    plt.tight_layout()
+    plt.savefig(path, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
 
-    # Prepare data for pie chart
-    # Show top 15 values, group others as "Other"
-    top_items = value_counts.most_common(15)
 
-    if len(value_counts) > 15:
-        other_count = sum(count for value, count in value_counts.most_common()[15:])
-        labels = [str(val) for val, _ in top_items] + ['Other']
-        sizes = [count for _, count in top_items] + [other_count]
-    else:
-        labels = [str(val) for val, _ in top_items]
-        sizes = [count for _, count in top_items]
+def plot_individual(key, labels, sizes, majority_value, majority_percentage, output_dir='individual_piecharts',
+                    dpi=300):
+    """One detailed pie chart; runs in a worker process, returns the saved path"""
+    fig, ax = plt.subplots(figsize=(10, 8))
 
     # Create pie chart
     colors = plt.cm.Set3(range(len(labels)))
     wedges, texts, autotexts = ax.pie(sizes, labels=labels, autopct='%1.1f%%',
-                                        startangle=90, colors=colors,
-                                        textprops={'fontsize': 9})
+                                      startangle=90, colors=colors,
+                                      textprops={'fontsize': 9})
 
     # Make percentage text bold
     for autotext in autotexts:
         autotext.set_color('black')
         autotext.set_fontweight('bold')
 
-    ax.set_title(f'{key}\nMajority: {results[key]["majority_value"]} '
-                 f'({results[key]["majority_percentage"]:.1f}%)',
+    ax.set_title(f'{key}\nMajority: {majority_value} '
+                 f'({majority_percentage:.1f}%)',
                  fontsize=14, fontweight='bold', pad=20)
 
     plt.tight_layout()
 
     # Save with sanitized filename
     filename = key.replace('/', '_').replace(' ', '_').lower()
-    plt.savefig(f'individual_piecharts/{filename}_piechart.png', dpi=300, bbox_inches='tight')
-    plt.close()
-
-print(f"Individual pie charts saved in 'individual_piecharts/' folder")
-print("\nAnalysis complete!")
+    path = f'{output_dir}/{filename}_piechart.png'
+    plt.savefig(path, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+    return path
+
+
+def plot_individuals(results, output_dir='individual_piecharts', dpi=300, workers=None):
+    os.makedirs(output_dir, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = []
+        for key, result in results.items():
+            # Show top 15 values, group others as "Other"
+            labels, sizes = top_k(result['value_counts'], 15)
+            futures.append(pool.submit(plot_individual, key, labels, sizes, result['majority_value'],
+                                       result['majority_percentage'], output_dir, dpi))
+        for future in as_completed(futures):
+            future.result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Value distribution and pie chart of every profile attribute")
+    parser.add_argument('--data', default=DATA_PATH, help="Decisions JSONL file")
+    parser.add_argument('--top-k', type=int, default=50,
+                        help="Values listed per key in the printed distribution, the rest summed as 'Other'")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Threads/processes to use")
+    parser.add_argument('--dpi', type=int, default=300, help="Output resolution")
+    args = parser.parse_args()
+
+    # Load the decisions from the typed columnar cache, without the excluded columns
+    profiles = load_decisions(args.data, exclude=exclude_keys)
+
+    print(f"Total profiles loaded: {len(profiles)}")
+    print("=" * 80)
+
+    if len(profiles) == 0:
+        print("No profiles found!")
+        return
+
+    # Analyze each key
+    results = analyze(profiles, workers=args.workers, integer_columns=integer_display_columns(args.data))
+    print_results(results, top=args.top_k)
+
+    print("\n" + "=" * 80)
+    print("Creating pie charts for each key...")
+    plot_overview(results, dpi=args.dpi)
+    print(f"\nPie charts saved as 'profile_analysis_piecharts.png'")
+
+    # Create individual pie charts for each key (optional - more detailed view)
+    print("\nCreating individual pie charts for each key...")
+    plot_individuals(results, dpi=args.dpi, workers=args.workers)
+
+    print(f"Individual pie charts saved in 'individual_piecharts/' folder")
+    print("\nAnalysis complete!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# /// script
+# dependencies = [
+#   "pandas>=2.2.0",
+#   "numpy>=1.26.0",
+# ]
+# ///
+"""
+Grouped admission-rate tables ("rate cube") for the cross-analysis charts
+Every dimension (a categorical column, a binned numeric column or a small
+integer column) is reduced to integer codes; rows, decided rows and admits
+per code are counted with np.bincount. All requested dimensions share the
+outcome arrays and are computed in one pass over the loaded frame. The cube
+is plain JSON so it can be cached next to the chart aggregates
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+OUTCOME = 'admission_result'
+
+# bins are right-closed edges as in pd.cut; max_value makes a non-negative integer column its own codes (0..max_value)
+Dimension = namedtuple('Dimension', 'name column bins labels max_value', defaults=(None, None, None, None))
+
+
+def dimension_codes(series, dimension):
+    """(codes, labels) for one dimension; code -1 marks rows outside every cell"""
+    if dimension.bins is not None:
+        edges = np.asarray(dimension.bins, dtype=float)
+        values = series.to_numpy(dtype=float, na_value=np.nan)
+        # (edges[i], edges[i+1]] -> i, like pd.cut(right=True)
+        codes = np.searchsorted(edges, values, side='left') - 1
+        codes[(codes < 0) | (codes >= len(edges) - 1) | np.isnan(values)] = -1
+        labels = dimension.labels or [f"({low:g}, {high:g}]" for low, high in zip(edges, edges[1:])]
+        return codes, list(labels)
+    if dimension.max_value is not None:
+        values = series.to_numpy(dtype=float, na_value=np.nan)
+        valid = (values >= 0) & (values <= dimension.max_value) & (values == np.floor(values))
+        codes = np.where(valid, np.nan_to_num(values), -1).astype(np.int64)
+        return codes, list(range(dimension.max_value + 1))
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(dtype=np.int64), series.cat.categories.tolist()
+    codes, uniques = pd.factorize(series, sort=False)
+    return codes.astype(np.int64), list(uniques)
+
+
+class RateCube:
+    """Rows, decided rows and admits per cell of every dimension"""
+
+    def __init__(self, tables):
+        # name -> {'index': [...], 'rows': [...], 'decided': [...], 'admitted': [...]}
+        self.tables = tables
+
+    @classmethod
+    def build(cls, df, dimensions, outcome=OUTCOME):
+        result = df[outcome].to_numpy(dtype=float, na_value=np.nan)
+        decided = ~np.isnan(result)
+        admitted = np.where(decided, result, 0.0)
+
+        tables = {}
+        for dimension in dimensions:
+            codes, labels = dimension_codes(df[dimension.column], dimension)
+            valid = codes >= 0
+            codes = codes[valid]
+            size = len(labels)
+            rows = np.bincount(codes, minlength=size)
+            decided_counts = np.bincount(codes, weights=decided[valid], minlength=size)
+            admitted_counts = np.bincount(codes, weights=admitted[valid], minlength=size)
+            observed = rows > 0
+            tables[dimension.name] = {
+                'index': [label for label, keep in zip(labels, observed) if keep],
+                'rows': rows[observed].tolist(),
+                'decided': decided_counts[observed].astype(np.int64).tolist(),
+                'admitted': admitted_counts[observed].astype(np.int64).tolist(),
+            }
+        return cls(tables)
+
+    def to_dict(self):
+        return self.tables
+
+    @classmethod
+    def from_dict(cls, tables):
+        return cls(tables)
+
+    def frame(self, name):
+        table = self.tables[name]
+        return pd.DataFrame({key: table[key] for key in ('rows', 'decided', 'admitted')}, index=table['index'])
+
+    def totals(self, name, top=None):
+        """(label, rows) pairs, most frequent first - what value_counts() gives for the column"""
+        rows = self.frame(name)['rows'].sort_values(ascending=False, kind='stable')
+        if top:
+            rows = rows.head(top)
+        return list(rows.items())
+
+    def rates(self, name, min_count=100, sort=False, top=None):
+        """Admission rate and decided count per cell, as groupby(...)['admission_result'].agg(['mean', 'count'])
+
+        top keeps the `top` most frequent cells first; cells with fewer than min_count decided rows are dropped.
+        """
+        table = self.frame(name)
+        if top:
+            table = table.loc[[label for label, _ in self.totals(name, top)]]
+        table = table[(table['decided'] >= min_count) & (table['decided'] > 0)]
+        mean = table['admitted'] / table['decided']
+        if sort:
+            mean = mean.sort_values(ascending=False, kind='stable')
+            table = table.loc[mean.index]
+        return {'index': table.index.tolist(), 'mean': mean.tolist(), 'count': table['decided'].tolist()}
@@ -0,0 +1,518 @@
+# /// script
+# dependencies = [
+#   "pandas>=2.2.0",
+#   "numpy>=1.26.0",
+#   "pyarrow>=15.0.0",
+# ]
+# ///
+"""
+Mergeable summary statistics of the admissions decisions
+The summary is a set of running aggregates that can be merged and extended:
+count/sum/sum of squares/min/max per numeric column, HyperLogLog distinct
+counts (exact below 2^14 values) and SpaceSaving heavy hitters for the top
+universities and programs. The state is saved as JSON next to the text
+report together with the byte offset of the JSONL it covers, so appended
+records are folded in without rescanning, and queries read only the state
+
+Usage:
+    uv run summary_stats.py update                                  # build or extend the state and report
+    uv run summary_stats.py update decisions.jsonl --rebuild
+    uv run summary_stats.py query                                   # the report statistics
+    uv run summary_stats.py query gre_total university_name --top 5
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import time
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ingest import DATA_PATH, SCHEMA, apply_schema, iter_record_chunks
+
+OUTPUT_DIR = 'analysis_graphs'
+STATE_FILE = 'summary_statistics.json'
+STATE_PATH = f"{OUTPUT_DIR}/{STATE_FILE}"
+REPORT_PATH = f"{OUTPUT_DIR}/summary_statistics.txt"
+STATE_VERSION = 1
+
+MOMENT_COLUMNS = ['admission_result', 'gpa_normalized', 'gre_total', 'toefl', 'ielts', 'work_experience',
+                  'publications', 'has_scholarship']
+DISTINCT_COLUMNS = ['student_id', 'university_name', 'course_name']
+HEAVY_COLUMNS = ['university_name', 'course_name']
+CATEGORY_COLUMNS = ['student_type']
+SUMMARY_COLUMNS = list(dict.fromkeys(MOMENT_COLUMNS + DISTINCT_COLUMNS + HEAVY_COLUMNS + CATEGORY_COLUMNS))
+
+HLL_PRECISION = 14
+HEAVY_CAPACITY = 4096
+# Bytes hashed at the head of the source to tell an append from a rewrite
+PREFIX_BYTES = 1 << 16
+
+
+# ============================================================================
+# MERGEABLE AGGREGATES
+# ============================================================================
+
+class Moments:
+    """Count, sum, sum of squares, min and max of the non-missing values"""
+
+    def __init__(self, count=0, total=0.0, sumsq=0.0, low=None, high=None):
+        self.count, self.total, self.sumsq, self.low, self.high = count, total, sumsq, low, high
+
+    def update(self, values):
+        values = pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+        self.merge(Moments(len(values), float(values.sum()), float(np.square(values).sum()),
+                           float(values.min()), float(values.max())))
+
+    def merge(self, other):
+        self.count += other.count
+        self.total += other.total
+        self.sumsq += other.sumsq
+        lows = [v for v in (self.low, other.low) if v is not None]
+        highs = [v for v in (self.high, other.high) if v is not None]
+        self.low = min(lows) if lows else None
+        self.high = max(highs) if highs else None
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else float('nan')
+
+    @property
+    def std(self):
+        if self.count < 2:
+            return float('nan')
+        variance = (self.sumsq - self.total * self.total / self.count) / (self.count - 1)
+        return float(np.sqrt(max(variance, 0.0)))
+
+    def to_dict(self):
+        return {'count': self.count, 'sum': self.total, 'sumsq': self.sumsq, 'min': self.low, 'max': self.high}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['count'], data['sum'], data['sumsq'], data['min'], data['max'])
+
+
+def hash_values(values):
+    """64-bit hashes of the non-missing values, by their text form (so 7 and '7' count as one)"""
+    series = pd.Series(values)
+    series = series[series.notna()]
+    if pd.api.types.is_float_dtype(series) and (series % 1 == 0).all():
+        series = series.astype('Int64')  # ids that loaded as float because of missing values
+    series = series.astype(str)
+    return pd.util.hash_array(series.to_numpy(dtype=object), categorize=True)
+
+
+def _bit_length(values):
+    """Bit length of each uint64"""
+    values = values.copy()
+    length = np.zeros(len(values), dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        high = values >= (np.uint64(1) << np.uint64(shift))
+        length[high] += shift
+        values[high] >>= np.uint64(shift)
+    return length + (values > 0)
+
+
+class DistinctSketch:
+    """Distinct count: an exact set of hashes while small, then HyperLogLog registers (~0.8% error at p=14)"""
+
+    def __init__(self, precision=HLL_PRECISION, hashes=None, registers=None):
+        self.precision = precision
+        self.hashes = set() if hashes is None and registers is None else hashes
+        self.registers = registers
+
+    def update(self, values):
+        self._add_hashes(hash_values(values))
+
+    def _add_hashes(self, hashes):
+        if self.registers is None:
+            self.hashes.update(hashes.tolist())
+            if len(self.hashes) > (1 << self.precision):
+                self._to_registers()
+            return
+        p = np.uint64(self.precision)
+        index = (hashes >> (np.uint64(64) - p)).astype(np.int64)
+        rest = hashes & ((np.uint64(1) << (np.uint64(64) - p)) - np.uint64(1))
+        # Position of the leftmost 1-bit in the remaining 64-p bits
+        rank = (64 - self.precision) - _bit_length(rest) + 1
+        np.maximum.at(self.registers, index, rank.astype(np.uint8))
+
+    def _to_registers(self):
+        hashes = np.fromiter(self.hashes, dtype=np.uint64, count=len(self.hashes))
+        self.hashes, self.registers = None, np.zeros(1 << self.precision, dtype=np.uint8)
+        self._add_hashes(hashes)
+
+    def merge(self, other):
+        if other.registers is None:
+            self._add_hashes(np.fromiter(other.hashes, dtype=np.uint64, count=len(other.hashes)))
+            return
+        if self.registers is None:
+            self._to_registers()
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self):
+        if self.registers is None:
+            return len(self.hashes)
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.power(2.0, -self.registers.astype(float)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            return int(round(m * np.log(m / zeros)))  # linear counting for small cardinalities
+        return int(round(raw))
+
+    @property
+    def exact(self):
+        return self.registers is None
+
+    def to_dict(self):
+        if self.registers is None:
+            return {'precision': self.precision, 'hashes': sorted(self.hashes)}
+        return {'precision': self.precision, 'registers': base64.b64encode(self.registers.tobytes()).decode()}
+
+    @classmethod
+    def from_dict(cls, data):
+        if 'registers' in data:
+            registers = np.frombuffer(base64.b64decode(data['registers']), dtype=np.uint8).copy()
+            return cls(data['precision'], registers=registers)
+        return cls(data['precision'], hashes=set(data['hashes']))
+
+
+class HeavyHitters:
+    """Mergeable SpaceSaving-style counters: the `capacity` most frequent values.
+
+    Counts are exact while there are no more than `capacity` distinct values; after that each
+    kept count may be low by at most `error`, and any value more frequent than `error` is kept.
+    """
+
+    def __init__(self, capacity=HEAVY_CAPACITY, counts=None, error=0):
+        self.capacity = capacity
+        self.counts = Counter(counts or {})
+        self.error = error
+
+    def update(self, values):
+        series = pd.Series(values)
+        counts = series[series.notna()].astype(str).value_counts()
+        self.merge(HeavyHitters(self.capacity, dict(zip(counts.index, counts.tolist()))))
+
+    def merge(self, other):
+        self.counts.update(other.counts)
+        self.error += other.error
+        if len(self.counts) > self.capacity:
+            kept = self.counts.most_common(self.capacity + 1)
+            self.error += kept[-1][1]
+            self.counts = Counter(dict(kept[:-1]))
+
+    def top(self, n=10):
+        """Most frequent values; ties ordered by value so merged and rebuilt states agree"""
+        return sorted(self.counts.items(), key=lambda item: (-item[1], item[0]))[:n]
+
+    def to_dict(self):
+        return {'capacity': self.capacity, 'error': self.error, 'counts': dict(self.counts)}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['capacity'], data['counts'], data['error'])
+
+
+# ============================================================================
+# SUMMARY STATE
+# ============================================================================
+
+class SummaryState:
+    """All running aggregates behind summary_statistics.txt, plus the part of the source they cover"""
+
+    def __init__(self):
+        self.records = 0
+        self.moments = {column: Moments() for column in MOMENT_COLUMNS}
+        self.distinct = {column: DistinctSketch() for column in DISTINCT_COLUMNS}
+        self.heavy = {column: HeavyHitters() for column in HEAVY_COLUMNS}
+        self.categories = {column: Counter() for column in CATEGORY_COLUMNS}
+        self.source = None
+
+    def update_frame(self, df):
+        """Fold a frame of decision records (typed or raw JSON values) into the aggregates"""
+        self.records += len(df)
+        for column, moments in self.moments.items():
+            if column in df:
+                values = df[column]
+                if column == 'has_scholarship':
+                    values = values.eq(True).fillna(False).astype(bool)  # booleans count as 0/1
+                moments.update(values)
+        for column, sketch in self.distinct.items():
+            if column in df:
+                sketch.update(df[column])
+        for column, heavy in self.heavy.items():
+            if column in df:
+                heavy.update(df[column])
+        for column, counts in self.categories.items():
+            if column in df:
+                values = df[column]
+                counts.update(values[values.notna()].astype(str).value_counts().to_dict())
+        return self
+
+    def merge(self, other):
+        self.records += other.records
+        for group in ('moments', 'distinct', 'heavy'):
+            for column, aggregate in getattr(self, group).items():
+                aggregate.merge(getattr(other, group)[column])
+        for column, counts in self.categories.items():
+            counts.update(other.categories[column])
+        return self
+
+    def stats(self):
+        """(name, value) pairs of the text report, in report order"""
+        moments = self.moments
+        student_types = self.categories['student_type']
+        return [
+            ("Total Records", self.records),
+            ("Total Students", self.distinct['student_id'].estimate()),
+            ("International Students", student_types['International']),
+            ("Domestic Students", student_types['Domestic']),
+            ("Total Admitted", int(moments['admission_result'].total)),
+            ("Total Rejected", moments['admission_result'].count - int(moments['admission_result'].total)),
+            ("Overall Admission Rate (%)", moments['admission_result'].mean * 100),
+            ("Avg GPA (Normalized)", moments['gpa_normalized'].mean),
+            ("Avg GRE Total", moments['gre_total'].mean),
+            ("Avg TOEFL", moments['toefl'].mean),
+            ("Avg IELTS", moments['ielts'].mean),
+            ("Avg Work Experience (months)", moments['work_experience'].mean),
+            ("Avg Publications", moments['publications'].mean),
+            ("Students with Scholarships", int(moments['has_scholarship'].total)),
+            ("Unique Universities", self.distinct['university_name'].estimate()),
+            ("Unique Programs", self.distinct['course_name'].estimate()),
+        ]
+
+    def report(self):
+        """The summary as write_report() takes it"""
+        return {
+            'stats': self.stats(),
+            'top_universities': self.heavy['university_name'].top(10),
+            'top_programs': self.heavy['course_name'].top(10),
+        }
+
+    def query(self, column, top=10):
+        """Everything the state knows about one column"""
+        result = {}
+        if column in self.moments:
+            moments = self.moments[column]
+            result.update({'count': moments.count, 'mean': moments.mean, 'std': moments.std,
+                           'min': moments.low, 'max': moments.high, 'sum': moments.total})
+        if column in self.distinct:
+            result['distinct'] = self.distinct[column].estimate()
+            result['distinct_exact'] = self.distinct[column].exact
+        if column in self.heavy:
+            result['top'] = self.heavy[column].top(top)
+            result['top_max_error'] = self.heavy[column].error
+        if column in self.categories:
+            result['counts'] = dict(self.categories[column].most_common())
+        if not result:
+            raise KeyError(f"No aggregates for {column!r}; known columns: {', '.join(SUMMARY_COLUMNS)}")
+        return result
+
+    def to_dict(self):
+        return {
+            'version': STATE_VERSION,
+            'records': self.records,
+            'source': self.source,
+            'moments': {column: value.to_dict() for column, value in self.moments.items()},
+            'distinct': {column: value.to_dict() for column, value in self.distinct.items()},
+            'heavy': {column: value.to_dict() for column, value in self.heavy.items()},
+            'categories': {column: dict(value) for column, value in self.categories.items()},
+            'report': self.report(),
+            'updated_at': time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        state = cls()
+        state.records = data['records']
+        state.source = data.get('source')
+        state.moments = {column: Moments.from_dict(value) for column, value in data['moments'].items()}
+        state.distinct = {column: DistinctSketch.from_dict(value) for column, value in data['distinct'].items()}
+        state.heavy = {column: HeavyHitters.from_dict(value) for column, value in data['heavy'].items()}
+        state.categories = {column: Counter(value) for column, value in data['categories'].items()}
+        return state
+
+    def save(self, path=STATE_PATH):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path=STATE_PATH):
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != STATE_VERSION:
+            return None
+        return cls.from_dict(data)
+
+
+# ============================================================================
+# SOURCE TRACKING - append-only JSONL
+# ============================================================================
+
+def _prefix_hash(path, length):
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read(length)).hexdigest()
+
+
+def source_position(path):
+    """Where the state stands in the source: resolved path, bytes covered and a hash of the head"""
+    size = os.path.getsize(path)
+    return {'path': str(Path(path).resolve()), 'offset': size,
+            'prefix_sha1': _prefix_hash(path, min(size, PREFIX_BYTES))}
+
+
+def appended_bytes(state, path):
+    """Offset to resume from if `path` is the state's source with records appended, else None"""
+    source = state.source if state else None
+    if not source or str(path).endswith(('.gz', '.zst', '.zstd')):
+        return None
+    if source['path'] != str(Path(path).resolve()) or os.path.getsize(path) < source['offset']:
+        return None
+    if _prefix_hash(path, min(source['offset'], PREFIX_BYTES)) != source['prefix_sha1']:
+        return None
+    return source['offset']
+
+
+def iter_appended_frames(path, offset, chunk_size=50000):
+    """Typed frames of the records after byte `offset` of a JSONL file"""
+    dtypes = {column: SCHEMA[column] for column in SUMMARY_COLUMNS}
+    issues = Counter()
+    chunk = []
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            chunk.append(json.loads(line))
+            if len(chunk) >= chunk_size:
+                yield apply_schema(pd.DataFrame.from_records(chunk), dtypes, issues)
+                chunk = []
+    if chunk:
+        yield apply_schema(pd.DataFrame.from_records(chunk), dtypes, issues)
+
+
+def refresh(path=DATA_PATH, state_path=STATE_PATH, frame=None, rebuild=False):
+    """Bring the saved state up to date with `path`; returns (state, how) with how in 'fresh'/'appended'/'rebuilt'.
+
+    Appended JSONL records are folded into the saved state; otherwise the state is rebuilt,
+    from `frame` (a callable returning the decisions with SUMMARY_COLUMNS) if given, else by
+    streaming the file.
+    """
+    state = None if rebuild else SummaryState.load(state_path)
+    offset = appended_bytes(state, path)
+    if offset is not None and offset == os.path.getsize(path):
+        return state, 'fresh'
+
+    position = source_position(path) if not str(path).endswith(('.gz', '.zst', '.zstd')) else None
+    if offset is not None:
+        for chunk in iter_appended_frames(path, offset):
+            state.update_frame(chunk)
+        how = 'appended'
+    else:
+        state = SummaryState()
+        if frame is not None:
+            state.update_frame(frame())
+        else:
+            for records in iter_record_chunks(path):
+                state.update_frame(pd.DataFrame.from_records(records))
+        how = 'rebuilt'
+    state.source = position
+    state.save(state_path)
+    return state, how
+
+
+def write_report(summary, path=REPORT_PATH):
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        f.write("="*80 + "\n")
+        f.write("SUMMARY STATISTICS\n")
+        f.write("="*80 + "\n\n")
+        for key, value in summary['stats']:
+            if isinstance(value, float):
+                f.write(f"{key}: {value:.2f}\n")
+            else:
+                f.write(f"{key}: {value}\n")
+
+        f.write("\n" + "="*80 + "\n")
+        f.write("TOP 10 UNIVERSITIES BY APPLICATION COUNT\n")
+        f.write("="*80 + "\n")
+        for i, (uni, count) in enumerate(summary['top_universities'], 1):
+            f.write(f"{i}. {uni}: {count}\n")
+
+        f.write("\n" + "="*80 + "\n")
+        f.write("TOP 10 PROGRAMS BY APPLICATION COUNT\n")
+        f.write("="*80 + "\n")
+        for i, (prog, count) in enumerate(summary['top_programs'], 1):
+            f.write(f"{i}. {prog}: {count}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental, mergeable summary statistics of the decisions")
+    parser.add_argument('--state', default=STATE_PATH, help="Summary state JSON")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    update = commands.add_parser('update', help="Build the state or fold in appended records, write the report")
+    update.add_argument('data', nargs='?', default=DATA_PATH, help="Decisions JSONL")
+    update.add_argument('--report', default=REPORT_PATH, help="Text report path")
+    update.add_argument('--rebuild', action='store_true', help="Rescan the whole file")
+
+    query = commands.add_parser('query', help="Answer from the saved state without reading the data")
+    query.add_argument('columns', nargs='*', help="Columns to describe (default: the report statistics)")
+    query.add_argument('--top', type=int, default=10, help="Heavy hitters to list")
+    query.add_argument('--json', action='store_true', help="Print JSON")
+    args = parser.parse_args()
+
+    if args.command == 'update':
+        started = time.perf_counter()
+        state, how = refresh(args.data, args.state, rebuild=args.rebuild)
+        write_report(state.report(), args.report)
+        print(f"✓ Summary state {how} ({state.records} records) in {time.perf_counter() - started:.2f}s")
+        print(f"✅ Saved {args.state} and {args.report}")
+        return
+
+    state = SummaryState.load(args.state)
+    if state is None:
+        parser.error(f"No summary state at {args.state}; run 'update' first")
+    if not args.columns:
+        stats = dict(state.stats())
+        if args.json:
+            print(json.dumps(stats, indent=2))
+        else:
+            for key, value in stats.items():
+                print(f"{key}: {value:.2f}" if isinstance(value, float) else f"{key}: {value}")
+        return
+    try:
+        results = {column: state.query(column, top=args.top) for column in args.columns}
+    except KeyError as e:
+        parser.error(e.args[0])
+    if args.json:
+        print(json.dumps(results, indent=2, default=str))
+        return
+    for column, result in results.items():
+        print(f"\n{column}")
+        for key, value in result.items():
+            if key == 'top':
+                for i, (item, count) in enumerate(value, 1):
+                    print(f"  {i}. {item}: {count}")
+            else:
+                print(f"  {key}: {value:.4g}" if isinstance(value, float) else f"  {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
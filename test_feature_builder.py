@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Serving-side checks of the fitted feature builder
+Runs the demo profile (a title-cased 'Fall' applicant) through the
+recommender's feature building with classes fitted on lower-case
+decisions data
+
+Usage:
+    python -m pytest test_feature_builder.py
+    python test_feature_builder.py
+"""
+
+import pandas as pd
+
+from demo_run import create_sample_profile
+from feature_builder import FeatureBuilder
+from university_recommender import UniversityRecommender
+
+
+def fitted_recommender():
+    """Recommender with a builder fitted the way admissions_preprocessor.py fits it"""
+    recommender = UniversityRecommender()
+    recommender.feature_builder = FeatureBuilder(label_classes={
+        'student_type': ['Domestic', 'International'],
+        'has_scholarship': ['False', 'True'],
+        'application_term': ['fall', 'spring', 'summer', 'winter'],
+    })
+    return recommender
+
+
+def test_fall_profile_is_fall_term():
+    profile = create_sample_profile()
+    assert profile['application_term'] == 'Fall'
+
+    features = fitted_recommender().build_features(pd.DataFrame([profile])).iloc[0]
+    assert features['is_fall_term'] == 1
+    assert features['application_term_encoded'] == 0
+
+
+def test_spring_profile_is_encoded():
+    profile = dict(create_sample_profile(), application_term='Spring')
+
+    features = fitted_recommender().build_features(pd.DataFrame([profile])).iloc[0]
+    assert features['is_fall_term'] == 0
+    assert features['application_term_encoded'] == 1
+
+
+def test_gre_missing_matches_training_categories():
+    # Training sees the bool column as 'True'/'False' after astype(str)
+    profile = create_sample_profile()
+    features = fitted_recommender().build_features(pd.DataFrame([profile]))
+    assert features['gre_missing'].astype(str).tolist() == ['False']
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print(f"✓ {name}")
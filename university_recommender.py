@@ -17,31 +17,45 @@ import pickle
 import os
 import sys
 import json
-import random
+
+from employer_affinity import EmployerAffinity, DEFAULT_AFFINITY_PATH
+from feature_builder import FeatureBuilder, english_test_score, features_path, mark_missing_ranks
 
 
 class UniversityRecommender:
     def __init__(self, model_path='models/rf_model.pkl', data_path='admissions_processed.csv',
-                 employers_path='Handshake_Events/handshake_employers_data.json'):
+                 employers_path='Handshake_Events/handshake_employers_data.json',
+                 affinity_path=DEFAULT_AFFINITY_PATH):
         self.model_path = model_path
         self.data_path = data_path
         self.employers_path = employers_path
+        self.affinity_path = affinity_path
         self.model = None
         self.numeric_features = None
         self.categorical_features = None
+        self.feature_builder = FeatureBuilder()
         self.df = None
         self.universities = None
         self.employers_data = None
+        self.employer_affinity = None
 
     def load_or_train_model(self):
         """Load existing model or train a new one"""
+        saved_data = None
         if os.path.exists(self.model_path):
             print("Loading existing model...")
             with open(self.model_path, 'rb') as f:
                 saved_data = pickle.load(f)
-                self.model = saved_data['model']
-                self.numeric_features = saved_data['numeric_features']
-                self.categorical_features = saved_data['categorical_features']
+            if 'feature_builder' not in saved_data:
+                # Older pickles predate the fitted feature builder and would be served unfitted features
+                print(f"⚠️  {self.model_path} has no fitted feature builder - the model must be retrained")
+                saved_data = None
+
+        if saved_data is not None:
+            self.model = saved_data['model']
+            self.numeric_features = saved_data['numeric_features']
+            self.categorical_features = saved_data['categorical_features']
+            self.feature_builder = FeatureBuilder.from_dict(saved_data['feature_builder'])
             print("✓ Model loaded successfully!")
         else:
             print("Training new model (this may take a few minutes)...")
@@ -57,6 +71,9 @@ class UniversityRecommender:
                 with open(self.employers_path, 'r') as f:
                     self.employers_data = json.load(f)
                 print(f"✓ Loaded {self.employers_data['total_employers']} employers from Handshake")
+                self.employer_affinity = EmployerAffinity.load_or_build(
+                    self.employers_data['employers'], self.affinity_path
+                )
             else:
                 print("⚠️  Handshake employers data not found - skipping employer recommendations")
                 self.employers_data = None
@@ -70,12 +87,15 @@ class UniversityRecommender:
         print("Loading data...")
         self.df = pd.read_csv(self.data_path, low_memory=False)
 
+        # Feature builder fitted on the same data, persisted with the model for serving
+        if os.path.exists(features_path(self.data_path)):
+            self.feature_builder = FeatureBuilder.load(features_path(self.data_path))
+        else:
+            print(f"⚠️  {features_path(self.data_path)} not found - run admissions_preprocessor.py to fit the "
+                  "feature builder; profiles will get unfitted features")
+
         # Handle rank columns
-        rank_cols = ["cs_rank", "eng_rank", "mba_rank", "gen_rank"]
-        for col in rank_cols:
-            if col in self.df.columns:
-                self.df[col] = self.df[col].replace(9999, np.nan)
-                self.df[f"{col}_missing"] = self.df[col].isna().astype(int)
+        self.df = mark_missing_ranks(self.df)
 
         # Prepare features and target
         y = self.df["admission_result"]
@@ -151,12 +171,17 @@ class UniversityRecommender:
             pickle.dump({
                 'model': self.model,
                 'numeric_features': self.numeric_features,
-                'categorical_features': self.categorical_features
+                'categorical_features': self.categorical_features,
+                'feature_builder': self.feature_builder.to_dict()
             }, f)
         print(f"✓ Model saved to {self.model_path}")
 
+    def build_features(self, profiles):
+        """Model features of a DataFrame of raw profiles, built as in training"""
+        return mark_missing_ranks(self.feature_builder.transform(profiles))
+
     def get_user_profile(self):
-        """Collect user profile information via terminal input"""
+        """Collect raw user profile inputs via terminal input"""
         print("\n" + "="*80)
         print(" "*25 + "STUDENT PROFILE INPUT")
         print("="*80)
@@ -167,7 +192,6 @@ class UniversityRecommender:
         print("\n--- Basic Information ---")
         profile['application_year'] = int(input("Application Year (e.g., 2025): ") or 2025)
         profile['application_term'] = input("Application Term (Fall/Spring/Summer/Winter): ").strip().title() or "Fall"
-        profile['is_fall_term'] = 1 if profile['application_term'].lower() == 'fall' else 0
 
         # Academic Scores
         print("\n--- Academic Scores ---")
@@ -175,16 +199,6 @@ class UniversityRecommender:
         profile['gpa_normalized'] = float(gpa_input) if gpa_input else 7.5
         profile['gpa_missing'] = 0
 
-        # GPA Category
-        if profile['gpa_normalized'] >= 8.5:
-            profile['gpa_category'] = "Very High"
-        elif profile['gpa_normalized'] >= 7.5:
-            profile['gpa_category'] = "High"
-        elif profile['gpa_normalized'] >= 6.5:
-            profile['gpa_category'] = "Medium"
-        else:
-            profile['gpa_category'] = "Low"
-
         # English Tests
         print("\n--- English Proficiency (Enter one) ---")
         test_choice = input("Which test? (1) TOEFL (2) IELTS: ").strip()
@@ -193,23 +207,15 @@ class UniversityRecommender:
             toefl = input("TOEFL Score (out of 120, e.g., 100): ").strip()
             profile['toefl'] = float(toefl) if toefl else 100
             profile['ielts'] = 0
-            profile['english_test_normalized'] = profile['toefl'] / 120.0
+            profile['english_test_normalized'] = english_test_score('TOEFL', profile['toefl'])
         else:
             ielts = input("IELTS Score (out of 9, e.g., 7.5): ").strip()
             profile['ielts'] = float(ielts) if ielts else 7.0
             profile['toefl'] = 0
-            profile['english_test_normalized'] = profile['ielts'] / 9.0
+            profile['english_test_normalized'] = english_test_score('IELTS', profile['ielts'])
 
         profile['english_missing'] = 0
 
-        # English proficiency category
-        if profile['english_test_normalized'] >= 0.85:
-            profile['english_proficiency'] = "High"
-        elif profile['english_test_normalized'] >= 0.70:
-            profile['english_proficiency'] = "Medium"
-        else:
-            profile['english_proficiency'] = "Low"
-
         # GRE Scores
         print("\n--- GRE Scores (Optional - press Enter to skip) ---")
         has_gre = input("Do you have GRE scores? (yes/no): ").strip().lower()
@@ -223,22 +229,12 @@ class UniversityRecommender:
             profile['gre_quant'] = float(gre_quant) if gre_quant else 160
             profile['gre_awa'] = float(gre_awa) if gre_awa else 3.5
             profile['gre_total'] = profile['gre_verbal'] + profile['gre_quant']
-            profile['gre_missing'] = "False"
-
-            # GRE strength
-            if profile['gre_total'] >= 320:
-                profile['gre_strength'] = "High"
-            elif profile['gre_total'] >= 310:
-                profile['gre_strength'] = "Medium"
-            else:
-                profile['gre_strength'] = "Low"
+            profile['gre_missing'] = False
         else:
-            profile['gre_verbal'] = 0
-            profile['gre_quant'] = 0
-            profile['gre_awa'] = 0
-            profile['gre_total'] = 0
-            profile['gre_missing'] = "True"
-            profile['gre_strength'] = "Low"
+            # Missing scores are filled like in training
+            for gre_col in ['gre_verbal', 'gre_quant', 'gre_awa', 'gre_total']:
+                profile[gre_col] = np.nan
+            profile['gre_missing'] = True
 
         # Experience
         print("\n--- Professional Experience (in months) ---")
@@ -249,20 +245,9 @@ class UniversityRecommender:
         intern_exp = input("Internship Experience (months, e.g., 6): ").strip()
         profile['internship_experience'] = float(intern_exp) if intern_exp else 0
 
-        profile['total_experience'] = profile['work_experience'] + profile['internship_experience']
-
-        # Experience category
-        if profile['total_experience'] >= 36:
-            profile['experience_category'] = "High"
-        elif profile['total_experience'] >= 12:
-            profile['experience_category'] = "Medium"
-        else:
-            profile['experience_category'] = "Low"
-
         # Publications
         pubs = input("Number of Publications/Research Papers: ").strip()
         profile['publications'] = int(pubs) if pubs else 0
-        profile['has_publications'] = 1 if profile['publications'] > 0 else 0
 
         # Academic Background
         print("\n--- Academic Background ---")
@@ -315,54 +300,23 @@ class UniversityRecommender:
         profile['credential'] = f"M.S. in {profile['course_name']}"
         profile['credential_standardized'] = "Masters (Technical)"
 
-        # Calculate derived features
         profile['major_alignment'] = 1 if profile['ug_major_bucket'] == profile['categorical_course_name'] else 0
-        profile['academic_alignment_score'] = profile['major_alignment']
-        profile['composite_academic_score'] = (profile['gpa_normalized'] / 10.0 + profile['english_test_normalized']) / 2
 
         # Default values for missing features
         profile['student_type'] = 'International'
-        profile['student_type_encoded'] = 0
-        profile['has_scholarship'] = 'False'
-        profile['has_scholarship_encoded'] = 0
+        profile['has_scholarship'] = False
         profile['scholarship_amount'] = 0
-        profile['application_term_encoded'] = 0 if profile['is_fall_term'] == 1 else 1
         profile['undergrad_missing'] = 0
 
         # Rank columns (default to missing)
         for rank_col in ['cs_rank', 'eng_rank', 'mba_rank', 'gen_rank']:
             profile[rank_col] = np.nan
-            profile[f'{rank_col}_missing'] = 1
 
         # Additional categorical features with defaults
         profile['university_name_stripped'] = 'Unknown'
         profile['undergrad_canonical'] = profile['undergrad_university']
         profile['undergrad_canonical_stripped'] = profile['undergrad_university']
         profile['stripped_name'] = profile['undergrad_university'].lower().replace(' ', '')
-        profile['university_tier'] = 'Unknown'
-        profile['credential_standardized_grouped'] = 'Masters'
-        profile['categorical_course_name_grouped'] = profile['categorical_course_name']
-        profile['ug_major_bucket_grouped'] = profile['ug_major_bucket']
-
-        # Binary flags for credential types
-        for cred_type in ['Bachelors', 'Doctoral', 'Graduate Certificate', 'Masters (Professional)', 'Masters (Technical)', 'Other']:
-            profile[f'credential_standardized_{cred_type}'] = 1 if profile['credential_standardized'] == cred_type else 0
-
-        # Binary flags for course buckets
-        for course_bucket in ['Bio_Biomed_Health_LifeSci', 'Business_Management_Finance',
-                              'Chemical_Materials_Petroleum', 'Civil_Construction_Env_Arch',
-                              'Computer_Science_Software', 'Data_Science_AI_Machine_Learning',
-                              'Electrical_Electronics_ECE', 'Humanities_Social_Design_Arts',
-                              'Mechanical_Industrial_Aero', 'Other']:
-            profile[f'categorical_course_name_{course_bucket}'] = 1 if profile['categorical_course_name'] == course_bucket else 0
-
-        # Binary flags for UG major buckets
-        for ug_bucket in ['Bio_Biomed_Health_LifeSci', 'Business_Management_Finance',
-                          'Chemical_Materials_Petroleum', 'Civil_Construction_Env_Arch',
-                          'Computer_Science_Software', 'Data_Science_AI_Machine_Learning',
-                          'Electrical_Electronics_ECE', 'Humanities_Social_Design_Arts',
-                          'Mechanical_Industrial_Aero', 'Other']:
-            profile[f'ug_major_bucket_{ug_bucket}'] = 1 if profile['ug_major_bucket'] == ug_bucket else 0
 
         return profile
 
@@ -374,52 +328,49 @@ class UniversityRecommender:
         # Get unique universities
         universities = df['university_name'].value_counts().head(top_n).index.tolist()
 
-        results = []
-
         print(f"\n{'='*80}")
         print(f"Calculating admission probabilities for top {top_n} universities...")
         print(f"{'='*80}\n")
 
-        for uni in universities:
-            # Create a copy of user profile
-            profile = user_profile.copy()
-            profile['university_name'] = uni
-
-            # Get university tier if available
-            uni_data = df[df['university_name'] == uni]
-            if len(uni_data) > 0 and 'university_tier' in uni_data.columns:
-                profile['university_tier'] = uni_data['university_tier'].mode()[0] if len(uni_data['university_tier'].mode()) > 0 else 'Unknown'
-
-            # Create DataFrame with all required features
-            profile_df = pd.DataFrame([profile])
-
-            # Ensure all required features are present
-            for feat in self.numeric_features:
-                if feat not in profile_df.columns:
-                    profile_df[feat] = 0
-
-            for feat in self.categorical_features:
-                if feat not in profile_df.columns:
-                    profile_df[feat] = 'Unknown'
-
-            # Reorder columns to match training
-            all_features = self.numeric_features + self.categorical_features
-            profile_df = profile_df[all_features]
-
-            # Predict
-            try:
-                prob = self.model.predict_proba(profile_df)[0, 1]
-                results.append({
-                    'university_name': uni,
-                    'university_tier': profile['university_tier'],
-                    'admission_probability': prob
-                })
-            except Exception as e:
-                print(f"Warning: Could not predict for {uni}: {str(e)}")
-                continue
-
-        # Convert to DataFrame
-        results_df = pd.DataFrame(results)
+        # University tier as it appears in the data
+        tiers = {}
+        if 'university_tier' in df.columns:
+            tiers = (df[df['university_name'].isin(universities)]
+                     .groupby('university_name')['university_tier']
+                     .agg(lambda s: s.mode()[0] if len(s.mode()) > 0 else 'Unknown')
+                     .to_dict())
+
+        # One row per university, features built and scored in one batch
+        profiles = pd.DataFrame([user_profile] * len(universities))
+        profiles['university_name'] = universities
+        profile_df = self.build_features(profiles)
+        profile_df['university_tier'] = [tiers.get(uni, 'Unknown') for uni in universities]
+        university_tiers = profile_df['university_tier'].tolist()
+
+        # Ensure all required features are present
+        for feat in self.numeric_features:
+            if feat not in profile_df.columns:
+                profile_df[feat] = 0
+
+        for feat in self.categorical_features:
+            if feat not in profile_df.columns:
+                profile_df[feat] = 'Unknown'
+
+        # Reorder columns to match training
+        all_features = self.numeric_features + self.categorical_features
+        profile_df = profile_df[all_features]
+        profile_df[self.categorical_features] = profile_df[self.categorical_features].astype(str)
+
+        # Predict
+        results_df = pd.DataFrame({
+            'university_name': universities,
+            'university_tier': university_tiers,
+        })
+        try:
+            results_df['admission_probability'] = self.model.predict_proba(profile_df)[:, 1]
+        except Exception as e:
+            print(f"Warning: Could not predict admission probabilities: {str(e)}")
+            results_df = results_df.iloc[0:0].assign(admission_probability=[])
 
         # Sort by probability
         results_df = results_df.sort_values('admission_probability', ascending=False)
@@ -479,36 +430,13 @@ class UniversityRecommender:
 
         return results_df
 
-    def _display_employers_for_university(self, university_name):
-        """Display 3-4 random top employers recruiting from this university"""
-        if not self.employers_data or 'employers' not in self.employers_data:
+    def _display_employers_for_university(self, university_name, program_bucket=None):
+        """Display the top recruiters for the target program next to a university"""
+        if self.employer_affinity is None:
             return
 
-        # Get top employers by followers (more prominent companies)
-        employers_list = self.employers_data['employers']
-
-        # Parse follower count helper
-        def parse_followers(follower_str):
-            try:
-                num_str = follower_str.split()[0].replace(',', '')
-                if 'M' in num_str:
-                    return int(float(num_str.replace('M', '')) * 1000000)
-                elif 'K' in num_str:
-                    return int(float(num_str.replace('K', '')) * 1000)
-                else:
-                    return int(num_str)
-            except:
-                return 0
-
-        # Sort by followers and get top employers
-        sorted_employers = sorted(employers_list,
-                                  key=lambda x: parse_followers(x['followers']),
-                                  reverse=True)
-
-        # Select 3-4 random employers from top 100 (mix of very top and good companies)
-        top_100 = sorted_employers[:100]
-        num_to_show = random.randint(3, 4)
-        selected = random.sample(top_100, min(num_to_show, len(top_100)))
+        # Top-k lookup in the precomputed program-to-employer affinity matrix
+        selected = self.employer_affinity.top_k(program_bucket or 'Other', k=4, key=university_name)
 
         print(f"      💼 Top Recruiters ({len(selected)} companies):")
         for emp in selected:
@@ -517,7 +445,7 @@ class UniversityRecommender:
             print(f"         • {emp['name']} ({emp['industry']}, {location})")
         print()  # Empty line for spacing
 
-    def display_recommendations(self, results_df):
+    def display_recommendations(self, results_df, program_bucket=None):
         """Display university recommendations in buckets"""
         print("\n" + "="*80)
         print(" "*20 + "UNIVERSITY RECOMMENDATIONS")
@@ -561,9 +489,9 @@ class UniversityRecommender:
 
                 print(f"{idx:<6}{uni_name:<50}{tier:<15}{prob:<15}")
 
-                # Show 3-4 random employers for this university
+                # Show the top recruiters for the target program
                 if self.employers_data:
-                    self._display_employers_for_university(row['university_name'])
+                    self._display_employers_for_university(row['university_name'], program_bucket)
 
         # Application strategy
         print(f"\n{'='*80}")
@@ -603,17 +531,18 @@ class UniversityRecommender:
 
         # Get user profile
         user_profile = self.get_user_profile()
+        features = self.build_features(pd.DataFrame([user_profile])).iloc[0]
 
         print("\n" + "="*80)
         print("📊 YOUR PROFILE SUMMARY")
         print("="*80)
-        print(f"GPA: {user_profile['gpa_normalized']:.2f}/10 ({user_profile['gpa_category']})")
-        print(f"English: TOEFL {user_profile['toefl']:.0f} / IELTS {user_profile['ielts']:.1f} ({user_profile['english_proficiency']})")
-        if user_profile['gre_missing'] == "False":
-            print(f"GRE: V{user_profile['gre_verbal']:.0f} + Q{user_profile['gre_quant']:.0f} + AWA{user_profile['gre_awa']:.1f} = {user_profile['gre_total']:.0f} ({user_profile['gre_strength']})")
+        print(f"GPA: {user_profile['gpa_normalized']:.2f}/10 ({features['gpa_category']})")
+        print(f"English: TOEFL {user_profile['toefl']:.0f} / IELTS {user_profile['ielts']:.1f} ({features['english_proficiency']})")
+        if not user_profile['gre_missing']:
+            print(f"GRE: V{user_profile['gre_verbal']:.0f} + Q{user_profile['gre_quant']:.0f} + AWA{user_profile['gre_awa']:.1f} = {user_profile['gre_total']:.0f} ({features['gre_strength']})")
         else:
             print("GRE: Not provided")
-        print(f"Experience: {user_profile['total_experience']:.0f} months ({user_profile['experience_category']})")
+        print(f"Experience: {user_profile['work_experience'] + user_profile['internship_experience']:.0f} months ({features['experience_category']})")
         print(f"Publications: {user_profile['publications']}")
         print(f"UG Major: {user_profile['undergrad_major']}")
         print(f"Target: {user_profile['course_name']} ({user_profile['target_degree']})")
@@ -627,7 +556,7 @@ class UniversityRecommender:
         results_df = self.categorize_into_buckets(results_df)
 
         # Display recommendations
-        self.display_recommendations(results_df)
+        self.display_recommendations(results_df, user_profile['categorical_course_name'])
 
         # Ask if user wants to save results
         save = input("\nWould you like to save these results to a CSV file? (yes/no): ").strip().lower()